@@ -0,0 +1,62 @@
+"""
+Benchmark: API escalar vs. API vectorizada de game/geometry.py.
+
+Mide el tiempo de responder "qué proyectiles tocan qué paredes" para
+lotes de tamaño creciente y muestra el punto de cruce a partir del
+cual la versión NumPy es más rápida que el bucle en Python.
+
+Uso:
+    python benchmarks/bench_geometry.py [--walls 200] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.geometry import rects_intersect, rects_intersect_batch  # noqa: E402
+
+
+def random_rects(n, size=(38, 38), area=(540, 960)):
+    return [(random.uniform(0, area[0]), random.uniform(0, area[1]), size[0], size[1])
+            for _ in range(n)]
+
+
+def scalar_hits(projs, walls):
+    return [[rects_intersect(p, w) for w in walls] for p in projs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--walls", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    walls = random_rects(args.walls, size=(40, 30))
+
+    print(f"Paredes: {args.walls}")
+    print(f"{'proyectiles':>12} {'escalar (ms)':>14} {'numpy (ms)':>12} {'ganador':>9}")
+    crossover = None
+    for n in (1, 2, 5, 10, 20, 50, 100, 200, 500):
+        projs = random_rects(n)
+        t_scalar = min(timeit.repeat(lambda: scalar_hits(projs, walls),
+                                     number=1, repeat=args.repeat)) * 1000
+        t_batch = min(timeit.repeat(lambda: rects_intersect_batch(projs, walls),
+                                    number=1, repeat=args.repeat)) * 1000
+        winner = "numpy" if t_batch < t_scalar else "escalar"
+        if crossover is None and t_batch < t_scalar:
+            crossover = n
+        print(f"{n:>12} {t_scalar:>14.3f} {t_batch:>12.3f} {winner:>9}")
+
+    if crossover is None:
+        print("\nLa versión escalar ganó en todos los tamaños.")
+    else:
+        print(f"\nCruce: NumPy gana desde ~{crossover} proyectiles x {args.walls} paredes.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Benchmark de arranque: tiempo hasta el primer frame y costo de cada pantalla.
+
+Lanza MyGameApp N veces, cada una en un proceso nuevo (arranque en frío)
+y con la ventana oculta, y mide:
+  - import_main:    importar main.py (Kivy, ventana y menú)
+  - build:          lo que tarda MyGameApp.build()
+  - first_frame:    desde el inicio del proceso hasta el primer frame
+                    dibujado del MainMenu
+  - <pantalla>.construct / .first_frame para GameScreen,
+    TrajectoryGameScreen(difficulty=...), LevelScreen e InstructionsScreen
+    (construirla y su primer frame tras mostrarla), y .import para los
+    niveles que se cargan bajo demanda (0 si ya se precargaron)
+Muestra min/p50/p90/p99/max en ms y guarda todo en JSON para comparar
+entre versiones. El Nivel 3 (cámara) no se mide.
+
+Uso:
+    python benchmarks/bench_startup.py [--runs 10] [--output startup.json]
+                                       [--difficulty easy normal hard]
+En un servidor sin pantalla: xvfb-run python benchmarks/bench_startup.py
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULT_PREFIX = "BENCH_STARTUP "
+
+
+# -----------------------------------------------------
+# Proceso hijo: una corrida
+# -----------------------------------------------------
+def run_once(difficulties):
+    t_start = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+
+    from kivy.config import Config
+    Config.set('graphics', 'window_state', 'hidden')
+
+    import main as game_main
+    from kivy.clock import Clock
+    from kivy.core.window import Window
+    from game.screens import screen_class
+    from game.menu import LevelScreen, InstructionsScreen
+
+    timings = {"import_main": time.perf_counter() - t_start}
+
+    def next_frame(callback):
+        """Llama 'callback(t)' tras el próximo frame dibujado (on_flip)."""
+        def on_flip(*args):
+            Window.funbind('on_flip', on_flip)
+            callback(time.perf_counter())
+        Window.fbind('on_flip', on_flip)
+
+    class BenchApp(game_main.MyGameApp):
+        def build(self):
+            t0 = time.perf_counter()
+            root = super().build()
+            timings["build"] = time.perf_counter() - t0
+            next_frame(self._first_frame)
+            return root
+
+        def _first_frame(self, now):
+            timings["first_frame"] = now - t_start
+            self._steps = [("GameScreen", "level1", {})]
+            self._steps += [(f"TrajectoryGameScreen[{d}]", "level2", {"difficulty": d})
+                            for d in difficulties]
+            self._steps += [("LevelScreen", LevelScreen, {"app_instance": self}),
+                            ("InstructionsScreen", InstructionsScreen, {"app_instance": self})]
+            Clock.schedule_once(self._next_screen, 0)
+
+        def _next_screen(self, *args):
+            if not self._steps:
+                print(RESULT_PREFIX + json.dumps(timings), flush=True)
+                self.stop()
+                return
+            label, target, kwargs = self._steps.pop(0)
+            t0 = time.perf_counter()
+            cls = screen_class(target) if isinstance(target, str) else target
+            t1 = time.perf_counter()
+            screen = cls(**kwargs)
+            t2 = time.perf_counter()
+            if isinstance(target, str):
+                timings[f"{label}.import"] = t1 - t0
+            timings[f"{label}.construct"] = t2 - t1
+            self._set_screen(screen)
+
+            def shown(now):
+                timings[f"{label}.first_frame"] = now - t2
+                # Detener el bucle del nivel antes de pasar a la siguiente
+                if hasattr(screen, "dispatcher"):
+                    screen.dispatcher.stop()
+                Clock.schedule_once(self._next_screen, 0)
+            next_frame(shown)
+
+    BenchApp().run()
+
+
+# -----------------------------------------------------
+# Proceso padre: N corridas y estadísticas
+# -----------------------------------------------------
+def percentile(values, p):
+    """Percentil con interpolación lineal (p en 0..100)."""
+    values = sorted(values)
+    k = (len(values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--difficulty", nargs="+", default=["easy", "normal", "hard"])
+    parser.add_argument("--output", default="startup.json")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_once(args.difficulty)
+        return 0
+
+    env = dict(os.environ, KIVY_NO_ARGS="1", KIVY_NO_CONSOLELOG="1")
+    command = [sys.executable, os.path.abspath(__file__), "--child",
+               "--difficulty", *args.difficulty]
+    samples = {}
+    failed = 0
+    for i in range(args.runs):
+        try:
+            proc = subprocess.run(command, env=env, capture_output=True, text=True,
+                                  timeout=args.timeout)
+            output = proc.stdout
+        except subprocess.TimeoutExpired:
+            output = ""
+        lines = [l for l in output.splitlines() if l.startswith(RESULT_PREFIX)]
+        if not lines:
+            failed += 1
+            print(f"⚠️  Corrida {i + 1} sin resultado")
+            continue
+        for key, value in json.loads(lines[-1][len(RESULT_PREFIX):]).items():
+            samples.setdefault(key, []).append(value * 1000)
+        print(f"✅ Corrida {i + 1}/{args.runs}")
+
+    if not samples:
+        print("Ninguna corrida terminó (¿hay pantalla? probar con xvfb-run).")
+        return 1
+
+    stats = {}
+    print(f"\n{'métrica (ms)':<40} {'min':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    for key, values in samples.items():
+        stats[key] = {
+            "n": len(values),
+            "min": min(values),
+            "p50": percentile(values, 50),
+            "p90": percentile(values, 90),
+            "p99": percentile(values, 99),
+            "max": max(values),
+            "samples": values,
+        }
+        s = stats[key]
+        print(f"{key:<40} {s['min']:>8.1f} {s['p50']:>8.1f} {s['p90']:>8.1f} "
+              f"{s['p99']:>8.1f} {s['max']:>8.1f}")
+
+    report = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "failed": failed,
+        "unit": "ms",
+        "metrics": stats,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nGuardado en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
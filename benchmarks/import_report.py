@@ -0,0 +1,78 @@
+"""
+Reporte de tiempos de importación (costo acumulado por módulo).
+
+Importa el módulo indicado en un intérprete nuevo con `python -X importtime`
+y muestra los módulos que más tardan, contando todo lo que arrastran
+(columna "acumulado"). Sirve para ver qué pesa antes del primer frame
+del menú, p. ej. si cv2/numpy se colaron en el arranque.
+
+Uso:
+    python benchmarks/import_report.py [--module main] [--top 25]
+                                       [--filter game] [--json salida.json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module):
+    """[(módulo, propio_us, acumulado_us, profundidad)] en orden de importación."""
+    env = dict(os.environ, KIVY_NO_ARGS="1", KIVY_NO_CONSOLELOG="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(own), int(cumulative), depth))
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["(sin salida)"]
+        print(f"⚠️  'import {module}' falló: {tail[0]}", file=sys.stderr)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--filter", default="",
+                        help="solo módulos que empiezan así (p. ej. 'game')")
+    parser.add_argument("--json", help="guardar todas las filas en este archivo")
+    args = parser.parse_args()
+
+    rows = measure(args.module)
+    if not rows:
+        print("Sin datos de importación.")
+        return 1
+
+    total = sum(own for _, own, _, _ in rows)
+    shown = [r for r in rows if r[0].startswith(args.filter)]
+    shown.sort(key=lambda r: r[2], reverse=True)
+
+    print(f"import {args.module}: {total / 1000:.1f} ms en {len(rows)} módulos")
+    print(f"{'acumulado (ms)':>15} {'propio (ms)':>12} {'%':>6}  módulo")
+    for name, own, cumulative, depth in shown[:args.top]:
+        print(f"{cumulative / 1000:>15.1f} {own / 1000:>12.2f} "
+              f"{100 * cumulative / total:>6.1f}  {name}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "module": args.module,
+                "total_us": total,
+                "modules": [{"name": n, "self_us": o, "cumulative_us": c, "depth": d}
+                            for n, o, c, d in rows],
+            }, f, indent=2)
+        print(f"\nGuardado en {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
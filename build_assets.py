@@ -0,0 +1,322 @@
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+
+# ==========================================
+# CONFIGURACIÓN
+# ==========================================
+
+# El directorio raíz es donde está este mismo archivo
+DIRECTORIO_RAIZ = os.path.dirname(os.path.abspath(__file__))
+DIRECTORIO_IMAGENES = os.path.join(DIRECTORIO_RAIZ, 'images')
+DIRECTORIO_VARIANTES = os.path.join(DIRECTORIO_IMAGENES, 'variants')
+DIRECTORIO_ATLAS = os.path.join(DIRECTORIO_IMAGENES, 'atlas')
+RUTA_MANIFIESTO = os.path.join(DIRECTORIO_IMAGENES, 'manifest.json')
+RUTA_PAQUETE = os.path.join(DIRECTORIO_IMAGENES, 'assets.pack')
+
+# Archivos que no son imágenes pero también van al paquete (si existen)
+EXTRAS_PAQUETE = ['images/musica.mp3']
+
+# Cabecera del paquete: debe coincidir con PACK_MAGIC en game/assets.py
+MAGIA_PAQUETE = b'DSJPACK\x01'
+ALINEACION_PAQUETE = 16
+
+# Pantalla de referencia (1x) y escalas generadas
+PANTALLA_BASE = (540, 960)
+ESCALAS = {'1x': 1.0, '2x': 2.0}
+
+# Tamaño en pantalla (a 1x) de cada grupo de imágenes y atlas al que van.
+# (ancho, alto) es la caja máxima; None = se ajusta solo por la otra medida.
+# El orden importa: gana el primer patrón que coincide.
+REGLAS = [
+    # patrón,          caja a 1x,    atlas
+    ('fondo*.png',     (None, 960),  None),
+    ('ave[0-9]*.png',  (160, 160),   'ave'),
+    ('enemigo[0-9]*.png', (120, 120), 'enemigo'),
+    ('vicu[0-9]*.png', (160, 160),   'vicu'),
+    ('huevo.png',      (40, 40),     'proyectil'),
+    ('*.png',          (None, None), None),  # resto: sin reescalar
+]
+
+# Tamaño máximo de página de atlas (2048 es seguro en GPUs móviles). Cada
+# familia usa la menor potencia de 2 en la que entran todos sus frames
+TAMANO_PAGINA = 2048
+# Separación entre frames dentro del atlas (la de kivy.atlas por defecto)
+MARGEN_ATLAS = 2
+
+# Cambiar si cambia el formato de salida: invalida todo el manifiesto
+VERSION_PIPELINE = 3
+
+
+def relativa(ruta):
+    return os.path.relpath(ruta, DIRECTORIO_RAIZ).replace(os.sep, '/')
+
+
+def hash_archivo(ruta):
+    h = hashlib.sha1()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 16), b''):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def regla_para(nombre):
+    for patron, caja, atlas in REGLAS:
+        if fnmatch.fnmatch(nombre, patron):
+            return caja, atlas
+    return (None, None), None
+
+
+def tamano_destino(tamano, caja, escala):
+    """Tamaño que cabe en 'caja * escala' manteniendo proporción (sin agrandar)."""
+    w, h = tamano
+    cw, ch = caja
+    factores = []
+    if cw:
+        factores.append(cw * escala / w)
+    if ch:
+        factores.append(ch * escala / h)
+    factor = min(factores + [1.0])
+    return max(1, round(w * factor)), max(1, round(h * factor))
+
+
+def cargar_manifiesto():
+    try:
+        with open(RUTA_MANIFIESTO, 'r', encoding='utf-8') as f:
+            datos = json.load(f)
+        if datos.get('pipeline') == VERSION_PIPELINE:
+            return datos
+    except (OSError, ValueError):
+        pass
+    return {'assets': {}, 'atlases': {}}
+
+
+def existen(rutas):
+    return all(os.path.exists(os.path.join(DIRECTORIO_RAIZ, r)) for r in rutas)
+
+
+def generar_variantes(nombre, ruta, anterior):
+    """Variantes 1x/2x de una imagen. Reutiliza las del manifiesto si no cambió."""
+    from PIL import Image  # Pillow solo hace falta para construir
+
+    caja, atlas = regla_para(os.path.basename(ruta))
+    firma = hash_archivo(ruta)
+    if (anterior and anterior.get('hash') == firma and anterior.get('box') == list(caja)
+            and existen(v['path'] for v in anterior['variants'].values())):
+        return anterior, False
+
+    with Image.open(ruta) as img:
+        img.load()
+        tamano = img.size
+        variantes = {}
+        for tier, escala in ESCALAS.items():
+            destino = tamano_destino(tamano, caja, escala)
+            if destino == tamano and variantes and not atlas:
+                # Un tier mayor que sería el original tal cual no se emite: con
+                # ese tier el juego usa la variante más grande (ver
+                # AssetManifest.file). Los frames de atlas sí la necesitan
+                # para armar la página 2x (y sus variantes no van al paquete)
+                continue
+            salida = os.path.join(DIRECTORIO_VARIANTES, f"{nombre}@{destino[0]}x{destino[1]}.png")
+            if destino == tamano:
+                # Sin reducción: copia del original. Ninguna variante apunta a
+                # images/*.png, así que los originales no van al APK
+                shutil.copyfile(ruta, salida)
+            else:
+                img.resize(destino, Image.LANCZOS).save(salida, optimize=True)
+            variantes[tier] = {'path': relativa(salida), 'size': list(destino)}
+
+    entrada = {
+        'source': relativa(ruta),
+        'hash': firma,
+        'size': list(tamano),
+        'box': list(caja),
+        'variants': variantes,
+    }
+    if atlas:
+        entrada['atlas'] = atlas
+    return entrada, True
+
+
+def generar_atlas(familia, miembros, assets, anterior):
+    """Un atlas por familia y escala, empaquetado a partir de las variantes."""
+    contenido = ''.join(assets[n]['hash'] + str(assets[n]['box']) for n in miembros)
+    firma = hashlib.sha1(contenido.encode()).hexdigest()
+    if (anterior and anterior.get('hash') == firma
+            and existen(p for p in anterior['pages'].values())):
+        return anterior, False
+
+    paginas = {}
+    for tier in ESCALAS:
+        # Copias con el nombre lógico: el id dentro del atlas es ese nombre
+        with tempfile.TemporaryDirectory() as tmp:
+            archivos = []
+            for nombre in miembros:
+                origen = os.path.join(DIRECTORIO_RAIZ, assets[nombre]['variants'][tier]['path'])
+                copia = os.path.join(tmp, nombre + '.png')
+                shutil.copyfile(origen, copia)
+                archivos.append(copia)
+            salida = os.path.join(DIRECTORIO_ATLAS, f"{familia}@{tier}")
+            crear_atlas(salida, archivos)
+        paginas[tier] = relativa(salida + '.atlas')
+    return {'hash': firma, 'members': miembros, 'pages': paginas}, True
+
+
+def lado_inicial(archivos):
+    """Menor potencia de 2 que puede contener los frames (por lado y por área)."""
+    from PIL import Image
+
+    lado_max = 0
+    area = 0
+    for archivo in archivos:
+        with Image.open(archivo) as img:
+            w, h = img.size
+        w, h = w + 2 * MARGEN_ATLAS, h + 2 * MARGEN_ATLAS
+        lado_max = max(lado_max, w, h)
+        area += w * h
+    lado = 1
+    while lado < lado_max or lado * lado < area:
+        lado *= 2
+    return lado
+
+
+def crear_atlas(salida, archivos):
+    """
+    Empaqueta 'archivos' en una sola página cuadrada lo más chica posible:
+    se prueba desde lado_inicial() y se duplica si los frames no entran.
+    Una página RGBA de 2048² son 16 MiB de GPU; el atlas del huevo entra
+    en 64². Solo si no caben en TAMANO_PAGINA se aceptan varias páginas.
+    """
+    from kivy.atlas import Atlas
+
+    lado = min(lado_inicial(archivos), TAMANO_PAGINA)
+    while True:
+        for viejo in glob.glob(glob.escape(salida) + '-*.png'):
+            os.remove(viejo)
+        resultado = Atlas.create(salida, archivos, lado, padding=MARGEN_ATLAS)
+        if resultado and len(resultado[1]) == 1:
+            return lado
+        if lado >= TAMANO_PAGINA:
+            if not resultado:
+                raise RuntimeError(f"{os.path.basename(salida)} no cabe en {TAMANO_PAGINA}px")
+            return lado
+        lado *= 2
+
+
+def archivos_atlas(ruta_atlas):
+    """El .atlas y sus páginas PNG (rutas relativas a la raíz)."""
+    with open(os.path.join(DIRECTORIO_RAIZ, ruta_atlas), 'r', encoding='utf-8') as f:
+        paginas = json.load(f)
+    carpeta = os.path.dirname(ruta_atlas)
+    return [ruta_atlas] + [f"{carpeta}/{pagina}" for pagina in sorted(paginas)]
+
+
+def generar_paquete(manifiesto):
+    """
+    Un solo archivo con todo lo que carga el juego (manifiesto, variantes,
+    atlas y audio). Las variantes sueltas de los frames que están en un
+    atlas no van: el juego los lee siempre del atlas. Formato:
+        MAGIA_PAQUETE | largo del índice (uint32 LE) | índice JSON | datos
+    El índice es {ruta: [offset, tamaño]} con offsets absolutos; el juego
+    lo mapea en memoria (mmap) y lee cada asset como un slice.
+    """
+    rutas = {relativa(RUTA_MANIFIESTO)}
+    for entrada in manifiesto['assets'].values():
+        if 'atlas' in entrada:
+            continue
+        # Los originales solo si no hay variantes (AssetManifest.file no los pide)
+        if not entrada['variants']:
+            rutas.add(entrada['source'])
+        rutas.update(v['path'] for v in entrada['variants'].values())
+    for atlas in manifiesto['atlases'].values():
+        for pagina in atlas['pages'].values():
+            rutas.update(archivos_atlas(pagina))
+    rutas.update(r for r in EXTRAS_PAQUETE if existen([r]))
+    rutas = sorted(rutas)
+
+    tamanos = [os.path.getsize(os.path.join(DIRECTORIO_RAIZ, r)) for r in rutas]
+
+    def alinear(n):
+        return -n % ALINEACION_PAQUETE
+
+    # El tamaño del índice depende de los offsets y viceversa: se itera
+    # hasta que el índice cabe en el espacio reservado (se rellena con espacios)
+    largo_indice = 0
+    while True:
+        offset = len(MAGIA_PAQUETE) + 4 + largo_indice
+        offset += alinear(offset)
+        indice = {}
+        for ruta, tamano in zip(rutas, tamanos):
+            indice[ruta] = [offset, tamano]
+            offset += tamano + alinear(tamano)
+        datos_indice = json.dumps(indice, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        if len(datos_indice) <= largo_indice:
+            datos_indice = datos_indice.ljust(largo_indice)
+            break
+        largo_indice = len(datos_indice)
+
+    temporal = RUTA_PAQUETE + '.tmp'
+    with open(temporal, 'wb') as f:
+        f.write(MAGIA_PAQUETE + struct.pack('<I', largo_indice) + datos_indice)
+        for ruta in rutas:
+            f.write(b'\0' * (indice[ruta][0] - f.tell()))
+            with open(os.path.join(DIRECTORIO_RAIZ, ruta), 'rb') as origen:
+                shutil.copyfileobj(origen, f)
+    os.replace(temporal, RUTA_PAQUETE)
+    return len(rutas), offset
+
+
+def construir():
+    print(f"--- Procesando imágenes de: {DIRECTORIO_IMAGENES} ---")
+    os.makedirs(DIRECTORIO_VARIANTES, exist_ok=True)
+    os.makedirs(DIRECTORIO_ATLAS, exist_ok=True)
+
+    anterior = cargar_manifiesto()
+    assets = {}
+    rehechos = 0
+    for archivo in sorted(os.listdir(DIRECTORIO_IMAGENES)):
+        if not archivo.endswith('.png'):
+            continue
+        nombre = os.path.splitext(archivo)[0]
+        ruta = os.path.join(DIRECTORIO_IMAGENES, archivo)
+        entrada, cambio = generar_variantes(nombre, ruta, anterior['assets'].get(nombre))
+        assets[nombre] = entrada
+        rehechos += cambio
+        print(f"{'✅' if cambio else '⏭️ '} {archivo}")
+
+    familias = {}
+    for nombre, entrada in assets.items():
+        if 'atlas' in entrada:
+            familias.setdefault(entrada['atlas'], []).append(nombre)
+
+    atlases = {}
+    for familia, miembros in sorted(familias.items()):
+        atlases[familia], cambio = generar_atlas(
+            familia, sorted(miembros), assets, anterior['atlases'].get(familia))
+        rehechos += cambio
+        print(f"{'✅' if cambio else '⏭️ '} atlas {familia} ({len(miembros)} frames)")
+
+    manifiesto = {
+        'pipeline': VERSION_PIPELINE,
+        'base': list(PANTALLA_BASE),
+        'tiers': ESCALAS,
+        'assets': assets,
+        'atlases': atlases,
+    }
+    with open(RUTA_MANIFIESTO, 'w', encoding='utf-8') as f:
+        json.dump(manifiesto, f, indent=2, sort_keys=True)
+    print(f"\n✔ {rehechos} assets regenerados; manifiesto en {relativa(RUTA_MANIFIESTO)}")
+
+    cantidad, tamano = generar_paquete(manifiesto)
+    print(f"✔ Paquete {relativa(RUTA_PAQUETE)}: {cantidad} archivos, {tamano / 1024:.0f} KB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(construir())
@@ -14,7 +14,7 @@ source.dir = .
 
 # (list) Source files to include (let empty to include all the files)
 # IMPORTANTE: Se agregó 'mp3' para que reconozca tu música
-source.include_exts = py,png,jpg,kv,atlas,mp3
+source.include_exts = py,png,jpg,kv,atlas,mp3,json,pack
 
 # (list) List of inclusions using pattern matching
 #source.include_patterns = assets/*,images/*.png
@@ -27,7 +27,14 @@ source.include_exts = py,png,jpg,kv,atlas,mp3
 
 # (list) List of exclusions using pattern matching
 # Do not prefix with './'
-#source.exclude_patterns = license,images/*/*.jpg
+# Todo lo que el juego carga de images/ va dentro de images/assets.pack
+# (correr python build_assets.py antes de empaquetar): variantes, atlas,
+# manifiesto y música. Los archivos sueltos (y los originales a tamaño
+# completo) quedan en el repo solo como fuente del pipeline y para
+# desarrollo en escritorio sin paquete. En fnmatch '*' también cruza '/',
+# así que images/*.png cubre images/variants y images/atlas.
+# p4a_hook.py corta el build si falta el paquete (si no, el APK no tendría imágenes)
+source.exclude_patterns = images/*.png,images/*.atlas,images/*.json,images/*.mp3,p4a_hook.py
 
 # (str) Application versioning (method 1)
 version = 1.0
@@ -69,6 +76,9 @@ android.permissions = WAKE_LOCK, CAMERA
 # (int) Target Android API, should be as high as possible.
 android.api = 34
 
+# (str) python-for-android hook: verifica que exista images/assets.pack
+p4a.hook = p4a_hook.py
+
 # (int) Minimum API your APK / AAB will support.
 android.minapi = 21
 
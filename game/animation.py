@@ -0,0 +1,105 @@
+# game/animation.py
+from typing import Dict, List, Sequence
+
+from game.assets import assets, manifest
+from game.frame import FrameDispatcher, PHASE_ANIMATION
+
+# Texturas ya resueltas (nombre del frame -> textura)
+_textures: Dict[str, object] = {}
+
+
+def frame_texture(name: str):
+    """
+    Textura de un frame de animación ('enemigo1' o 'images/enemigo1.png').
+    Usa la región del atlas de su familia si build_assets.py lo generó;
+    si no, la imagen suelta vía el gestor de assets. Se resuelve una vez.
+    """
+    texture = _textures.get(name)
+    if texture is None:
+        ref = manifest.atlas(name)
+        if ref is not None:
+            page, key = ref
+            texture = assets.atlas(page)[key]
+        else:
+            texture = assets.texture(name)
+        _textures[name] = texture
+    return texture
+
+
+def frame_textures(names: Sequence[str]) -> List[object]:
+    return [frame_texture(n) for n in names]
+
+
+class _Track:
+    __slots__ = ("sprite", "frames", "interval", "offset", "index")
+
+    def __init__(self, sprite, frames, interval: float, offset: float):
+        self.sprite = sprite
+        self.frames = frames
+        self.interval = interval
+        self.offset = offset
+        self.index = -1
+
+
+class SpriteAnimator:
+    """
+    Animación de sprites con un reloj compartido: en cada tick se calcula
+    el frame de cada sprite a partir del tiempo global y solo se cambia
+    su textura (región ya resuelta) cuando el frame cambia. Cientos de
+    sprites cuestan un solo recorrido, sin un evento de Clock por sprite
+    ni búsquedas por ruta en la caché de imágenes.
+    """
+
+    def __init__(self):
+        self.time = 0.0
+        self._tracks: Dict[int, _Track] = {}
+        self._next_handle = 0
+
+    def add(self, sprite, names: Sequence[str], interval: float,
+            phase_offset: float = 0.0) -> int:
+        """
+        Anima 'sprite' con los frames 'names' (uno cada 'interval' s).
+        Empieza en el primer frame (desfasado 'phase_offset' s).
+        Devuelve un handle para remove().
+        """
+        track = _Track(sprite, frame_textures(names), interval,
+                       phase_offset - self.time)
+        handle = self._next_handle
+        self._next_handle += 1
+        self._tracks[handle] = track
+        self._advance(track)
+        return handle
+
+    def remove(self, handle: int) -> bool:
+        return self._tracks.pop(handle, None) is not None
+
+    def clear(self):
+        self._tracks.clear()
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def _advance(self, track: _Track):
+        i = int((self.time + track.offset) / track.interval) % len(track.frames)
+        if i != track.index:
+            track.index = i
+            track.sprite.texture = track.frames[i]
+
+    def tick(self, dt: float):
+        self.time += dt
+        advance = self._advance
+        for track in self._tracks.values():
+            advance(track)
+
+
+def shared_animator(dispatcher: FrameDispatcher) -> SpriteAnimator:
+    """
+    Un animador por bucle de juego (se registra en su fase de animación).
+    Vive en el propio dispatcher: un registro global mantendría vivas las
+    pantallas a través de los sprites animados.
+    """
+    animator = dispatcher.animator
+    if animator is None:
+        animator = dispatcher.animator = SpriteAnimator()
+        dispatcher.add(PHASE_ANIMATION, animator.tick)
+    return animator
@@ -0,0 +1,418 @@
+# game/assets.py
+import io
+import json
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from kivy.atlas import Atlas
+from kivy.cache import Cache
+from kivy.clock import mainthread
+from kivy.core.image import ImageLoader
+from kivy.graphics.texture import Texture
+
+from game.log import get_logger
+
+log = get_logger("assets")
+
+Size = Tuple[float, float]
+
+# Manifiesto generado por build_assets.py (variantes, atlas y hashes)
+MANIFEST_PATH = os.path.join("images", "manifest.json")
+
+# Paquete único generado por build_assets.py (ver AssetPack)
+PACK_PATH = os.path.join("images", "assets.pack")
+PACK_MAGIC = b"DSJPACK\x01"
+
+_placeholder: Optional[Texture] = None
+
+
+def placeholder_texture() -> Texture:
+    """Textura transparente de 1x1 mientras llega la real (no dibuja nada)."""
+    global _placeholder
+    if _placeholder is None:
+        _placeholder = Texture.create(size=(1, 1), colorfmt="rgba")
+        _placeholder.blit_buffer(b"\x00\x00\x00\x00", colorfmt="rgba", bufferfmt="ubyte")
+    return _placeholder
+
+
+def logical_name(name: str) -> str:
+    """'images/enemigo1.png' -> 'enemigo1' (los nombres lógicos pasan igual)."""
+    return os.path.splitext(os.path.basename(name))[0]
+
+
+def _pack_key(path: str) -> str:
+    """Rutas del índice: relativas a la raíz del juego y con '/'."""
+    path = path.replace(os.sep, "/")
+    return path[2:] if path.startswith("./") else path
+
+
+class AssetPack:
+    """
+    Todos los assets en un solo archivo (images/assets.pack):
+        PACK_MAGIC | largo del índice (uint32 LE) | índice JSON | datos
+    El índice es {ruta: [offset, tamaño]}. El archivo se mapea en memoria
+    una vez (un solo open + mmap) y cada asset es un memoryview del mapa,
+    sin copias ni lecturas de disco propias. Sin paquete (desarrollo),
+    view() devuelve None y se usan los archivos sueltos.
+    """
+
+    def __init__(self, path: str = PACK_PATH):
+        self.path = path
+        self._mmap: Optional[mmap.mmap] = None
+        self._index: Optional[Dict[str, Tuple[int, int]]] = None
+
+    def open(self) -> bool:
+        """Mapea el paquete (solo la primera vez). False si no hay paquete."""
+        if self._index is not None:
+            return self._mmap is not None
+        self._index = {}
+        try:
+            with open(self.path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        header = len(PACK_MAGIC) + 4
+        if mapped[:len(PACK_MAGIC)] != PACK_MAGIC:
+            log.warning("⚠️  Paquete de assets inválido: %s", self.path)
+            mapped.close()
+            return False
+        (size,) = struct.unpack_from("<I", mapped, len(PACK_MAGIC))
+        index = json.loads(mapped[header:header + size])
+        self._index = {path: (offset, length) for path, (offset, length) in index.items()}
+        self._mmap = mapped
+        return True
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = None
+        self._index = None
+
+    def __contains__(self, path: str) -> bool:
+        return self.open() and _pack_key(path) in self._index
+
+    def view(self, path: str) -> Optional[memoryview]:
+        """Contenido de 'path' como slice del mapa (None si no está empaquetado)."""
+        if not self.open():
+            return None
+        entry = self._index.get(_pack_key(path))
+        if entry is None:
+            return None
+        offset, length = entry
+        return memoryview(self._mmap)[offset:offset + length]
+
+    def extract(self, path: str, directory: str) -> str:
+        """
+        Copia 'path' a 'directory' (solo si falta o cambió de tamaño) y
+        devuelve la ruta. Para lo que solo se puede abrir por nombre de
+        archivo, como el audio de SoundLoader.
+        """
+        data = self.view(path)
+        if data is None:
+            return path
+        target = os.path.join(directory, os.path.basename(path))
+        if not os.path.exists(target) or os.path.getsize(target) != len(data):
+            with open(target + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(target + ".tmp", target)
+        return target
+
+
+pack = AssetPack()
+
+
+class AssetManifest:
+    """
+    Resuelve nombres lógicos ('fondo1', 'enemigo3') a archivos reales
+    según images/manifest.json (del paquete si existe): variante
+    pre-escalada por resolución y atlas de la familia. Sin manifiesto se
+    usa images/<nombre>.png.
+    """
+
+    def __init__(self, path: str = MANIFEST_PATH):
+        self.path = path
+        self._data: Optional[dict] = None
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            try:
+                packed = pack.view(self.path)
+                if packed is not None:
+                    self._data = json.loads(bytes(packed))
+                else:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._data = json.load(f)
+            except (OSError, ValueError):
+                self._data = {}
+        return self._data
+
+    def tier(self) -> str:
+        """'2x' en pantallas más altas que la de referencia, si no '1x'."""
+        from kivy.core.window import Window
+        base_h = self.data.get("base", (540, 960))[1]
+        return "2x" if Window.height > base_h and "2x" in self.data.get("tiers", {}) else "1x"
+
+    def entry(self, name: str) -> Optional[dict]:
+        return self.data.get("assets", {}).get(logical_name(name))
+
+    def file(self, name: str, size: Optional[Size] = None) -> str:
+        """
+        Archivo a cargar: la variante más pequeña que cubre 'size' (o la
+        del tier de la pantalla si no se pide tamaño), o la más grande si
+        ninguna alcanza. El original solo se usa si no hay variantes (en
+        el APK no viene: ver source.exclude_patterns en buildozer.spec).
+        """
+        entry = self.entry(name)
+        if entry is None:
+            return name if name.endswith(".png") else os.path.join("images", name + ".png")
+        variants = sorted(entry.get("variants", {}).values(), key=lambda v: v["size"])
+        if not variants:
+            return entry["source"]
+        if size is None:
+            variant = entry["variants"].get(self.tier())
+            return variant["path"] if variant else variants[-1]["path"]
+        need_w, need_h = size
+        for variant in variants:
+            w, h = variant["size"]
+            if w >= need_w and h >= need_h:
+                return variant["path"]
+        return variants[-1]["path"]
+
+    def atlas(self, name: str) -> Optional[Tuple[str, str]]:
+        """(ruta del .atlas, id) si el frame está empaquetado en un atlas."""
+        entry = self.entry(name)
+        if entry is None or "atlas" not in entry:
+            return None
+        pages = self.data.get("atlases", {}).get(entry["atlas"], {}).get("pages", {})
+        page = pages.get(self.tier())
+        return (page, logical_name(name)) if page else None
+
+    def source(self, name: str) -> str:
+        """Valor para Image(source=...): URL atlas:// o ruta de archivo."""
+        ref = self.atlas(name)
+        if ref is not None:
+            return f"atlas://{os.path.splitext(ref[0])[0]}/{ref[1]}"
+        return self.file(name)
+
+
+manifest = AssetManifest()
+
+
+def asset_source(name: str) -> str:
+    """
+    Valor para Image(source=...). Los atlas se cargan aquí (del paquete
+    si existe) y quedan en la caché de Kivy, así las URL atlas:// no
+    abren archivos.
+    """
+    ref = manifest.atlas(name)
+    if ref is not None:
+        assets.atlas(ref[0])
+    return manifest.source(name)
+
+
+def _load_image(path: str):
+    """Decodifica (sin GL) desde el paquete o, si no está, desde el archivo."""
+    data = pack.view(path)
+    if data is None:
+        return ImageLoader.load(path, nocache=True)
+    ext = os.path.splitext(path)[1][1:].lower()
+    for loader in ImageLoader.loaders:
+        if loader.can_load_memory() and ext in loader.extensions():
+            # Los decodificadores piden bytes: se copia solo el PNG comprimido
+            return loader(path, ext=ext, rawdata=io.BytesIO(data), inline=True,
+                          nocache=True)
+    raise Exception(f"Sin cargador en memoria para .{ext}")
+
+
+class _PackedAtlas(Atlas):
+    """Atlas de Kivy con el .atlas y sus páginas leídos del paquete."""
+
+    def _load(self):
+        meta = json.loads(bytes(pack.view(self._filename)))
+        folder = os.path.dirname(self._filename)
+        textures = {}
+        for page, ids in meta.items():
+            texture = assets.texture(f"{folder}/{page}")
+            self.original_textures.append(texture)
+            for uid, coords in ids.items():
+                textures[uid] = texture.get_region(*coords)
+        self.textures = textures
+
+
+class AssetManager:
+    """
+    Carga central de texturas.
+    - Decodifica PNG en un hilo de trabajo y crea la textura en el hilo
+      de GL (principal) cuando la imagen está lista.
+    - Caché LRU con presupuesto en bytes (ancho * alto * 4 por textura).
+    - Resuelve nombres lógicos con el manifiesto y elige la variante
+      pre-escalada que cubra el tamaño en pantalla pedido
+      (p. ej. Window.size para fondos).
+    - Lee del paquete mapeado en memoria si existe (ver AssetPack).
+    """
+
+    def __init__(self, budget_bytes: int = 96 * 1024 * 1024, workers: int = 1):
+        self.budget_bytes = budget_bytes
+        self.workers = workers
+        self._cache: "OrderedDict[str, Tuple[Texture, int]]" = OrderedDict()
+        self._bytes = 0
+        self._pending: Dict[str, List[Callable[[Texture], None]]] = {}
+        # id de GL -> textura de página de atlas (las regiones comparten el id)
+        self._atlas_pages: Dict[int, Texture] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Estadísticas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def resolve(self, name: str, size: Optional[Size] = None) -> str:
+        """Archivo a cargar para un nombre lógico (o ruta) y tamaño en pantalla."""
+        return manifest.file(name, size)
+
+    # -----------------------------------------------------
+    # Caché LRU
+    # -----------------------------------------------------
+    def _get(self, key: str) -> Optional[Texture]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        self._cache.move_to_end(key)
+        return entry[0]
+
+    def _put(self, key: str, texture: Texture):
+        nbytes = int(texture.width * texture.height * 4)
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._cache[key] = (texture, nbytes)
+        self._bytes += nbytes
+        # Expulsar las menos usadas (nunca la recién insertada)
+        while self._bytes > self.budget_bytes and len(self._cache) > 1:
+            _, (_, freed) = self._cache.popitem(last=False)
+            self._bytes -= freed
+            self.evictions += 1
+
+    @property
+    def cached_bytes(self) -> int:
+        return self._bytes
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._cache
+
+    def clear(self):
+        self._cache.clear()
+        self._bytes = 0
+
+    def discard(self, name: str, size: Optional[Size] = None):
+        """Saca una textura de la caché (p. ej. un tile de fondo que salió de la vista)."""
+        entry = self._cache.pop(self.resolve(name, size), None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    # -----------------------------------------------------
+    # Carga síncrona / asíncrona
+    # -----------------------------------------------------
+    def texture(self, name: str, size: Optional[Size] = None) -> Texture:
+        """Textura ya cargada o cargada ahora (bloquea el hilo principal)."""
+        key = self.resolve(name, size)
+        texture = self._get(key)
+        if texture is not None:
+            self.hits += 1
+            return texture
+        self.misses += 1
+        texture = _load_image(key).texture
+        self._put(key, texture)
+        return texture
+
+    def atlas(self, path: str) -> Atlas:
+        """
+        Atlas cargado una sola vez y registrado en la caché de Kivy con la
+        misma clave que usan las URL atlas://.
+        """
+        key = os.path.splitext(path)[0]
+        atlas = Cache.get("kv.atlas", key)
+        if atlas is None:
+            atlas = _PackedAtlas(path) if path in pack else Atlas(path)
+            Cache.append("kv.atlas", key, atlas)
+            for texture in atlas.original_textures:
+                self._atlas_pages[texture.id] = texture
+        return atlas
+
+    def page_texture(self, texture) -> Texture:
+        """
+        Página de atlas a la que pertenece una región (TextureRegion no
+        expone su dueña). Para texturas sueltas devuelve la misma.
+        """
+        return self._atlas_pages.get(texture.id, texture)
+
+    def load_async(self, name: str, callback: Optional[Callable[[Texture], None]] = None,
+                   size: Optional[Size] = None):
+        """
+        Decodifica en segundo plano y llama 'callback(texture)' en el hilo
+        principal. Si ya está en caché, el callback se ejecuta enseguida.
+        """
+        key = self.resolve(name, size)
+        texture = self._get(key)
+        if texture is not None:
+            self.hits += 1
+            if callback is not None:
+                callback(texture)
+            return
+
+        waiting = self._pending.get(key)
+        if waiting is not None:
+            if callback is not None:
+                waiting.append(callback)
+            return
+        self.misses += 1
+        self._pending[key] = [callback] if callback is not None else []
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                thread_name_prefix="assets")
+        self._executor.submit(self._decode, key)
+
+    def preload(self, names: Sequence[str], size: Optional[Size] = None):
+        """Encola la carga de varias imágenes (p. ej. los fondos al iniciar)."""
+        for name in names:
+            self.load_async(name, size=size)
+
+    def bind_texture(self, instruction, name: str, size: Optional[Size] = None):
+        """
+        Asigna la textura a una instrucción de canvas (p. ej. Rectangle).
+        Mientras se decodifica se usa una textura transparente.
+        """
+        if self._get(self.resolve(name, size)) is None:
+            instruction.texture = placeholder_texture()
+
+        def apply(texture):
+            instruction.texture = texture
+        self.load_async(name, apply, size)
+
+    def _decode(self, key: str):
+        # Hilo de trabajo: solo decodificación (sin GL)
+        try:
+            image = _load_image(key)
+        except Exception as e:
+            log.warning("⚠️  Asset no cargado: %s (%s)", key, e, every=1.0)
+            image = None
+        self._deliver(key, image)
+
+    @mainthread
+    def _deliver(self, key: str, image):
+        # Hilo principal: crear la textura en GL y avisar a los interesados
+        callbacks = self._pending.pop(key, [])
+        if image is None:
+            return
+        texture = image.texture
+        self._put(key, texture)
+        for callback in callbacks:
+            callback(texture)
+
+
+# Instancia compartida por todas las pantallas
+assets = AssetManager()
@@ -0,0 +1,225 @@
+# game/background.py
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from kivy.graphics import InstructionGroup, Rectangle
+
+from game.assets import assets, placeholder_texture
+
+Size = Tuple[float, float]
+
+
+def _set_span(rect: Rectangle, texture, a: float, b: float):
+    """Muestra en 'rect' la franja horizontal [a, b] (0..1) de 'texture'."""
+    if rect.texture is not texture:
+        rect.texture = texture
+    ux, uy = texture.uvpos
+    uw, uh = texture.uvsize
+    u0 = ux + a * uw
+    u1 = ux + b * uw
+    # uvpos/uvsize ya contemplan texturas invertidas (v0 = abajo en pantalla)
+    rect.tex_coords = (u0, uy, u1, uy, u1, uy + uh, u0, uy + uh)
+
+
+class ScrollLayer:
+    """
+    Una capa del fondo: quads del tamaño de la vista que se desplazan
+    cambiando tex_coords, no moviendo un Rectangle del ancho de la imagen.
+    - names: una imagen, o varias (tiles de igual ancho, de izquierda a
+      derecha) para fondos muy anchos. Solo los tiles visibles y el
+      siguiente están cargados; los demás se sueltan de la caché, así que
+      la memoria de GPU no crece con el largo del mundo.
+    - image_size: tamaño de la imagen completa (para la proporción; la
+      variante cargada puede tener otra resolución).
+    - factor: velocidad relativa al desplazamiento del scroller (parallax).
+    - wrap: al terminar la imagen vuelve a empezar (modo infinito); sin
+      wrap, la capa se detiene en el borde derecho.
+    """
+
+    def __init__(self, canvas, names: Sequence[str], image_size: Size,
+                 factor: float = 1.0, wrap: bool = False):
+        self.names = list(names)
+        self.image_w, self.image_h = image_size
+        self.factor = factor
+        self.wrap = wrap
+        self.group = InstructionGroup()
+        canvas.add(self.group)
+        self.rects: List[Rectangle] = []
+        self._textures: Dict[int, object] = {}
+        self._loading: set = set()
+        self.pos: Size = (0, 0)
+        self.size: Size = (1, 1)
+        self.offset = 0.0
+        self._showing = False
+
+    # -----------------------------------------------------
+    # Geometría
+    # -----------------------------------------------------
+    @property
+    def tile_width(self) -> float:
+        """Ancho en pantalla de cada tile (la imagen escalada al alto de la vista)."""
+        return self.image_w / len(self.names) * self.size[1] / self.image_h
+
+    @property
+    def width(self) -> float:
+        return self.tile_width * len(self.names)
+
+    @property
+    def max_offset(self) -> float:
+        """Desplazamiento máximo sin wrap (borde derecho de la imagen en la vista)."""
+        return max(0.0, self.width - self.size[0])
+
+    def resize(self, pos: Size, size: Size):
+        self.pos, self.size = tuple(pos), tuple(size)
+        self.show(self.offset)
+
+    # -----------------------------------------------------
+    # Dibujo
+    # -----------------------------------------------------
+    def show(self, offset: float):
+        """Muestra la capa desplazada 'offset' px (en pantalla) hacia la derecha."""
+        tile_w = self.tile_width
+        view_w, view_h = self.size
+        count = len(self.names)
+        if self.wrap:
+            offset %= self.width
+        else:
+            offset = min(max(offset, 0.0), self.max_offset)
+        self.offset = offset
+        self._showing = True
+
+        index = int(offset // tile_w)
+        local = offset - index * tile_w
+        x = 0.0
+        used = 0
+        visible = []
+        while x < view_w - 1e-6:
+            tile = index % count if self.wrap else index
+            if tile >= count:
+                break
+            span = min(tile_w - local, view_w - x)
+            if used == len(self.rects):
+                rect = Rectangle()
+                self.group.add(rect)
+                self.rects.append(rect)
+            rect = self.rects[used]
+            rect.pos = (self.pos[0] + x, self.pos[1])
+            rect.size = (span, view_h)
+            _set_span(rect, self._texture(tile), local / tile_w, (local + span) / tile_w)
+            visible.append(tile)
+            used += 1
+            x += span
+            local = 0.0
+            index += 1
+        for rect in self.rects[used:]:
+            rect.size = (0, 0)
+        self._showing = False
+
+        if count > 1:
+            # El tile que entra a continuación se pide antes de que se vea
+            ahead = index % count if self.wrap else index
+            self._stream(set(visible) | ({ahead} if ahead < count else set()))
+
+    def _texture(self, tile: int):
+        texture = self._textures.get(tile)
+        if texture is None:
+            self._request(tile)
+            texture = self._textures.get(tile) or placeholder_texture()
+        return texture
+
+    # -----------------------------------------------------
+    # Carga y descarga de tiles
+    # -----------------------------------------------------
+    def _tile_size(self) -> Size:
+        return (self.tile_width, self.size[1])
+
+    def _request(self, tile: int):
+        if tile in self._loading:
+            return
+        self._loading.add(tile)
+
+        def loaded(texture, tile=tile):
+            if tile not in self._loading:
+                return  # se soltó mientras se decodificaba
+            self._loading.discard(tile)
+            self._textures[tile] = texture
+            if not self._showing:
+                self.show(self.offset)
+        assets.load_async(self.names[tile], loaded, size=self._tile_size())
+
+    def _stream(self, keep: set):
+        for tile in list(self._textures) + list(self._loading):
+            if tile not in keep:
+                self._drop(tile)
+        for tile in keep:
+            if tile not in self._textures:
+                self._request(tile)
+
+    def _drop(self, tile: int):
+        self._loading.discard(tile)
+        if self._textures.pop(tile, None) is not None:
+            assets.discard(self.names[tile], size=self._tile_size())
+
+    def release(self):
+        """Suelta los tiles cargados (al salir de la pantalla)."""
+        if len(self.names) > 1:
+            for tile in list(self._textures) + list(self._loading):
+                self._drop(tile)
+        self._textures.clear()
+        self._loading.clear()
+
+
+class BackgroundScroller:
+    """
+    Fondo con desplazamiento horizontal y capas parallax:
+        self.background = BackgroundScroller(self.canvas.before, size=Window.size)
+        self.background.add_layer(["fondo1"], image_size=(2304, 1024))
+        self.background.speed = 30          # px/s de la capa con factor 1
+        ...
+        self.background.update(dt)          # en el bucle del nivel
+    Cada capa dibuja solo lo que cubre la vista (uno o dos quads por capa,
+    sin importar el ancho de la imagen; uno más por tile si los tiles son
+    más angostos que la vista), así que cada capa parallax cuesta lo mismo.
+    """
+
+    def __init__(self, canvas, pos: Size = (0, 0), size: Size = (1, 1),
+                 speed: float = 0.0):
+        self.canvas = canvas
+        self.pos = tuple(pos)
+        self.size = tuple(size)
+        self.speed = speed
+        self.offset = 0.0
+        self.layers: List[ScrollLayer] = []
+
+    def add_layer(self, names: Sequence[str], image_size: Size, factor: float = 1.0,
+                  wrap: bool = False) -> ScrollLayer:
+        """Agrega una capa encima de las anteriores (la primera es la del fondo)."""
+        layer = ScrollLayer(self.canvas, names, image_size, factor, wrap)
+        self.layers.append(layer)
+        layer.resize(self.pos, self.size)
+        return layer
+
+    def scroll_distance(self, layer: Optional[ScrollLayer] = None) -> float:
+        """Distancia hasta el borde derecho de 'layer' (la primera por defecto)."""
+        layer = layer or self.layers[0]
+        return layer.max_offset / layer.factor if layer.factor else 0.0
+
+    def update(self, dt: float):
+        self.scroll_to(self.offset + self.speed * dt)
+
+    def scroll_to(self, offset: float):
+        # Sin wrap, el scroller se detiene cuando la capa principal llega al borde
+        main = self.layers[0] if self.layers else None
+        if main is not None and not main.wrap:
+            offset = min(offset, self.scroll_distance(main))
+        self.offset = offset
+        for layer in self.layers:
+            layer.show(offset * layer.factor)
+
+    def resize(self, pos: Size, size: Size):
+        self.pos, self.size = tuple(pos), tuple(size)
+        for layer in self.layers:
+            layer.resize(self.pos, self.size)
+
+    def release(self):
+        for layer in self.layers:
+            layer.release()
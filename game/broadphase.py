@@ -0,0 +1,86 @@
+# game/broadphase.py
+from typing import Callable, Dict, Hashable, Iterator, List, Sequence, Tuple
+
+# (min_x, min_y, max_x, max_y)
+Bounds = Tuple[float, float, float, float]
+
+
+def circles_overlap(ax: float, ay: float, ar: float,
+                    bx: float, by: float, br: float) -> bool:
+    """Narrowphase círculo-círculo con distancia al cuadrado (sin sqrt)."""
+    dx = ax - bx
+    dy = ay - by
+    rr = ar + br
+    return dx * dx + dy * dy < rr * rr
+
+
+def circle_bounds(cx: float, cy: float, r: float) -> Bounds:
+    return (cx - r, cy - r, cx + r, cy + r)
+
+
+class SweepAndPrune:
+    """
+    Broadphase sort-and-sweep sobre el eje X entre dos grupos (A y B).
+    El orden de los objetos se conserva entre frames: como las
+    posiciones cambian poco de un frame a otro, la lista queda casi
+    ordenada y el reordenamiento (Timsort, adaptativo) es casi lineal.
+    Emite pares candidatos (a, b) cuyos AABB se solapan; la prueba
+    exacta queda a cargo del llamador (narrowphase).
+    """
+
+    def __init__(self):
+        self._order: List[Hashable] = []
+
+    def clear(self):
+        self._order = []
+
+    def candidate_pairs(self, group_a: Sequence, group_b: Sequence,
+                        bounds: Callable[[object], Bounds]) -> Iterator[Tuple[object, object]]:
+        if not group_a or not group_b:
+            return iter(())
+
+        # Grupo de cada objeto vivo (0 = A, 1 = B)
+        side: Dict[int, int] = {}
+        objs: Dict[int, object] = {}
+        for o in group_a:
+            side[id(o)] = 0
+            objs[id(o)] = o
+        for o in group_b:
+            side[id(o)] = 1
+            objs[id(o)] = o
+
+        # Reutilizar el orden del frame anterior y añadir los nuevos al final
+        order = [k for k in self._order if k in side]
+        known = set(order)
+        order.extend(k for k in side if k not in known)
+
+        boxes = {k: bounds(objs[k]) for k in order}
+        order.sort(key=lambda k: boxes[k][0])
+        self._order = order
+
+        return self._sweep(order, boxes, side, objs)
+
+    @staticmethod
+    def _sweep(order, boxes, side, objs):
+        active: List[List] = [[], []]  # activos por grupo
+        for k in order:
+            min_x, min_y, max_x, max_y = boxes[k]
+            g = side[k]
+            other = active[1 - g]
+
+            # Descartar los que ya terminaron en X (compactación in-place)
+            j = 0
+            for o in other:
+                if boxes[o][2] >= min_x:
+                    other[j] = o
+                    j += 1
+            del other[j:]
+
+            for o in other:
+                _, o_min_y, _, o_max_y = boxes[o]
+                if o_min_y <= max_y and min_y <= o_max_y:
+                    if g == 0:
+                        yield objs[k], objs[o]
+                    else:
+                        yield objs[o], objs[k]
+            active[g].append(k)
@@ -1,62 +1,237 @@
 # game/collision.py
-from typing import Tuple, List
-from .geometry import rects_intersect, Rect
+from typing import Tuple, List, Union, Optional, Iterable
+from dataclasses import dataclass
+from .geometry import Rect, Vec2, rects_intersect
+from .spatial import WallGrid
+
+Walls = Union[List[Rect], WallGrid]
+
+# Tolerancia (px) para considerar contacto una penetración mínima por redondeo
+CONTACT_SKIN = 1e-3
+
+_INF = float("inf")
+
+
+@dataclass
+class SweepHit:
+    """Resultado de un barrido AABB contra las paredes."""
+    time: float        # fracción del desplazamiento (0..1) hasta el contacto
+    normal: Vec2       # normal de la cara impactada (-1/0/1 en cada eje)
+    remaining: Vec2    # desplazamiento que queda tras el contacto
+    wall: Rect
+
+
+def _candidates(box: Rect, dx: float, dy: float, walls: Walls) -> Iterable[Rect]:
+    """Paredes que pueden tocar el AABB durante el barrido."""
+    if not isinstance(walls, WallGrid):
+        return walls
+    x, y, w, h = box
+    bx = min(x, x + dx)
+    by = min(y, y + dy)
+    return walls.query((bx, by, w + abs(dx), h + abs(dy)))
+
+
+def _axis_times(a0: float, a_len: float, b0: float, b_len: float, d: float) -> Tuple[float, float]:
+    """Tiempos de entrada/salida en un eje (en fracción de 'd')."""
+    if d > 0:
+        return (b0 - (a0 + a_len)) / d, (b0 + b_len - a0) / d
+    if d < 0:
+        return (b0 + b_len - a0) / d, (b0 - (a0 + a_len)) / d
+    # Sin movimiento en este eje: debe haber solapamiento estricto todo el tiempo
+    if a0 + a_len <= b0 or b0 + b_len <= a0:
+        return _INF, -_INF
+    return -_INF, _INF
+
+
+def sweep_aabb(box: Rect, dx: float, dy: float, walls: Walls) -> Optional[SweepHit]:
+    """
+    Barrido continuo (swept AABB) de 'box' a lo largo de (dx, dy).
+    Devuelve el primer contacto con su tiempo, normal y desplazamiento
+    restante, o None si el recorrido está libre. No hay tunneling:
+    el resultado no depende de la velocidad ni del grosor de la pared.
+    """
+    if dx == 0 and dy == 0:
+        return None
+
+    x, y, w, h = box
+    best: Optional[SweepHit] = None
+    best_t = _INF
+
+    for wall in _candidates(box, dx, dy, walls):
+        wx, wy, ww, wh = wall
+        tx_in, tx_out = _axis_times(x, w, wx, ww, dx)
+        ty_in, ty_out = _axis_times(y, h, wy, wh, dy)
+
+        t_in = max(tx_in, ty_in)
+        t_out = min(tx_out, ty_out)
+        if t_in >= t_out or t_in > 1.0 or t_out <= 0.0 or t_in >= best_t:
+            continue
+
+        # Contacto en el eje que entra último
+        if tx_in >= ty_in:
+            depth = -tx_in * abs(dx)
+            normal = (-1.0 if dx > 0 else 1.0, 0.0)
+        else:
+            depth = -ty_in * abs(dy)
+            normal = (0.0, -1.0 if dy > 0 else 1.0)
+
+        # Ya estaba solapado más allá del margen: no es un contacto nuevo
+        if depth > CONTACT_SKIN:
+            continue
+
+        t = max(0.0, t_in)
+        best_t = t
+        best = SweepHit(t, normal, (dx * (1.0 - t), dy * (1.0 - t)), wall)
+
+    return best
+
+
+def sweep_move(x: float, y: float, w: float, h: float,
+               vx: float, vy: float, dt: float,
+               walls: Walls) -> Tuple[float, float, Optional[SweepHit]]:
+    """
+    Avanza el AABB hasta el primer contacto (o el final del paso).
+    Retorna: (nx, ny, hit)
+    """
+    dx, dy = vx * dt, vy * dt
+    hit = sweep_aabb((x, y, w, h), dx, dy, walls)
+    if hit is None:
+        return x + dx, y + dy, None
+    return x + dx * hit.time, y + dy * hit.time, hit
+
 
 def move_with_collisions(x: float, y: float, w: float, h: float,
                          vx: float, vy: float, dt: float,
-                         walls: List[Rect]) -> Tuple[float, float, float, float, bool]:
+                         walls: Walls) -> Tuple[float, float, float, float, bool]:
     """
-    Desplaza en X y Y con corrección de penetración (1px) 
-    y devuelve si hubo colisión.
+    Desplaza con barrido continuo: se detiene en el contacto exacto,
+    anula la componente de velocidad de la normal y desliza el resto
+    del desplazamiento por la pared.
+    'walls' puede ser una lista de rectángulos o un WallGrid.
     Retorna: (nx, ny, nvx, nvy, collided)
     """
     collided = False
-    
-    # --- EJE X ---
-    nx = x + vx * dt
-    ny = y
-    aabb = (nx, ny, w, h)
-    
-    if any(rects_intersect(aabb, wr) for wr in walls):
-        # Si vx es 0 (caída recta), forzamos step=0 para no moverlo infinitamente a la derecha
-        if abs(vx) < 0.001: 
-            step = 0 
-        else:
-            step = -1 if vx > 0 else 1
-            
-        # SAFETY: Límite de 50 iteraciones para evitar congelamiento
-        safe_loop = 0 
-        while safe_loop < 50 and any(rects_intersect((nx, ny, w, h), wr) for wr in walls):
-            if step == 0: # Si no tiene velocidad horizontal, deshacemos el movimiento
-                nx = x 
-                break
-            nx += step
-            safe_loop += 1
-            
-        vx = 0.0
-        collided = True
+    dx, dy = vx * dt, vy * dt
+
+    # Como máximo un contacto por eje (esquinas incluidas)
+    for _ in range(2):
+        hit = sweep_aabb((x, y, w, h), dx, dy, walls)
+        if hit is None:
+            x += dx
+            y += dy
+            break
 
-    # --- EJE Y ---
-    # Usamos la nueva nx para calcular el movimiento en Y
-    ny_target = y + vy * dt
-    aabb = (nx, ny_target, w, h)
-    
-    if any(rects_intersect(aabb, wr) for wr in walls):
-        step = -1 if vy > 0 else 1
-        
-        # Iniciar desde la posición tentativa
-        current_ny = ny_target
-        
-        # SAFETY: Límite de 50 iteraciones
-        safe_loop = 0
-        while safe_loop < 50 and any(rects_intersect((nx, current_ny, w, h), wr) for wr in walls):
-            current_ny += step
-            safe_loop += 1
-            
-        ny = current_ny
-        vy = 0.0
         collided = True
-    else:
-        ny = ny_target
+        x += dx * hit.time
+        y += dy * hit.time
+        rx, ry = hit.remaining
+        if hit.normal[0] != 0.0:
+            vx = 0.0
+            dx, dy = 0.0, ry
+        else:
+            vy = 0.0
+            dx, dy = rx, 0.0
+
+    return x, y, vx, vy, collided
+
+
+# =========================================================
+# TRAYECTORIA BALÍSTICA (vista previa del tiro)
+# p(t) = p0 + v0*t + 0.5*g*t^2, con gravedad solo en Y
+# =========================================================
+@dataclass
+class ArcHit:
+    """Primer impacto de una trayectoria balística contra las paredes."""
+    time: float        # segundos desde el lanzamiento
+    point: Vec2        # posición (centro) en el impacto
+    normal: Vec2       # normal de la cara impactada
+    wall: Rect
+
+
+def _arc_bounds(x0: float, y0: float, vx: float, vy: float, g: float,
+                t0: float, t1: float) -> Rect:
+    """AABB del tramo de parábola entre t0 y t1 (incluye el vértice)."""
+    xa, xb = x0 + vx * t0, x0 + vx * t1
+    ys = [y0 + vy * t0 + 0.5 * g * t0 * t0, y0 + vy * t1 + 0.5 * g * t1 * t1]
+    if g != 0.0:
+        t_apex = -vy / g
+        if t0 < t_apex < t1:
+            ys.append(y0 + vy * t_apex + 0.5 * g * t_apex * t_apex)
+    x_min, y_min = min(xa, xb), min(ys)
+    return (x_min, y_min, max(xa, xb) - x_min, max(ys) - y_min)
+
+
+def _roots(a: float, b: float, c: float) -> Tuple[float, ...]:
+    """Raíces reales de a*t^2 + b*t + c = 0 (lineal si a == 0)."""
+    if a == 0.0:
+        return (-c / b,) if b != 0.0 else ()
+    disc = b * b - 4.0 * a * c
+    if disc < 0.0:
+        return ()
+    sq = disc ** 0.5
+    return ((-b - sq) / (2.0 * a), (-b + sq) / (2.0 * a))
+
+
+def _arc_enter_time(x0: float, y0: float, vx: float, vy: float, g: float,
+                    r: Rect, t0: float, t1: float) -> Optional[Tuple[float, Vec2]]:
+    """
+    Primer instante en [t0, t1] en que la parábola ENTRA al rectángulo 'r',
+    resolviendo contra cada cara (lineal en X, cuadrática en Y).
+    """
+    left, bottom, w, h = r
+    right, top = left + w, bottom + h
+    best: Optional[Tuple[float, Vec2]] = None
+
+    # Caras verticales: x(t) es lineal
+    if vx != 0.0:
+        face, normal = (left, (-1.0, 0.0)) if vx > 0 else (right, (1.0, 0.0))
+        t = (face - x0) / vx
+        if t0 <= t <= t1 and bottom <= y0 + vy * t + 0.5 * g * t * t <= top:
+            best = (t, normal)
+
+    # Caras horizontales: y(t) es cuadrática; solo cuenta si entra
+    for face, normal, sign in ((top, (0.0, 1.0), -1.0), (bottom, (0.0, -1.0), 1.0)):
+        for t in _roots(0.5 * g, vy, y0 - face):
+            if not (t0 <= t <= t1) or (best is not None and t >= best[0]):
+                continue
+            if (vy + g * t) * sign <= 0.0:
+                continue  # sale por esta cara (o la roza)
+            if left <= x0 + vx * t <= right:
+                best = (t, normal)
+    return best
+
+
+def ballistic_sweep(x0: float, y0: float, vx: float, vy: float, g: float,
+                    t_max: float, walls: Walls,
+                    half_size: Vec2 = (0.0, 0.0), steps: int = 8) -> Optional[ArcHit]:
+    """
+    Primer impacto de la trayectoria de un AABB centrado en (x0, y0)
+    (semi-tamaño 'half_size') contra las paredes, hasta 't_max' segundos.
+    El recorrido se parte en 'steps' tramos; cada tramo solo prueba las
+    paredes que tocan su caja envolvente (WallGrid) y se corta en el
+    primer tramo con impacto.
+    """
+    hw, hh = half_size
+    dt = t_max / max(1, steps)
+    for k in range(max(1, steps)):
+        ta, tb = k * dt, (k + 1) * dt
+        bx, by, bw, bh = _arc_bounds(x0, y0, vx, vy, g, ta, tb)
+        # +1 px: rects_intersect es estricto y el tramo puede ser una línea
+        bounds = (bx - hw - 1.0, by - hh - 1.0, bw + 2 * hw + 2.0, bh + 2 * hh + 2.0)
+        if isinstance(walls, WallGrid):
+            candidates = walls.query(bounds)
+        else:
+            candidates = [wr for wr in walls if rects_intersect(bounds, wr)]
 
-    return nx, ny, vx, vy, collided
\ No newline at end of file
+        best: Optional[ArcHit] = None
+        for wall in candidates:
+            wx, wy, ww, wh = wall
+            # Suma de Minkowski: el centro del proyectil vs la pared engordada
+            hit = _arc_enter_time(x0, y0, vx, vy, g,
+                                  (wx - hw, wy - hh, ww + 2 * hw, wh + 2 * hh), ta, tb)
+            if hit is not None and (best is None or hit[0] < best.time):
+                t, normal = hit
+                best = ArcHit(t, (x0 + vx * t, y0 + vy * t + 0.5 * g * t * t), normal, wall)
+        if best is not None:
+            return best
+    return None
@@ -1,72 +1,104 @@
 from kivy.uix.widget import Widget
 from kivy.uix.image import Image
 from kivy.core.window import Window
-from kivy.clock import Clock  
 import random, math
 from game.utils import limit_vector, normalize_vector
-
-class Enemy(Widget):
-    def __init__(self, player, is_homing=False, use_flocking=False, **kwargs):
+from game.entities import (EntityStore, EntityView, column_property, flag_property,
+                           FLAG_HOMING, FLAG_FLOCKING)
+from game.frame import FrameClient
+from game.pool import Poolable
+from game.assets import asset_source
+from game.log import get_logger
+
+log = get_logger("enemy")
+
+class Enemy(Poolable, FrameClient, EntityView, Widget):
+    # Estado de simulación guardado en el EntityStore (la vista solo dibuja)
+    velocity_x = column_property('vx')
+    velocity_y = column_property('vy')
+    is_homing = flag_property(FLAG_HOMING, detached=False)
+    use_flocking = flag_property(FLAG_FLOCKING, detached=False)
+
+    def __init__(self, player, is_homing=False, use_flocking=False, store=None,
+                 dispatcher=None, **kwargs):
         super().__init__(**kwargs)
 
         # Referencias a imágenes de animación
         self.animation_frames = [
-            "images/enemigo1.png",
-            "images/enemigo2.png",
-            "images/enemigo3.png",
-            "images/enemigo4.png"
+            "enemigo1",
+            "enemigo2",
+            "enemigo3",
+            "enemigo4"
         ]
-        self.current_frame = 0
         self.animation_speed = 0.1  # 10 FPS
 
         # IMPORTANTE: Crear UN NUEVO sprite Image para este enemigo
         self.sprite = Image(
-            source=self.animation_frames[self.current_frame], 
+            source=asset_source(self.animation_frames[0]),
             size_hint=(None, None),
             size=(120, 120)
         )
         self.add_widget(self.sprite)
 
-        # Posición inicial
-        self.center_x = random.randint(50, Window.width - 50)
-        self.y = Window.height + 50
-        self.update_sprite()
-
         # Propiedades de movimiento
         self.speed = 4
-        self.is_homing = is_homing
+        self.max_speed = 6
+        self.max_force = 0.3
+
+        # Sistema de disparo
+        self.shoot_cooldown = 5.0  # Dispara cada 5 segundos
+
+        self.reset(player=player, is_homing=is_homing, use_flocking=use_flocking,
+                   store=store, dispatcher=dispatcher)
+
+    def reset(self, player, is_homing=False, use_flocking=False, store=None,
+              dispatcher=None):
+        """(Re)inicia el enemigo; el sprite se conserva entre usos del pool"""
         self.player = player
 
+        # Registro en el store: posición (centro), velocidad, vida y flags
+        start_x = random.randint(50, Window.width - 50)
+        start_y = Window.height + 50 + self.height / 2  # Posición inicial
+        flags = (FLAG_HOMING if is_homing else 0) | (FLAG_FLOCKING if use_flocking else 0)
+        if store is None:
+            store = EntityStore()
+        store.create(
+            view=self,
+            x=start_x,
+            y=start_y,
+            vx=0,
+            vy=-self.speed,  # Inicialmente hacia abajo
+            life=5 if is_homing else 0,  # Vida en segundos solo para homing
+            flags=flags
+        )
+        self.sync_view(start_x, start_y)
+
         #  Propiedades para flocking
-        self.use_flocking = use_flocking
-        self.velocity_x = 0
-        self.velocity_y = -self.speed  # Inicialmente hacia abajo
         self.acceleration_x = 0
         self.acceleration_y = 0
-        self.max_speed = 6
-        self.max_force = 0.3
-
 
-        # Vida en segundos solo para homing
-        self.lifetime = 5 if self.is_homing else None
-
-        # Sistema de disparo
-        self.shoot_cooldown = 5.0  # Dispara cada 5 segundos
+        # Temporizador de disparo
+        self.shoot_projectile = None
         self.time_since_last_shot = random.uniform(0, 3)  # Randomizar inicio
 
-        # Iniciar animación del enemigo
-        Clock.schedule_interval(self.animate_enemy, self.animation_speed)
-
-    def animate_enemy(self, dt):
-        """Cambia el sprite del enemigo para crear una animación."""
-        self.current_frame = (self.current_frame + 1) % len(self.animation_frames)
-        # Cambiar la fuente de la imagen
-        self.sprite.source = self.animation_frames[self.current_frame]
+        # Iniciar animación del enemigo (reloj de animación compartido de la pantalla)
+        self.register_animation(dispatcher, self.sprite, self.animation_frames, self.animation_speed)
 
     def update_sprite(self):
         """Actualiza la posición del sprite del enemigo"""
-        self.sprite.center_x = self.center_x
-        self.sprite.center_y = self.center_y
+        self.sprite.center = self.center
+
+    def sync_view(self, x, y):
+        """Vuelca la posición del store al widget (una vez por frame)"""
+        self.center = (x, y)
+        self.sprite.center = (x, y)
+
+    @property
+    def lifetime(self):
+        """Vida restante (solo homing); None para el resto"""
+        if not self.is_homing:
+            return None
+        return self.store.life[self.store.slot(self.entity_id)]
 
     def apply_force(self, force_x, force_y):
         """Aplica una fuerza a la aceleración (usado para flocking)"""
@@ -75,74 +107,79 @@ class Enemy(Widget):
     
     def update(self, dt, flocking_force=None):
         """Actualiza el estado del enemigo cada frame"""
+        store = self.store
+        i = store.slot(self.entity_id)
+        x, y = store.x[i], store.y[i]
+        vx, vy = store.vx[i], store.vy[i]
+        flags = store.flags[i]
+        half_h = self.height / 2
+
         # Actualizar temporizador de disparo
         self.time_since_last_shot += dt
         
         # Disparar si es tiempo y el enemigo está visible en pantalla
         if (self.time_since_last_shot >= self.shoot_cooldown and 
-            0 < self.center_y < Window.height):
+            0 < y < Window.height):
             
             # Llamar al método de disparo si existe
             if hasattr(self, 'shoot_projectile') and callable(self.shoot_projectile):
                 self.shoot_projectile()
             self.time_since_last_shot = 0
         
-        if self.use_flocking and flocking_force:
+        if flags & FLAG_FLOCKING and flocking_force:
             # Aplicar fuerza de flocking
             force_x, force_y = flocking_force
-            # LOG: Debug ocasional
-            if not hasattr(self, 'log_counter'):
-                self.log_counter = 0
-            self.log_counter += 1
-            if self.log_counter % 120 == 0:
-                print(f"   🐦 Flocking enemy at ({self.center_x:.0f}, {self.center_y:.0f}) | Force: ({force_x:.2f}, {force_y:.2f}) | Vel: ({self.velocity_x:.2f}, {self.velocity_y:.2f})")
+            # LOG: Debug ocasional (uno cada 2 s entre todos los enemigos)
+            log.debug("   🐦 Flocking enemy at (%.0f, %.0f) | Force: (%.2f, %.2f) | Vel: (%.2f, %.2f)",
+                      x, y, force_x, force_y, vx, vy, every=2.0)
 
             # Limitar la fuerza máxima
             force_x, force_y = limit_vector(force_x, force_y, self.max_force)
             self.apply_force(force_x, force_y)
             
             # Actualizar velocidad con aceleración
-            self.velocity_x += self.acceleration_x
-            self.velocity_y += self.acceleration_y
+            vx += self.acceleration_x
+            vy += self.acceleration_y
             
             # Limitar velocidad máxima
-            self.velocity_x, self.velocity_y = limit_vector(
-                self.velocity_x, self.velocity_y, self.max_speed
-            )
+            vx, vy = limit_vector(vx, vy, self.max_speed)
             
             # Actualizar posición
-            self.center_x += self.velocity_x
-            self.center_y += self.velocity_y
+            x += vx
+            y += vy
+            store.x[i], store.y[i] = x, y
+            store.vx[i], store.vy[i] = vx, vy
             
             # Resetear aceleración para el próximo frame
             self.acceleration_x = 0
             self.acceleration_y = 0
             
             # Verificar si sale de pantalla
-            if self.y < -200 or self.center_x < -100 or self.center_x > Window.width + 100:
-                print(f"   ❌ Flocking enemy removed (out of bounds)")
+            if y - half_h < -200 or x < -100 or x > Window.width + 100:
+                log.debug("   ❌ Flocking enemy removed (out of bounds)", every=1.0)
                 return False
         
         # 2. Si es HOMING (persigue al jugador)
-        elif self.is_homing:
+        elif flags & FLAG_HOMING:
             # Seguir al jugador
-            dx = self.player.center_x - self.center_x
-            dy = self.player.center_y - self.center_y
+            dx = self.player.center_x - x
+            dy = self.player.center_y - y
             dist = math.sqrt(dx**2 + dy**2)
             if dist > 0:
-                self.center_x += (dx / dist) * self.speed
-                self.center_y += (dy / dist) * self.speed
+                x += (dx / dist) * self.speed
+                y += (dy / dist) * self.speed
+            store.x[i], store.y[i] = x, y
 
             # Reducir vida
-            self.lifetime -= dt
-            if self.lifetime <= 0:
+            store.life[i] -= dt
+            if store.life[i] <= 0:
                 return False  # marcar para eliminar
         else:
             # Movimiento normal hacia abajo
-            self.y -= self.speed * 1.5
-            if self.y < -50:
+            y -= self.speed * 1.5
+            store.y[i] = y
+            if y - half_h < -50:
                 return False  # eliminar si sale de pantalla
 
-        self.update_sprite()
+        self.sync_view(x, y)
         return True
-
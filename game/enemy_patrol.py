@@ -1,65 +1,76 @@
 from kivy.uix.widget import Widget
 from kivy.uix.image import Image
-from kivy.clock import Clock
 from kivy.animation import Animation
 import math, random
+from game.entities import EntityStore, EntityView, flag_property, FLAG_DEAD
+from game.frame import FrameClient, PHASE_AI
+from game.pool import Poolable
+from game.assets import asset_source
 
 
-class PatrolEnemy(Widget):
+class PatrolEnemy(Poolable, FrameClient, EntityView, Widget):
     """Enemigo que patrulla entre varios waypoints con animación y colisión.
        Tiene flags is_dead y removed para una eliminación segura desde el GameScreen.
+       La posición vive en el EntityStore del nivel; el widget es solo la vista.
     """
-    def __init__(self, waypoints, speed=3, **kwargs):
+    # cuando se le golpea por primera vez (True también si ya salió del store)
+    is_dead = flag_property(FLAG_DEAD, detached=True)
+
+    def __init__(self, waypoints=(), speed=3, store=None, dispatcher=None, **kwargs):
         super().__init__(**kwargs)
 
         # Animación del enemigo (usa las mismas imágenes que ya tienes)
         self.animation_frames = [
-            "images/enemigo1.png",
-            "images/enemigo2.png",
-            "images/enemigo3.png",
-            "images/enemigo4.png"
+            "enemigo1",
+            "enemigo2",
+            "enemigo3",
+            "enemigo4"
         ]
-        self.current_frame = 0
-
         # Sprite (Image) del enemigo
         self.sprite = Image(
-            source=self.animation_frames[self.current_frame],
+            source=asset_source(self.animation_frames[0]),
             size_hint=(None, None),
             size=(100, 100),  # tamaño visible, más pequeño que antes
             opacity=1.0
         )
         self.add_widget(self.sprite)
 
+        self.reset(waypoints=waypoints, speed=speed, store=store, dispatcher=dispatcher)
+
+    def reset(self, waypoints=(), speed=3, store=None, dispatcher=None):
+        """(Re)inicia el enemigo; el sprite se conserva entre usos del pool."""
+        # Deshacer la animación de muerte de un uso anterior
+        Animation.cancel_all(self.sprite)
+        self.sprite.opacity = 1.0
+        self.sprite.size = (100, 100)
+
         # Waypoints y movimiento
-        self.waypoints = waypoints[:]  # lista de Waypoint (con .pos)
+        self.waypoints = list(waypoints)  # lista de Waypoint (con .pos)
         self.current_wp = 0
         self.speed = speed
 
         # Flags para eliminación segura
-        self.is_dead = False     # cuando se le golpea por primera vez
         self.removed = False     # cuando ya fue removido del padre / lista
 
         # Posición inicial: primer waypoint
         if self.waypoints:
-            self.center_x, self.center_y = self.waypoints[0].pos
+            start_x, start_y = self.waypoints[0].pos
         else:
-            self.center_x, self.center_y = (50, 50)
-
-        self.update_sprite()
+            start_x, start_y = (50, 50)
 
-        # Programar animación y movimiento
-        Clock.schedule_interval(self.animate_enemy, 0.12)
-        Clock.schedule_interval(self._internal_update, 1 / 60)
+        if store is None:
+            store = EntityStore()
+        store.create(view=self, x=start_x, y=start_y)
+        self.sync_view(start_x, start_y)
 
         # Aleatorizar fase de animación (visual)
         self._anim_phase_offset = random.uniform(0, 0.12)
 
-    def animate_enemy(self, dt):
-        """Cambia frame para simular animación. Pausado si está muerto."""
-        if self.is_dead:
-            return
-        self.current_frame = (self.current_frame + 1) % len(self.animation_frames)
-        self.sprite.source = self.animation_frames[self.current_frame]
+        # Registrar animación y movimiento en el bucle central del nivel
+        # (la animación se detiene al darlo de baja cuando muere)
+        self.register_animation(dispatcher, self.sprite, self.animation_frames, 0.12,
+                                self._anim_phase_offset)
+        self.register_system(dispatcher, PHASE_AI, self._internal_update)
 
     def _internal_update(self, dt):
         """Wrapper para separar la lógica de movimiento y permitir que el owner lo elimine."""
@@ -73,9 +84,13 @@ class PatrolEnemy(Widget):
         if self.is_dead or not self.waypoints:
             return
 
+        store = self.store
+        i = store.slot(self.entity_id)
+        x, y = store.x[i], store.y[i]
+
         target_x, target_y = self.waypoints[self.current_wp].pos
-        dx = target_x - self.center_x
-        dy = target_y - self.center_y
+        dx = target_x - x
+        dy = target_y - y
         dist = math.hypot(dx, dy)
 
         if dist < 4:  # alcanza waypoint -> siguiente
@@ -83,8 +98,9 @@ class PatrolEnemy(Widget):
         else:
             # movimiento proporcional a dt para consistencia con fps variable
             step = self.speed
-            self.center_x += (dx / dist) * step
-            self.center_y += (dy / dist) * step
+            x += (dx / dist) * step
+            y += (dy / dist) * step
+            store.x[i], store.y[i] = x, y
 
             # rotación visual: usamos sprite.angle si disponible (Kivy Image soporta rotation via canvas)
             try:
@@ -95,14 +111,18 @@ class PatrolEnemy(Widget):
             except Exception:
                 pass
 
-        self.update_sprite()
+        self.sync_view(x, y)
 
     def update_sprite(self):
         """Mantener sprite centrado."""
         # Aseguramos que el sprite exista
         if hasattr(self, "sprite") and self.sprite is not None:
-            self.sprite.center_x = self.center_x
-            self.sprite.center_y = self.center_y
+            self.sprite.center = self.center
+
+    def sync_view(self, x, y):
+        """Vuelca la posición del store al widget (una vez por frame)."""
+        self.center = (x, y)
+        self.sprite.center = (x, y)
 
     def destroy(self):
         """Inicia animación de muerte y marca is_dead.
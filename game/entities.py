@@ -0,0 +1,206 @@
+# game/entities.py
+from array import array
+from typing import Iterator, List, Optional
+
+# Flags de estado (bitmask en la columna 'flags')
+FLAG_HOMING = 1 << 0
+FLAG_FLOCKING = 1 << 1
+FLAG_DEAD = 1 << 2
+
+# IDs generacionales: índice en los 24 bits bajos, generación en el resto
+_INDEX_BITS = 24
+_INDEX_MASK = (1 << _INDEX_BITS) - 1
+
+
+class EntityStore:
+    """
+    Registro de entidades en estructura de arrays (SoA).
+    Posición (centro), velocidad, vida y flags viven en arrays contiguos;
+    cada entidad tiene además una vista opcional (el widget que la dibuja).
+    - create() devuelve un ID generacional: un ID de una entidad destruida
+      deja de ser válido aunque su hueco se reutilice.
+    - destroy() es O(1): mueve la última entidad al hueco (swap-remove).
+    Para eliminar mientras se recorre, usar reversed_slots().
+    """
+
+    def __init__(self):
+        self.x = array('d')
+        self.y = array('d')
+        self.vx = array('d')
+        self.vy = array('d')
+        self.life = array('d')
+        self.flags = array('l')
+        self.views: List[object] = []
+        self._ids: List[int] = []          # slot denso -> ID
+        self._slot_of: List[int] = []      # índice del ID -> slot denso (-1 libre)
+        self._generation: List[int] = []
+        self._free: List[int] = []
+
+    # -----------------------------------------------------
+    # Creación / destrucción
+    # -----------------------------------------------------
+    def create(self, view=None, x: float = 0.0, y: float = 0.0,
+               vx: float = 0.0, vy: float = 0.0, life: float = 0.0,
+               flags: int = 0) -> int:
+        if self._free:
+            index = self._free.pop()
+        else:
+            index = len(self._generation)
+            if index > _INDEX_MASK:
+                raise OverflowError("EntityStore lleno")
+            self._generation.append(0)
+            self._slot_of.append(-1)
+        eid = (self._generation[index] << _INDEX_BITS) | index
+
+        self._slot_of[index] = len(self.views)
+        self._ids.append(eid)
+        self.views.append(view)
+        self.x.append(x)
+        self.y.append(y)
+        self.vx.append(vx)
+        self.vy.append(vy)
+        self.life.append(life)
+        self.flags.append(flags)
+
+        if view is not None:
+            view.store = self
+            view.entity_id = eid
+        return eid
+
+    def destroy(self, eid: int) -> bool:
+        """Elimina la entidad (O(1)). Devuelve False si el ID ya no era válido."""
+        if not self.alive(eid):
+            return False
+        self.destroy_slot(self._slot_of[eid & _INDEX_MASK])
+        return True
+
+    def destroy_slot(self, slot: int):
+        index = self._ids[slot] & _INDEX_MASK
+        last = len(self.views) - 1
+        if slot != last:
+            # Mover la última entidad al hueco
+            moved = self._ids[last]
+            self._ids[slot] = moved
+            self.views[slot] = self.views[last]
+            for col in (self.x, self.y, self.vx, self.vy, self.life, self.flags):
+                col[slot] = col[last]
+            self._slot_of[moved & _INDEX_MASK] = slot
+        self._ids.pop()
+        self.views.pop()
+        for col in (self.x, self.y, self.vx, self.vy, self.life, self.flags):
+            col.pop()
+
+        self._slot_of[index] = -1
+        self._generation[index] += 1
+        self._free.append(index)
+
+    def remove(self, view) -> bool:
+        """Elimina la entidad asociada a una vista."""
+        return self.destroy(getattr(view, "entity_id", -1))
+
+    def clear(self):
+        self.__init__()
+
+    # -----------------------------------------------------
+    # Consultas
+    # -----------------------------------------------------
+    def alive(self, eid: int) -> bool:
+        if eid < 0:
+            return False
+        index = eid & _INDEX_MASK
+        return (index < len(self._generation)
+                and self._slot_of[index] >= 0
+                and self._generation[index] == eid >> _INDEX_BITS)
+
+    def slot(self, eid: int) -> int:
+        """Slot denso actual de la entidad (cambia tras un swap-remove)."""
+        if not self.alive(eid):
+            raise KeyError(f"entidad {eid} no existe")
+        return self._slot_of[eid & _INDEX_MASK]
+
+    def view(self, eid: int) -> Optional[object]:
+        return self.views[self.slot(eid)]
+
+    def reversed_slots(self) -> range:
+        """Slots de atrás hacia adelante: seguro para destroy_slot() en el recorrido."""
+        return range(len(self.views) - 1, -1, -1)
+
+    def count(self, flag: int) -> int:
+        return sum(1 for f in self.flags if f & flag)
+
+    def __len__(self) -> int:
+        return len(self.views)
+
+    def __iter__(self) -> Iterator[object]:
+        return iter(self.views)
+
+    def __contains__(self, view) -> bool:
+        return (getattr(view, "store", None) is self
+                and self.alive(getattr(view, "entity_id", -1)))
+
+    # -----------------------------------------------------
+    # Sincronización de vistas (una vez por frame)
+    # -----------------------------------------------------
+    def sync_views(self):
+        x, y = self.x, self.y
+        for i, view in enumerate(self.views):
+            if view is not None:
+                view.sync_view(x[i], y[i])
+
+
+class EntityView:
+    """
+    Mixin para widgets que son solo la vista de una entidad del store.
+    El estado de simulación vive en el store; el widget se actualiza
+    una vez por frame con sync_view().
+    """
+    store: Optional[EntityStore] = None
+    entity_id: int = -1
+
+    def sync_view(self, x: float, y: float):
+        self.center = (x, y)
+
+    def place(self, x: float, y: float):
+        """Coloca la entidad (centro) y actualiza su vista."""
+        i = self.store.slot(self.entity_id)
+        self.store.x[i] = x
+        self.store.y[i] = y
+        self.sync_view(x, y)
+
+
+def column_property(name: str) -> property:
+    """Atributo respaldado por una columna del store de la entidad."""
+    def fget(self):
+        store = self.store
+        return getattr(store, name)[store.slot(self.entity_id)]
+
+    def fset(self, value):
+        store = self.store
+        getattr(store, name)[store.slot(self.entity_id)] = value
+
+    return property(fget, fset)
+
+
+def flag_property(flag: int, detached: Optional[bool] = None) -> property:
+    """
+    Booleano respaldado por un bit de la columna 'flags'.
+    Si 'detached' no es None, es el valor que se lee cuando la entidad
+    ya fue eliminada del store (p. ej. is_dead=True para enemigos retirados).
+    """
+    def fget(self):
+        store = self.store
+        if detached is not None and not store.alive(self.entity_id):
+            return detached
+        return bool(store.flags[store.slot(self.entity_id)] & flag)
+
+    def fset(self, value):
+        store = self.store
+        if detached is not None and not store.alive(self.entity_id):
+            return
+        i = store.slot(self.entity_id)
+        if value:
+            store.flags[i] |= flag
+        else:
+            store.flags[i] &= ~flag
+
+    return property(fget, fset)
@@ -0,0 +1,148 @@
+# game/frame.py
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from kivy.clock import Clock
+
+from game.profiler import profiler
+
+# Fases del frame, en orden de ejecución
+PHASE_INPUT = 0
+PHASE_AI = 1
+PHASE_PHYSICS = 2
+PHASE_COLLISION = 3
+PHASE_ANIMATION = 4
+PHASE_RENDER_SYNC = 5
+PHASES = (PHASE_INPUT, PHASE_AI, PHASE_PHYSICS, PHASE_COLLISION,
+          PHASE_ANIMATION, PHASE_RENDER_SYNC)
+PHASE_NAMES = ("input", "ai", "physics", "collision", "animation", "render_sync")
+# Claves de cada fase en el profiler de frames
+_PROFILE_KEYS = tuple("phase." + name for name in PHASE_NAMES)
+
+
+class _System:
+    __slots__ = ("callback", "interval", "elapsed")
+
+    def __init__(self, callback: Callable[[float], object], interval: Optional[float]):
+        self.callback = callback
+        self.interval = interval
+        self.elapsed = 0.0
+
+
+class FrameDispatcher:
+    """
+    Bucle de juego central de una pantalla: un único evento de Clock
+    que ejecuta los sistemas registrados por fases ordenadas
+    (input, IA, física, colisión, animación, sincronización de vistas).
+    Las entidades registran sus sistemas aquí en lugar de programar
+    sus propios eventos de Clock, así el número de eventos de Kivy no
+    crece con la cantidad de entidades.
+    """
+
+    def __init__(self, fps: float = 60.0):
+        self.fps = fps
+        self.frame = 0
+        self._event = None
+        self._next_handle = 0
+        self._phases: List[Dict[int, _System]] = [{} for _ in PHASES]
+        self._where: Dict[int, int] = {}
+        # SpriteAnimator compartido de este bucle (game.animation.shared_animator)
+        self.animator = None
+
+    # -----------------------------------------------------
+    # Registro de sistemas
+    # -----------------------------------------------------
+    def add(self, phase: int, callback: Callable[[float], object],
+            interval: Optional[float] = None) -> int:
+        """
+        Registra 'callback(dt)' en una fase. Con 'interval' se ejecuta
+        cada 'interval' segundos (p. ej. animación a 10 FPS) en vez de
+        cada frame. Devuelve un handle para remove().
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        self._phases[phase][handle] = _System(callback, interval)
+        self._where[handle] = phase
+        return handle
+
+    def remove(self, handle: int) -> bool:
+        phase = self._where.pop(handle, None)
+        if phase is None:
+            return False
+        del self._phases[phase][handle]
+        return True
+
+    def clear(self):
+        for systems in self._phases:
+            systems.clear()
+        self._where.clear()
+        self.animator = None
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    # -----------------------------------------------------
+    # Ejecución
+    # -----------------------------------------------------
+    @property
+    def running(self) -> bool:
+        return self._event is not None
+
+    def start(self):
+        if self._event is None:
+            self._event = Clock.schedule_interval(self.tick, 1.0 / self.fps)
+
+    def stop(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def tick(self, dt: float):
+        """Ejecuta un frame completo. También puede llamarse a mano."""
+        self.frame += 1
+        frame_start = t = profiler.begin()
+        for phase, systems in enumerate(self._phases):
+            # Copia: un sistema puede registrar o quitar otros durante el frame
+            for system in tuple(systems.values()):
+                if system.interval is None:
+                    system.callback(dt)
+                    continue
+                system.elapsed += dt
+                if system.elapsed >= system.interval:
+                    elapsed = system.elapsed
+                    # Sin ráfagas tras un frame largo: un disparo por frame
+                    system.elapsed %= system.interval
+                    system.callback(elapsed)
+            if t is not None and systems:
+                t = profiler.lap(_PROFILE_KEYS[phase], t)
+        if frame_start is not None:
+            profiler.lap("frame", frame_start)
+
+
+class FrameClient:
+    """
+    Mixin para objetos que registran sistemas en un FrameDispatcher.
+    Guarda los handles para poder darlos de baja todos juntos.
+    """
+
+    def register_system(self, dispatcher: Optional[FrameDispatcher], phase: int,
+                        callback: Callable[[float], object],
+                        interval: Optional[float] = None):
+        if dispatcher is None:
+            return
+        handles: List[Tuple[object, int]] = self.__dict__.setdefault("_frame_handles", [])
+        handles.append((dispatcher, dispatcher.add(phase, callback, interval)))
+
+    def register_animation(self, dispatcher: Optional[FrameDispatcher], sprite,
+                           frames: Sequence[str], interval: float,
+                           phase_offset: float = 0.0):
+        """Anima 'sprite' con el animador compartido del dispatcher."""
+        if dispatcher is None:
+            return
+        from game.animation import shared_animator
+        animator = shared_animator(dispatcher)
+        handles = self.__dict__.setdefault("_frame_handles", [])
+        handles.append((animator, animator.add(sprite, frames, interval, phase_offset)))
+
+    def unregister_systems(self):
+        # Dueños de los handles: el dispatcher o su animador compartido
+        for owner, handle in self.__dict__.pop("_frame_handles", []):
+            owner.remove(handle)
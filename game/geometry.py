@@ -37,4 +37,73 @@ def segment_intersects_rect(p1: Vec2, p2: Vec2, r: Rect) -> bool:
 
 def expand_rect(r: Rect, pad: float) -> Rect:
     x, y, w, h = r
-    return (x - pad, y - pad, w + 2*pad, h + 2*pad)
\ No newline at end of file
+    return (x - pad, y - pad, w + 2*pad, h + 2*pad)
+
+# =========================================================
+# API VECTORIZADA (NumPy)
+# Mismas reglas que las funciones escalares, pero evaluadas para
+# lotes completos: rects (N,4) como x, y, w, h; puntos (M,2).
+# NumPy se importa solo al usar estas funciones.
+# =========================================================
+
+def _np():
+    import numpy
+    return numpy
+
+
+def _as_rects(rects):
+    return _np().asarray(rects, dtype=float).reshape(-1, 4)
+
+
+def _as_points(points):
+    return _np().asarray(points, dtype=float).reshape(-1, 2)
+
+
+def rects_intersect_batch(a, b):
+    """Matriz (N,M) de solapamiento entre rects 'a' (N,4) y 'b' (M,4)."""
+    a = _as_rects(a)[:, None, :]
+    b = _as_rects(b)[None, :, :]
+    ax, ay, aw, ah = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    bx, by, bw, bh = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+    return ~((ax + aw <= bx) | (bx + bw <= ax) | (ay + ah <= by) | (by + bh <= ay))
+
+
+def points_in_rects(points, rects):
+    """Matriz (M,N): punto i dentro del rect j (bordes incluidos)."""
+    p = _as_points(points)[:, None, :]
+    r = _as_rects(rects)[None, :, :]
+    x, y = p[..., 0], p[..., 1]
+    rx, ry, rw, rh = r[..., 0], r[..., 1], r[..., 2], r[..., 3]
+    return (rx <= x) & (x <= rx + rw) & (ry <= y) & (y <= ry + rh)
+
+
+def _ccw(ax, ay, bx, by, cx, cy):
+    return (cy - ay) * (bx - ax) > (by - ay) * (cx - ax)
+
+
+def segments_intersect_batch(p1, p2, p3, p4):
+    """Matriz (M,K): segmento p1[i]-p2[i] cruza el segmento p3[j]-p4[j]."""
+    p1 = _as_points(p1)[:, None, :]
+    p2 = _as_points(p2)[:, None, :]
+    p3 = _as_points(p3)[None, :, :]
+    p4 = _as_points(p4)[None, :, :]
+    x1, y1 = p1[..., 0], p1[..., 1]
+    x2, y2 = p2[..., 0], p2[..., 1]
+    x3, y3 = p3[..., 0], p3[..., 1]
+    x4, y4 = p4[..., 0], p4[..., 1]
+    return ((_ccw(x1, y1, x3, y3, x4, y4) != _ccw(x2, y2, x3, y3, x4, y4)) &
+            (_ccw(x1, y1, x2, y2, x3, y3) != _ccw(x1, y1, x2, y2, x4, y4)))
+
+
+def segments_intersect_rects(p1, p2, rects):
+    """Matriz (M,N): segmento p1[i]-p2[i] toca el rect j."""
+    np = _np()
+    r = _as_rects(rects)
+    x, y, w, h = r[:, 0], r[:, 1], r[:, 2], r[:, 3]
+    # 4 aristas por rect, en el mismo orden que segment_intersects_rect
+    a = np.stack([np.stack([x, y], -1), np.stack([x + w, y], -1),
+                  np.stack([x + w, y + h], -1), np.stack([x, y + h], -1)], axis=1)
+    b = np.roll(a, -1, axis=1)
+    edges = segments_intersect_batch(p1, p2, a.reshape(-1, 2), b.reshape(-1, 2))
+    hits = edges.reshape(edges.shape[0], -1, 4).any(axis=-1)
+    return hits | points_in_rects(p1, r) | points_in_rects(p2, r)
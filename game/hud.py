@@ -0,0 +1,206 @@
+# game/hud.py
+from typing import Dict, List, Optional, Tuple
+
+from kivy.core.text import Label as CoreLabel
+from kivy.graphics import Color, Rectangle
+from kivy.properties import NumericProperty, OptionProperty, StringProperty
+from kivy.uix.widget import Widget
+
+# Caracteres de los campos numéricos (se rasterizan una sola vez por fuente)
+GLYPHS = "0123456789-"
+
+_strips: Dict[Tuple[str, float, bool], "GlyphStrip"] = {}
+
+
+def _render_text(text: str, font_name: str, font_size: float, bold: bool):
+    label = CoreLabel(text=text, font_name=font_name, font_size=font_size, bold=bold)
+    label.refresh()
+    return label.texture
+
+
+class GlyphStrip:
+    """
+    Los dígitos de una fuente rasterizados una vez en una sola textura (tira).
+    Cada dígito es una región de la tira: cambiar un número en pantalla es
+    cambiar la región (tex_coords) de un Rectangle, sin volver a renderizar
+    texto.
+    """
+
+    def __init__(self, font_name: str, font_size: float, bold: bool = False):
+        label = CoreLabel(text=GLYPHS, font_name=font_name, font_size=font_size, bold=bold)
+        label.refresh()
+        self.texture = label.texture
+        self.height = self.texture.height
+        # Inicio de cada carácter dentro de la tira (mismo layout que el render)
+        offsets = [label.get_extents(GLYPHS[:i])[0] for i in range(len(GLYPHS) + 1)]
+        self.regions: Dict[str, Tuple[object, int]] = {}
+        for i, ch in enumerate(GLYPHS):
+            x, w = offsets[i], offsets[i + 1] - offsets[i]
+            self.regions[ch] = (self.texture.get_region(x, 0, w, self.height), w)
+        # Las cifras se dibujan con el ancho del dígito más ancho (tabulares):
+        # así el texto de al lado no se corre cuando cambia el valor
+        self.advance = max(w for _, w in self.regions.values())
+
+
+def glyph_strip(font_name: str, font_size: float, bold: bool = False) -> GlyphStrip:
+    """Tira compartida por fuente/tamaño (los HUD de todas las pantallas la reutilizan)."""
+    key = (font_name, font_size, bold)
+    strip = _strips.get(key)
+    if strip is None:
+        strip = _strips[key] = GlyphStrip(font_name, font_size, bold)
+    return strip
+
+
+class _TextField:
+    """Texto fijo: se renderiza al crearlo y solo de nuevo si cambia."""
+
+    def __init__(self, line: "HudLine", text: str, bold: bool):
+        self.line = line
+        self.bold = bold
+        self.text: Optional[str] = None
+        self.rect = Rectangle()
+        self.set(text)
+
+    def set(self, text: str) -> bool:
+        if text == self.text:
+            return False
+        self.text = text
+        texture = _render_text(text, self.line.font_name, self.line.font_size, self.bold)
+        self.rect.texture = texture
+        self.rect.size = texture.size
+        return True
+
+    @property
+    def width(self) -> float:
+        return self.rect.size[0]
+
+    @property
+    def height(self) -> float:
+        return self.rect.size[1]
+
+    def place(self, x: float, y: float):
+        self.rect.pos = (x, y)
+
+
+class _NumberField:
+    """Entero dibujado con regiones de la tira de dígitos (un Rectangle por cifra)."""
+
+    def __init__(self, line: "HudLine", value: int, bold: bool):
+        self.line = line
+        self.strip = glyph_strip(line.font_name, line.font_size, bold)
+        self.value: Optional[int] = None
+        self.digits = ""
+        self.rects: List[Rectangle] = []
+        self.x = self.y = 0.0
+        self.set(value)
+
+    def set(self, value: int) -> bool:
+        """Devuelve True si cambió el ancho (hay que reubicar la línea)."""
+        value = int(value)
+        if value == self.value:
+            return False
+        self.value = value
+        digits = str(value)
+        resized = len(digits) != len(self.digits)
+        self.digits = digits
+        while len(self.rects) < len(digits):
+            rect = Rectangle()
+            self.rects.append(rect)
+            self.line.glyphs.add(rect)
+        for rect in self.rects[len(digits):]:
+            rect.size = (0, 0)
+        for rect, ch in zip(self.rects, digits):
+            rect.texture = self.strip.regions[ch][0]
+        if not resized:
+            self._place_digits()
+        return resized
+
+    @property
+    def width(self) -> float:
+        return self.strip.advance * len(self.digits)
+
+    @property
+    def height(self) -> float:
+        return self.strip.height
+
+    def place(self, x: float, y: float):
+        self.x, self.y = x, y
+        self._place_digits()
+
+    def _place_digits(self):
+        advance = self.strip.advance
+        height = self.strip.height
+        for i, (rect, ch) in enumerate(zip(self.rects, self.digits)):
+            glyph_w = self.strip.regions[ch][1]
+            # Cada cifra centrada en su celda de ancho fijo
+            rect.pos = (self.x + i * advance + (advance - glyph_w) / 2, self.y)
+            rect.size = (glyph_w, height)
+
+
+class HudLine(Widget):
+    """
+    Una línea de HUD armada con partes fijas y campos numéricos:
+        hud = HudLine(font_size="22sp", halign="center")
+        hud.add_text("Intentos: ", bold=True)
+        hud.add_number("attempts", 10)
+        ...
+        hud.set("attempts", 9)      # en cada frame: no hace nada si no cambió
+    Las partes fijas se renderizan una sola vez; los números solo cambian
+    regiones de la tira de dígitos. Reemplaza a un Label al que se le
+    asignaba el texto completo en cada frame.
+    """
+
+    # La fuente se fija al crear la línea (las partes se renderizan con ella)
+    font_size = NumericProperty("15sp")
+    font_name = StringProperty("Roboto")
+    halign = OptionProperty("left", options=["left", "center", "right"])
+    valign = OptionProperty("middle", options=["bottom", "middle", "top"])
+
+    def __init__(self, color=(1, 1, 1, 1), **kwargs):
+        super().__init__(**kwargs)
+        self._parts: List[object] = []
+        self._fields: Dict[str, object] = {}
+        # Todas las partes se dibujan en el canvas del widget, tras este Color
+        self.glyphs = self.canvas
+        with self.canvas:
+            Color(*color)
+        self.bind(pos=self._layout, size=self._layout)
+
+    def add_text(self, text: str, bold: bool = False, name: Optional[str] = None):
+        part = _TextField(self, text, bold)
+        self.glyphs.add(part.rect)
+        return self._add(part, name)
+
+    def add_number(self, name: str, value: int = 0, bold: bool = False):
+        return self._add(_NumberField(self, value, bold), name)
+
+    def _add(self, part, name: Optional[str]):
+        self._parts.append(part)
+        if name is not None:
+            self._fields[name] = part
+        self._layout()
+        return part
+
+    def set(self, name: str, value):
+        """Actualiza un campo (número o texto con nombre) solo si cambió."""
+        if self._fields[name].set(value):
+            self._layout()
+
+    def _layout(self, *args):
+        total = sum(part.width for part in self._parts)
+        height = max((part.height for part in self._parts), default=0)
+        if self.halign == "center":
+            x = self.x + (self.width - total) / 2
+        elif self.halign == "right":
+            x = self.right - total
+        else:
+            x = self.x
+        if self.valign == "top":
+            y = self.top - height
+        elif self.valign == "bottom":
+            y = self.y
+        else:
+            y = self.y + (self.height - height) / 2
+        for part in self._parts:
+            part.place(x, y)
+            x += part.width
@@ -3,7 +3,6 @@ import numpy as np
 import math
 from kivy.uix.widget import Widget
 from kivy.uix.image import Image
-from kivy.clock import Clock
 from kivy.graphics.texture import Texture
 from kivy.core.window import Window
 from kivy.uix.scatter import Scatter
@@ -12,10 +11,17 @@ from kivy.graphics import Color
 
 # Importamos el nivel base
 from game.trajectory_screen import TrajectoryGameScreen
+from game.lifecycle import Lifecycle
+from game.profiler import profiler, attach_overlay
+from game.log import get_logger
+
+log = get_logger("level3")
 
 class ARGameScreen(Widget):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Eventos de Clock de la pantalla (se cancelan en on_leave)
+        self.lifecycle = Lifecycle()
         
         # 1. Configuración de Cámara con OpenCV
         # Si usas DroidCam, prueba con indices 0, 1 o 2 si no abre a la primera.
@@ -77,7 +83,7 @@ class ARGameScreen(Widget):
             if hasattr(app, 'start_level3'):
                 app.start_level3()
             else:
-                print("Error: start_level3 no encontrado en App")
+                log.error("start_level3 no encontrado en App")
 
         # Reemplazamos el método de la instancia
         self.game_level.restart_level = custom_restart_ar
@@ -96,15 +102,30 @@ class ARGameScreen(Widget):
         self.add_widget(self.info_label)
 
         # 8. Bucle de actualización (30 FPS)
-        Clock.schedule_interval(self.update_frame, 1.0 / 30.0)
+        self.lifecycle.schedule_interval(self.update_frame, 1.0 / 30.0)
+
+    def on_enter(self):
+        # Tiempos por fase en pantalla (solo con PROFILE_FRAMES)
+        attach_overlay(self, self.lifecycle)
+
+    def on_leave(self):
+        """Al salir: detener la cámara y el nivel embebido"""
+        self.lifecycle.release()
+        # Un solo reporte con las fases de la cámara y las del nivel
+        profiler.dump_session("level3")
+        self.game_level.on_leave()
+        self.on_stop()
 
     def update_frame(self, dt):
+        t = profiler.begin()
         ret, frame = self.capture.read()
         if not ret:
             return
+        t = profiler.lap("ar.capture", t)
 
         # Detección de marcadores
         corners, ids, rejected = self.detector.detectMarkers(frame)
+        t = profiler.lap("ar.detect", t)
         
         detected = False
         if ids is not None:
@@ -121,15 +142,17 @@ class ARGameScreen(Widget):
             self.info_label.opacity = 1
             # Opcional: Ocultar juego si se pierde tracking
             # self.game_container.opacity = 0.5
+        # solvePnP + projectPoints
+        t = profiler.lap("ar.pose", t)
 
         # Renderizar frame en Kivy (Voltear verticalmente y crear textura)
         buf = cv2.flip(frame, 0).tobytes()
         tex = Texture.create(size=(frame.shape[1], frame.shape[0]), colorfmt='bgr')
         tex.blit_buffer(buf, colorfmt='bgr', bufferfmt='ubyte')
         self.camera_image.texture = tex
-        
-        # Actualizar lógica del juego
-        self.game_level.update(dt)
+        profiler.lap("ar.texture", t)
+        # La lógica del juego avanza en el bucle propio del nivel
+        # (game_level.dispatcher); llamarla aquí también la duplicaría.
 
     def process_marker_3d(self, corners_2d, frame):
         """Calcula posición, rotación y escala perpendicular al marcador"""
@@ -165,7 +188,8 @@ class ARGameScreen(Widget):
         try:
             img_points, _ = cv2.projectPoints(axis_points_3d, rvec, tvec, self.camera_matrix, self.dist_coeffs)
         except cv2.error as e:
-            print(f"Error projecting points: {e}")
+            # Corre en el bucle de 30 FPS: como mucho un aviso por segundo
+            log.warning("Error projecting points: %s", e, every=1.0)
             return
         
         p_base = img_points[0][0]
@@ -203,4 +227,5 @@ class ARGameScreen(Widget):
 
     def on_stop(self):
         if self.capture:
-            self.capture.release()
\ No newline at end of file
+            self.capture.release()
+            self.capture = None
\ No newline at end of file
@@ -0,0 +1,109 @@
+# game/lifecycle.py
+from typing import Callable, List, Tuple
+from weakref import WeakSet
+
+from kivy.animation import Animation
+from kivy.clock import Clock
+
+# Con True, cada cambio de pantalla imprime los eventos de Clock y los
+# binds de Window vivos (si suben partida tras partida, algo no se suelta)
+DEBUG_LIFECYCLE = False
+
+# Limpieza de eventos ya ejecutados (schedule_once) cada tantas altas
+_PRUNE_EVERY = 32
+
+_live: "WeakSet[Lifecycle]" = WeakSet()
+
+
+class Lifecycle:
+    """
+    Dueño de los eventos de Clock, binds y animaciones que crea una
+    pantalla o entidad. En lugar de llamar a Clock / bind directamente:
+        self.lifecycle = Lifecycle()
+        self.lifecycle.schedule_interval(self.update, 1 / 60)
+        self.lifecycle.bind(Window, size=self._on_window_size)
+    y al salir (on_leave) un solo release() lo cancela y desvincula todo.
+    El mismo objeto puede volver a usarse después (p. ej. al reentrar).
+    """
+
+    def __init__(self):
+        self._events: List[object] = []
+        self._triggers: List[object] = []
+        self._binds: List[Tuple[object, str, int]] = []
+        self._animations: List[Tuple[Animation, object]] = []
+        self._added = 0
+        _live.add(self)
+
+    # -----------------------------------------------------
+    # Clock
+    # -----------------------------------------------------
+    def _track(self, event):
+        self._events.append(event)
+        self._added += 1
+        if self._added % _PRUNE_EVERY == 0:
+            # Los schedule_once ya ejecutados no hace falta cancelarlos
+            self._events = [e for e in self._events if e.is_triggered]
+        return event
+
+    def schedule_interval(self, callback: Callable, interval: float):
+        return self._track(Clock.schedule_interval(callback, interval))
+
+    def schedule_once(self, callback: Callable, timeout: float = 0):
+        return self._track(Clock.schedule_once(callback, timeout))
+
+    def create_trigger(self, callback: Callable, timeout: float = 0):
+        # Un trigger se reprograma muchas veces: se guarda aparte, sin podar
+        trigger = Clock.create_trigger(callback, timeout)
+        self._triggers.append(trigger)
+        return trigger
+
+    # -----------------------------------------------------
+    # Binds y animaciones
+    # -----------------------------------------------------
+    def bind(self, target, **handlers):
+        """Como target.bind(**handlers), pero se deshace en release()."""
+        for name, callback in handlers.items():
+            uid = target.fbind(name, callback)
+            if uid:
+                self._binds.append((target, name, uid))
+
+    def animate(self, animation: Animation, widget):
+        """Inicia 'animation' sobre 'widget'; release() la cancela."""
+        animation.start(widget)
+        self._animations.append((animation, widget))
+        return animation
+
+    # -----------------------------------------------------
+    # Liberación
+    # -----------------------------------------------------
+    def release(self):
+        """Cancela eventos y animaciones y deshace todos los binds."""
+        for event in self._events + self._triggers:
+            event.cancel()
+        for target, name, uid in self._binds:
+            target.unbind_uid(name, uid)
+        for animation, widget in self._animations:
+            animation.cancel(widget)
+        self._events.clear()
+        self._triggers.clear()
+        self._binds.clear()
+        self._animations.clear()
+
+    def __len__(self) -> int:
+        return (sum(1 for e in self._events + self._triggers if e.is_triggered)
+                + len(self._binds) + len(self._animations))
+
+
+def window_bindings() -> int:
+    """Callbacks enlazados a eventos y propiedades de Window."""
+    from kivy.core.window import Window
+    return sum(len(Window.get_property_observers(name))
+               for name in list(Window.events()) + list(Window.properties()))
+
+
+def report_live(label: str):
+    """Imprime los eventos de Clock y binds de Window vivos (modo debug)."""
+    owned = sum(len(lifecycle) for lifecycle in _live)
+    print(f"🔎 [{label}] Clock: {len(Clock.get_events())} eventos | "
+          f"Window: {window_bindings()} binds | Lifecycle: {len(_live)} dueños, "
+          f"{owned} registros")
@@ -0,0 +1,143 @@
+# game/log.py
+import atexit
+import queue
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# Niveles (mismos valores que el módulo logging de Python)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+_LEVEL_TAGS = {DEBUG: "D", INFO: "I", WARNING: "W", ERROR: "E"}
+
+# Nivel mínimo que se escribe. Lo que queda por debajo no cuesta nada:
+# el método del nivel es una función vacía (los argumentos no se formatean).
+# En Android conviene WARNING: logcat es síncrono y se nota en el frame.
+LOG_LEVEL = INFO
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+class _Writer:
+    """Hilo que formatea y escribe los registros (el frame solo encola)."""
+
+    def __init__(self):
+        self._queue: "queue.SimpleQueue[Optional[tuple]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def put(self, record: tuple):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="log", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.flush)
+        self._queue.put(record)
+
+    def _run(self):
+        while True:
+            record = self._queue.get()
+            if record is None:
+                continue
+            if isinstance(record, threading.Event):
+                record.set()
+                continue
+            sys.stdout.write(_format(record))
+            sys.stdout.flush()
+
+    def flush(self, timeout: float = 1.0):
+        """Espera a que se escriba lo encolado (p. ej. al cerrar la app)."""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+
+def _format(record: tuple) -> str:
+    level, name, stamp, msg, args, fields, suppressed = record
+    if args:
+        try:
+            msg = msg % args
+        except (TypeError, ValueError):
+            msg = f"{msg} {args!r}"
+    text = f"[{_LEVEL_TAGS.get(level, level)}] {name}: {msg}"
+    if fields:
+        text += " | " + " ".join(f"{k}={v}" for k, v in fields.items())
+    if suppressed:
+        text += f" (+{suppressed} omitidos)"
+    return text + "\n"
+
+
+_writer = _Writer()
+_loggers: Dict[str, "GameLog"] = {}
+
+
+class GameLog:
+    """
+    Log con niveles y límite de frecuencia por punto de llamada:
+        log = get_logger(__name__)
+        log.debug("Flocking force: (%.2f, %.2f)", fx, fy, every=1.0)
+        log.info("Nivel terminado", won=True, attempts=3)
+    - Los argumentos se formatean en el hilo de escritura, no en el frame.
+    - 'every' (segundos): como mucho un registro por intervalo en ese
+      punto de llamada (se identifica por el mensaje); los omitidos se
+      cuentan y se informan en el siguiente.
+    - Los campos con nombre (**fields) salen como clave=valor.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        # Punto de llamada -> (último registro, omitidos desde entonces)
+        self._last: Dict[Tuple[int, str], Tuple[float, int]] = {}
+        self._apply_level(LOG_LEVEL)
+
+    def _apply_level(self, level: int):
+        self.level = level
+        for value, method in ((DEBUG, "debug"), (INFO, "info"),
+                              (WARNING, "warning"), (ERROR, "error")):
+            setattr(self, method, self._emitter(value) if value >= level else _noop)
+
+    def enabled_for(self, level: int) -> bool:
+        """Para no calcular argumentos caros cuando el nivel está apagado."""
+        return level >= self.level
+
+    def _emitter(self, level: int):
+        def emit(msg: str, *args, every: Optional[float] = None, **fields):
+            suppressed = 0
+            if every is not None:
+                now = time.monotonic()
+                key = (level, msg)
+                last, skipped = self._last.get(key, (None, 0))
+                if last is not None and now - last < every:
+                    self._last[key] = (last, skipped + 1)
+                    return
+                self._last[key] = (now, 0)
+                suppressed = skipped
+            _writer.put((level, self.name, time.time(), msg, args, fields, suppressed))
+        return emit
+
+
+def get_logger(name: str) -> GameLog:
+    log = _loggers.get(name)
+    if log is None:
+        log = _loggers[name] = GameLog(name)
+    return log
+
+
+def set_level(level: int):
+    """Cambia el nivel de todos los logs (los métodos apagados vuelven a ser no-op)."""
+    global LOG_LEVEL
+    LOG_LEVEL = level
+    for log in _loggers.values():
+        log._apply_level(level)
+
+
+def flush(timeout: float = 1.0):
+    _writer.flush(timeout)
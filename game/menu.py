@@ -4,7 +4,6 @@ from kivy.uix.label import Label
 from kivy.uix.image import Image
 from kivy.graphics import Rectangle, Color, RoundedRectangle, Ellipse
 from kivy.core.window import Window
-from kivy.clock import Clock
 from kivy.animation import Animation
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout           # <-- FALTABAN ESTOS IMPORTS
@@ -13,6 +12,10 @@ from kivy.uix.gridlayout import GridLayout  # NUEVO
 
 import random
 
+from game.animation import SpriteAnimator
+from game.lifecycle import Lifecycle
+from game.assets import assets, asset_source
+
 
 class MenuButton(Button):
     """Botón personalizado para el menú con efectos mejorados"""
@@ -120,10 +123,10 @@ class MainMenu(Widget):
         # Fondo del menú con efecto
         with self.canvas.before:
             self.bg = Rectangle(
-                source="images/fondo1.png",
                 size=(Window.width, Window.height),
                 pos=(0, 0)
             )
+            assets.bind_texture(self.bg, "fondo1", size=Window.size)
             # Overlay con gradiente oscuro
             Color(0, 0, 0, 0.55)
             self.overlay = Rectangle(
@@ -166,51 +169,50 @@ class MainMenu(Widget):
         )
         self.add_widget(self.subtitle)
         
-        # Animación del título
-        self.animate_title()
-        
         # Sprites animados decorativos (jugador)
         self.player_sprites = []
         self.animation_frames_player = [
-            "images/ave1.png",
-            "images/ave2.png",
-            "images/ave3.png",
-            "images/ave4.png"
+            "ave1",
+            "ave2",
+            "ave3",
+            "ave4"
         ]
-        self.current_frame_player = 0
-        
+        # Reloj de animación compartido para todos los sprites decorativos
+        self.animator = SpriteAnimator()
+
         for i in range(2):
             sprite = Image(
-                source=self.animation_frames_player[0],
+                source=asset_source(self.animation_frames_player[0]),
                 size_hint=(None, None),
                 size=(110, 110),
                 pos=(30 + i * (Window.width - 140), Window.height - 320)
             )
             self.add_widget(sprite)
             self.player_sprites.append(sprite)
+            self.animator.add(sprite, self.animation_frames_player, 0.15)
         
         # Sprites animados decorativos (enemigos)
         self.enemy_sprites = []
         self.animation_frames_enemy = [
-            "images/enemigo1.png",
-            "images/enemigo2.png",
-            "images/enemigo3.png",
-            "images/enemigo4.png"
+            "enemigo1",
+            "enemigo2",
+            "enemigo3",
+            "enemigo4"
         ]
-        self.current_frame_enemy = 0
         
         for i in range(3):
             sprite = Image(
-                source=self.animation_frames_enemy[0],
+                source=asset_source(self.animation_frames_enemy[0]),
                 size_hint=(None, None),
                 size=(85, 85),
                 pos=(80 + i * 180, 90)
             )
             self.add_widget(sprite)
             self.enemy_sprites.append(sprite)
+            self.animator.add(sprite, self.animation_frames_enemy, 0.15)
         
-        # Iniciar animaciones de sprites
-        Clock.schedule_interval(self.animate_sprites, 0.15)
+        # Las animaciones corren solo mientras el menú se ve (on_enter/on_leave)
+        self.lifecycle = Lifecycle()
         
         # Botones del menú con mejor espaciado
         button_y = Window.height / 2 + 80
@@ -246,30 +248,31 @@ class MainMenu(Widget):
         )
         self.add_widget(self.version_label)
     
+    def on_enter(self):
+        """Reanuda las animaciones al volver a mostrar el menú"""
+        self.animate_title()
+        self.lifecycle.schedule_interval(self.animate_sprites, 0.15)
+
+    def on_leave(self):
+        """Pausa las animaciones mientras el menú está oculto (queda en caché)"""
+        self.lifecycle.release()
+
     def animate_title(self):
         """Animación pulsante del título mejorada"""
         anim = (Animation(font_size=56, duration=1.2) +
                 Animation(font_size=52, duration=1.2))
         anim.repeat = True
-        anim.start(self.title)
+        self.lifecycle.animate(anim, self.title)
         
         # Animar también la sombra
         anim_shadow = (Animation(font_size=58, duration=1.2) +
                        Animation(font_size=54, duration=1.2))
         anim_shadow.repeat = True
-        anim_shadow.start(self.title_shadow)
+        self.lifecycle.animate(anim_shadow, self.title_shadow)
     
     def animate_sprites(self, dt):
-        """Anima los sprites decorativos"""
-        # Animar jugadores
-        self.current_frame_player = (self.current_frame_player + 1) % len(self.animation_frames_player)
-        for sprite in self.player_sprites:
-            sprite.source = self.animation_frames_player[self.current_frame_player]
-        
-        # Animar enemigos
-        self.current_frame_enemy = (self.current_frame_enemy + 1) % len(self.animation_frames_enemy)
-        for sprite in self.enemy_sprites:
-            sprite.source = self.animation_frames_enemy[self.current_frame_enemy]
+        """Anima los sprites decorativos (jugadores y enemigos)"""
+        self.animator.tick(dt)
     
     def start_game(self, instance):
         """Inicia el juego"""
@@ -372,10 +375,10 @@ class LevelScreen(Widget):
         # Fondo
         with self.canvas.before:
             self.bg = Rectangle(
-                source="images/fondo1.png",
                 size=(Window.width, Window.height),
                 pos=(0, 0)
             )
+            assets.bind_texture(self.bg, "fondo1", size=Window.size)
             Color(0, 0, 0, 0.65)
             self.overlay = Rectangle(
                 size=(Window.width, Window.height),
@@ -425,10 +428,10 @@ class InstructionsScreen(Widget):
         # Fondo
         with self.canvas.before:
             self.bg = Rectangle(
-                source="images/fondo1.png",
                 size=(Window.width, Window.height),
                 pos=(0, 0)
             )
+            assets.bind_texture(self.bg, "fondo1", size=Window.size)
             Color(0, 0, 0, 0.75)
             self.overlay = Rectangle(
                 size=(Window.width, Window.height),
@@ -1,16 +1,18 @@
 # game/physics_projectile.py
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple, Union
 from kivy.uix.image import Image
 from kivy.properties import NumericProperty, BooleanProperty
 
 from .geometry import Rect
-from .collision import move_with_collisions
+from .spatial import WallGrid
+from .collision import sweep_move
+from .pool import Poolable
 
 
-class PhysicsProjectile(Image):
+class PhysicsProjectile(Poolable, Image):
     """
     Proyectil balístico con gravedad y colisiones vs paredes (AABB).
-    - Llama update_with_walls(dt, walls, on_impact)
+    - Llama update_with_walls(dt, walls, on_impact); 'walls' puede ser un WallGrid
     - Si 'bounce_enabled' es False (por defecto), se destruye al impactar.
       Si es True, rebota con restitución 'restitution'.
     """
@@ -43,14 +45,29 @@ class PhysicsProjectile(Image):
         if not hasattr(self, "alive"):
             self.alive = True
 
+    def reset(
+        self,
+        center: Tuple[float, float] = (0.0, 0.0),
+        velocity: Tuple[float, float] = (0.0, 0.0),
+        gravity: float = -980.0,
+    ):
+        """(Re)lanza el proyectil desde 'center' (reutilización desde un ObjectPool)."""
+        self.center = center
+        self.velocity_x = float(velocity[0])
+        self.velocity_y = float(velocity[1])
+        self.gravity = gravity
+        self.alive = True
+        self.life = 0.0
+
     def update_with_walls(
         self,
         dt: float,
-        walls: List[Rect],
+        walls: Union[List[Rect], WallGrid],
         on_impact: Optional[Callable[[float, float], None]] = None,
     ):
         """
         Integra gravedad y aplica movimiento con colisiones contra paredes.
+        'walls' acepta la lista de rectángulos o un WallGrid precalculado.
         Si hay impacto:
           - bounce_enabled=False: se destruye y dispara callback on_impact.
           - bounce_enabled=True: rebota con pérdida (restitution).
@@ -62,11 +79,11 @@ class PhysicsProjectile(Image):
         # 1) Integración de gravedad
         self.velocity_y += self.gravity * dt
 
-        # 2) Movimiento con colisiones (AABB del sprite actual)
+        # 2) Movimiento con barrido continuo (AABB del sprite actual)
         w = max(1.0, float(self.width))
         h = max(1.0, float(self.height))
 
-        nx, ny, nvx, nvy, collided = move_with_collisions(
+        nx, ny, hit = sweep_move(
             self.x,
             self.y,
             w,
@@ -77,21 +94,18 @@ class PhysicsProjectile(Image):
             walls,
         )
 
-        # 3) Aplicar posiciones
+        # 3) Aplicar posiciones (en el punto exacto de contacto si lo hubo)
         self.x, self.y = nx, ny
 
-        if collided:
+        if hit is not None:
             if self.bounce_enabled:
-                # Si el resolver anuló una componente, invertimos la original con restitución
-                if nvx == 0.0 and abs(self.velocity_x) > 1e-3:
-                    self.velocity_x = -self.velocity_x * float(self.restitution)
-                else:
-                    self.velocity_x = nvx
-
-                if nvy == 0.0 and abs(self.velocity_y) > 1e-3:
-                    self.velocity_y = -self.velocity_y * float(self.restitution)
-                else:
-                    self.velocity_y = nvy
+                # Reflejar la componente normal con restitución; la tangencial se conserva
+                nxn, nyn = hit.normal
+                vn = self.velocity_x * nxn + self.velocity_y * nyn
+                if vn < 0.0:
+                    k = (1.0 + float(self.restitution)) * vn
+                    self.velocity_x -= k * nxn
+                    self.velocity_y -= k * nyn
 
                 # Si la energía es muy baja, damos por terminado
                 if (self.velocity_x ** 2 + self.velocity_y ** 2) < 25.0:
@@ -103,10 +117,6 @@ class PhysicsProjectile(Image):
                 self.alive = False
                 if on_impact:
                     on_impact(self.center_x, self.center_y)
-        else:
-            # Sin colisión: simplemente actualizamos velocidades resueltas
-            self.velocity_x = nvx
-            self.velocity_y = nvy
 
     # (Opcional) método 'update' para compatibilidad si en otro lado lo llaman
     def update(self, dt: float):
@@ -2,29 +2,29 @@ from kivy.uix.widget import Widget
 from kivy.uix.image import Image
 from kivy.properties import NumericProperty
 from kivy.core.window import Window
-from kivy.clock import Clock
+from game.frame import FrameClient
+from game.assets import asset_source
 
 
-class Player(Widget):
+class Player(FrameClient, Widget):
     target_x = NumericProperty(0)
     target_y = NumericProperty(0)
 
-    def __init__(self, **kwargs):
+    def __init__(self, dispatcher=None, **kwargs):
         super().__init__(**kwargs)
 
         # --- Animación del jugador ---
         # Lista de imágenes para la animación. Asegúrate que estén en esta ruta.
         self.animation_frames = [
-            "images/ave1.png",
-            "images/ave2.png",
-            "images/ave3.png",
-            "images/ave4.png"
+            "ave1",
+            "ave2",
+            "ave3",
+            "ave4"
         ]
-        self.current_frame = 0
         self.animation_speed = 0.1  # Cambia de imagen cada 0.1 segundos (10 FPS)
 
         # Inicializar el sprite con la primera imagen de la animación
-        self.sprite = Image(source=self.animation_frames[self.current_frame], size_hint=(None, None))
+        self.sprite = Image(source=asset_source(self.animation_frames[0]), size_hint=(None, None))
         # ----------------------------------------------
 
         self.sprite.size = (160, 160)
@@ -36,17 +36,9 @@ class Player(Widget):
         self.target_y = self.center_y
         self.update_sprite()
 
-        Clock.schedule_interval(self.update, 1 / 60)
-
-        # --- Iniciar el ciclo de animación ---
-        Clock.schedule_interval(self.animate_player, self.animation_speed)
-        # ----------------------------------------------------
-
-    def animate_player(self, dt):
-        """Cambia el sprite del jugador para crear una animación de aleteo."""
-        # Avanza al siguiente frame y vuelve al inicio si llega al final (loop)
-        self.current_frame = (self.current_frame + 1) % len(self.animation_frames)
-        self.sprite.source = self.animation_frames[self.current_frame]
+        # El movimiento (update) lo ejecuta la pantalla en su fase de física;
+        # aquí solo se registra el aleteo en el animador compartido de la pantalla
+        self.register_animation(dispatcher, self.sprite, self.animation_frames, self.animation_speed)
 
     def update_sprite(self):
         self.sprite.center_x = self.center_x
@@ -0,0 +1,84 @@
+# game/pool.py
+from typing import Callable, Generic, List, TypeVar
+
+T = TypeVar("T")
+
+
+class Poolable:
+    """
+    Mixin para objetos reutilizables por un ObjectPool.
+    - reset(**kwargs) deja el objeto como recién creado (lo llama acquire()).
+    - on_release() lo desconecta de la escena (lo llama release()).
+    """
+
+    def reset(self, **kwargs):
+        # Sin estado propio: cada clase reutilizable lo redefine con sus
+        # parámetros de construcción (un mixin de Widget no puede ser ABC,
+        # la metaclase de Kivy no se combina con ABCMeta)
+        pass
+
+    def on_release(self):
+        # Bajas comunes: sistemas del dispatcher, store y árbol de widgets
+        unregister = getattr(self, "unregister_systems", None)
+        if unregister is not None:
+            unregister()
+        store = getattr(self, "store", None)
+        if store is not None and self in store:
+            store.remove(self)
+        parent = getattr(self, "parent", None)
+        if parent is not None:
+            parent.remove_widget(self)
+
+
+class ObjectPool(Generic[T]):
+    """
+    Pool de objetos con semántica acquire/release.
+    'factory()' crea un objeto en blanco; acquire(**kwargs) reutiliza uno
+    libre (o crea uno nuevo) y lo configura con reset(**kwargs).
+    Se guardan como máximo 'high_water' objetos libres: los que sobran
+    al liberar se descartan para no retener memoria tras un pico.
+    """
+
+    def __init__(self, factory: Callable[[], T], high_water: int = 32):
+        if high_water < 0:
+            raise ValueError("high_water no puede ser negativo")
+        self.factory = factory
+        self.high_water = high_water
+        self._free: List[T] = []
+        # Estadísticas (útiles para ajustar prewarm/high_water)
+        self.created = 0
+        self.reused = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """Objetos libres disponibles."""
+        return len(self._free)
+
+    def prewarm(self, count: int):
+        """Crea objetos por adelantado (al inicio del nivel) hasta 'count' libres."""
+        count = min(count, self.high_water)
+        while len(self._free) < count:
+            obj = self.factory()
+            self.created += 1
+            obj.on_release()
+            self._free.append(obj)
+
+    def acquire(self, **kwargs) -> T:
+        if self._free:
+            obj = self._free.pop()
+            self.reused += 1
+        else:
+            obj = self.factory()
+            self.created += 1
+        obj.reset(**kwargs)
+        return obj
+
+    def release(self, obj: T):
+        obj.on_release()
+        if len(self._free) < self.high_water:
+            self._free.append(obj)
+        else:
+            self.dropped += 1
+
+    def clear(self):
+        self._free.clear()
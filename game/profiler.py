@@ -0,0 +1,176 @@
+# game/profiler.py
+import csv
+import json
+import os
+import time
+from array import array
+from typing import Dict, List, Optional
+
+from kivy.uix.label import Label
+
+from game.log import get_logger
+
+log = get_logger("profiler")
+
+# Medición de tiempos por fase del frame. Apagado no cuesta casi nada:
+# begin() devuelve None y lap() retorna enseguida.
+PROFILE_FRAMES = False
+# Con la medición activa: tabla p50/p95/p99 sobre la pantalla de juego
+PROFILE_OVERLAY = True
+# Frames que guarda el buffer circular de cada fase (~10 s a 60 FPS)
+PROFILE_CAPACITY = 600
+
+
+def _percentile(values: List[float], p: float) -> float:
+    """Percentil con interpolación lineal (p en 0..100) de valores ordenados."""
+    k = (len(values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+class _Ring:
+    """Buffer circular de tamaño fijo (segundos) sin reservar memoria al medir."""
+    __slots__ = ("values", "index", "count")
+
+    def __init__(self, capacity: int):
+        self.values = array("d", bytes(8 * capacity))
+        self.index = 0
+        self.count = 0
+
+    def add(self, value: float):
+        self.values[self.index] = value
+        self.index = (self.index + 1) % len(self.values)
+        self.count += 1
+
+    def samples(self) -> List[float]:
+        if self.count < len(self.values):
+            return self.values[:self.count].tolist()
+        return (self.values[self.index:] + self.values[:self.index]).tolist()
+
+
+class FrameProfiler:
+    """
+    Tiempos por fase del frame en buffers circulares. Uso en un bucle:
+        t = profiler.begin()
+        ...fondo...
+        t = profiler.lap("update.scroll", t)
+        ...enemigos...
+        t = profiler.lap("update.enemies", t)
+    FrameDispatcher mide además cada una de sus fases ("phase.ai", ...)
+    y el frame completo ("frame").
+    """
+
+    def __init__(self, enabled: bool = PROFILE_FRAMES, capacity: int = PROFILE_CAPACITY):
+        self.enabled = enabled
+        self.capacity = capacity
+        self._rings: Dict[str, _Ring] = {}
+        # Carpeta donde dump_session() deja un JSON por pantalla (None = no guardar)
+        self.dump_dir: Optional[str] = None
+
+    def begin(self) -> Optional[float]:
+        return time.perf_counter() if self.enabled else None
+
+    def lap(self, name: str, start: Optional[float], exclude: float = 0.0) -> Optional[float]:
+        """
+        Registra el tiempo desde 'start' (menos 'exclude', lo ya contado en
+        otra fase) en 'name' y devuelve el nuevo inicio.
+        """
+        if start is None:
+            return None
+        now = time.perf_counter()
+        self.add(name, now - start - exclude)
+        return now
+
+    def since(self, start: Optional[float]) -> float:
+        """Segundos desde 'start' (0.0 si no se mide): para sumar tramos sueltos."""
+        return 0.0 if start is None else time.perf_counter() - start
+
+    def add(self, name: str, seconds: float):
+        if not self.enabled:
+            return
+        ring = self._rings.get(name)
+        if ring is None:
+            ring = self._rings[name] = _Ring(self.capacity)
+        ring.add(seconds)
+
+    def reset(self):
+        self._rings.clear()
+
+    # -----------------------------------------------------
+    # Reportes
+    # -----------------------------------------------------
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """{fase: {n, mean, p50, p95, p99, max}} en milisegundos."""
+        result = {}
+        for name in sorted(self._rings):
+            values = sorted(v * 1000 for v in self._rings[name].samples())
+            if not values:
+                continue
+            result[name] = {
+                "n": len(values),
+                "mean": sum(values) / len(values),
+                "p50": _percentile(values, 50),
+                "p95": _percentile(values, 95),
+                "p99": _percentile(values, 99),
+                "max": values[-1],
+            }
+        return result
+
+    def dump(self, path: str):
+        """Guarda el reporte en CSV o JSON (según la extensión de 'path')."""
+        report = self.report()
+        if path.endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["phase", "n", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"])
+                for name, s in report.items():
+                    writer.writerow([name, s["n"]] + [f"{s[k]:.4f}" for k in
+                                                       ("mean", "p50", "p95", "p99", "max")])
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"unit": "ms", "phases": report}, f, indent=2)
+        log.info("⏱️  Perfil de frames guardado en %s", path)
+
+    def dump_session(self, label: str):
+        """Al salir de una pantalla: guarda su reporte (si hay dump_dir) y reinicia."""
+        if not self.enabled or not self._rings:
+            return
+        if self.dump_dir:
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            self.dump(os.path.join(self.dump_dir, f"frames-{label}-{stamp}.json"))
+        self.reset()
+
+    def summary(self) -> str:
+        """Texto corto para el overlay: una línea por fase."""
+        lines = [f"{'fase':<18}{'p50':>6}{'p95':>6}{'p99':>6}"]
+        for name, s in self.report().items():
+            lines.append(f"{name:<18}{s['p50']:>6.2f}{s['p95']:>6.2f}{s['p99']:>6.2f}")
+        return "\n".join(lines)
+
+
+# Instancia compartida (hay una sola pantalla de juego a la vez)
+profiler = FrameProfiler()
+
+
+class ProfilerOverlay(Label):
+    """Tabla de tiempos por fase (ms) en la esquina inferior izquierda."""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("font_name", "RobotoMono-Regular")
+        super().__init__(font_size="11sp", color=(0.6, 1, 0.6, 1), halign="left",
+                         valign="bottom", size_hint=(None, None), pos=(6, 6), **kwargs)
+        self.bind(texture_size=self.setter("size"))
+
+    def refresh(self, dt=None):
+        self.text = profiler.summary()
+
+
+def attach_overlay(screen, lifecycle):
+    """Agrega el overlay a 'screen' si se está midiendo (se refresca 2 veces/s)."""
+    if not (profiler.enabled and PROFILE_OVERLAY):
+        return None
+    overlay = ProfilerOverlay()
+    screen.add_widget(overlay)
+    lifecycle.schedule_interval(overlay.refresh, 0.5)
+    return overlay
@@ -2,53 +2,62 @@ from kivy.uix.widget import Widget
 from kivy.uix.image import Image
 from kivy.core.window import Window
 import math
+from game.entities import EntityStore, EntityView, column_property
+from game.pool import Poolable
+from game.assets import asset_source
 
 
-class Projectile(Widget):
-    def __init__(self, start_x, start_y, target_x, target_y, **kwargs):
+class Projectile(Poolable, EntityView, Widget):
+    # Estado de simulación guardado en el EntityStore (la vista solo dibuja)
+    velocity_x = column_property('vx')
+    velocity_y = column_property('vy')
+
+    def __init__(self, start_x=0, start_y=0, target_x=0, target_y=0, store=None, **kwargs):
         super().__init__(**kwargs)
-        
+
         # Sprite del proyectil (IMPORTANTE: crear nuevo Image independiente)
         self.sprite = Image(
-            source="images/huevo.png", 
+            source=asset_source("huevo"),
             size_hint=(None, None),
             size=(40, 40)
         )
         self.add_widget(self.sprite)
-        
-        # Posición inicial del proyectil
-        self.center_x = start_x
-        self.center_y = start_y
-        
+        self.radius = self.sprite.width / 2
+
+        self.reset(start_x=start_x, start_y=start_y,
+                   target_x=target_x, target_y=target_y, store=store)
+
+    def reset(self, start_x=0, start_y=0, target_x=0, target_y=0, store=None):
+        """(Re)inicia el proyectil; el sprite se conserva entre usos del pool"""
         # Calcular dirección hacia el objetivo
         dx = target_x - start_x
         dy = target_y - start_y
         dist = math.sqrt(dx**2 + dy**2)
-        
+
         if dist > 0:
-            self.velocity_x = (dx / dist) * 8  # Velocidad del proyectil
-            self.velocity_y = (dy / dist) * 8
+            velocity_x = (dx / dist) * 8  # Velocidad del proyectil
+            velocity_y = (dy / dist) * 8
         else:
-            self.velocity_x = 0
-            self.velocity_y = -8
-        
-        self.update_sprite()
-    
+            velocity_x = 0
+            velocity_y = -8
+
+        # Registro en el store con la posición inicial del proyectil
+        if store is None:
+            store = EntityStore()
+        store.create(view=self, x=start_x, y=start_y, vx=velocity_x, vy=velocity_y)
+        self.sync_view(start_x, start_y)
+
     def update_sprite(self):
         """Actualiza la posición visual del sprite del proyectil"""
-        self.sprite.center_x = self.center_x
-        self.sprite.center_y = self.center_y
-    
-    def update(self, dt):
-        """Actualiza la posición del proyectil cada frame"""
-        # Mover el proyectil
-        self.center_x += self.velocity_x
-        self.center_y += self.velocity_y
-        
-        # Verificar si salió de la pantalla
-        if (self.center_x < -50 or self.center_x > Window.width + 50 or
-            self.center_y < -50 or self.center_y > Window.height + 50):
-            return False  # Marcar para eliminar
-        
-        self.update_sprite()
-        return True
\ No newline at end of file
+        self.sprite.center = self.center
+
+    def sync_view(self, x, y):
+        """Vuelca la posición del store al widget (una vez por frame)"""
+        self.center = (x, y)
+        self.sprite.center = (x, y)
+
+
+def out_of_screen(x, y, margin=50):
+    """True si el centro (x, y) quedó fuera de la ventana (con margen)"""
+    return (x < -margin or x > Window.width + margin or
+            y < -margin or y > Window.height + margin)
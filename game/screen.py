@@ -1,67 +1,102 @@
 from kivy.uix.widget import Widget
-from kivy.uix.label import Label
-from kivy.clock import Clock
-from kivy.properties import NumericProperty, StringProperty
+from kivy.properties import NumericProperty
 from kivy.app import App
-from kivy.graphics import Rectangle
 from kivy.core.window import Window
+from kivy.animation import Animation
 import math, random
 
 from game.player import Player
 from game.enemy import Enemy
-from game.projectile import Projectile
+from game.projectile import Projectile, out_of_screen
+from game.entities import EntityStore, FLAG_HOMING
 from game.overlays import PauseMenu, GameOverMenu, PauseButton
-from game.utils import apply_flocking
+from game.utils import apply_flocking, apply_flocking_batch, numpy_available
+from game.spatial import NeighborGrid
+from game.pool import ObjectPool
+from game.assets import assets
+from game.lifecycle import Lifecycle
+from game.profiler import profiler, attach_overlay
+from game.log import get_logger, DEBUG
+from game.hud import HudLine
+from game.background import BackgroundScroller
+from game.sprite_batch import SpriteBatch, RENDER_MODE_WIDGETS, RENDER_MODE_BATCH, fit_size
+from game.frame import (FrameDispatcher, PHASE_AI, PHASE_PHYSICS, PHASE_COLLISION,
+                        PHASE_RENDER_SYNC)
+
+# Fondo infinito: al llegar al final de la imagen vuelve a empezar
+# (con False se detiene en el borde derecho, como antes)
+BACKGROUND_WRAP = False
+
+log = get_logger("level1")
 
 class GameScreen(Widget):
     score = NumericProperty(0)
-    score_text = StringProperty("Score: 0")
 
-    def __init__(self, **kwargs):
+    def __init__(self, render_mode=RENDER_MODE_WIDGETS, **kwargs):
         super().__init__(**kwargs)
 
         # Estado del juego
         self.is_paused = False
         self.game_over = False
 
+        # Dibujo de enemigos/proyectiles: un widget por entidad o un Mesh por atlas
+        self.render_mode = render_mode
+
+        # Bucle central: un solo evento de Clock para toda la pantalla
+        self.dispatcher = FrameDispatcher(fps=60)
+        # Binds y eventos de la pantalla: se sueltan juntos en on_leave
+        self.lifecycle = Lifecycle()
+
         # NUEVO: Configuración de flocking
         self.flocking_enabled = True  # Activar/desactivar flocking
         self.flocking_probability = 0.6  # 50% de probabilidad de crear enemigo con flocking
         self.flocking_group_size = 5  # Enemigos por grupo
         self.flocking_spawn_radius = 150  # Radio de aparición del grupo
+        # Desde este tamaño de bandada se usa la versión NumPy (si está disponible)
+        self.flocking_batch_min = 24
+        self.flocking_use_batch = numpy_available()
+        # Índice de vecinos de la bandada (celda = radio mayor de flocking)
+        self.flock_grid = NeighborGrid(cell_size=200)
 
         # --- Lógica de fondo con scrolling ---
         IMG_WIDTH = 2304
         IMG_HEIGHT = 1024
         SCROLL_DURATION = 60
 
-        aspect_ratio = IMG_WIDTH / IMG_HEIGHT
-        self.scaled_bg_height = Window.height
-        self.scaled_bg_width = self.scaled_bg_height * aspect_ratio
+        # Un quad del tamaño de la ventana: el scroll solo cambia tex_coords.
+        # La textura llega del gestor de assets (decodificada en segundo plano)
+        self.background = BackgroundScroller(self.canvas.before, size=Window.size)
+        self.background.add_layer(["fondo1"], image_size=(IMG_WIDTH, IMG_HEIGHT),
+                                  wrap=BACKGROUND_WRAP)
+        # Recorrer la imagen completa en SCROLL_DURATION segundos
+        self.background.speed = self.background.scroll_distance() / SCROLL_DURATION
 
-        scroll_distance = self.scaled_bg_width - Window.width
-        self.scroll_speed = scroll_distance / SCROLL_DURATION
-
-        with self.canvas.before:
-            self.bg = Rectangle(
-                source="images/fondo1.png",
-                size=(self.scaled_bg_width, self.scaled_bg_height),
-                pos=(0, 0)
-            )
-
-        self.player = Player()
+        self.player = Player(dispatcher=self.dispatcher)
         self.add_widget(self.player)
 
-        self.enemies = []
-        self.projectiles = []
-
-        # Label de puntuación
-        self.label = Label(text=self.score_text,
-                           font_size='24sp',
-                           color=(1, 1, 1, 1),
-                           size_hint=(0.3, 0.1),
-                           pos_hint={'x': 0.02, 'top': 0.98},
-                           halign="left", valign="top")
+        # Capa de sprites en lote (solo en modo batch)
+        self.sprite_layer = Widget()
+        self.add_widget(self.sprite_layer)
+        self.sprite_batch = SpriteBatch(self.sprite_layer.canvas)
+
+        # Estado de simulación en arrays (los widgets son vistas)
+        self.enemies = EntityStore()
+        self.projectiles = EntityStore()
+
+        # Pools de entidades: se reutilizan widgets/sprites en vez de crearlos
+        # en cada disparo o spawn. Se pre-calientan para dos bandadas completas.
+        self.projectile_pool = ObjectPool(Projectile, high_water=64)
+        self.enemy_pool = ObjectPool(lambda: Enemy(self.player), high_water=24)
+        self.projectile_pool.prewarm(4 * self.flocking_group_size)
+        self.enemy_pool.prewarm(2 * self.flocking_group_size)
+
+        # Puntuación: "Score: " se renderiza una vez, el número con la tira de dígitos
+        self.label = HudLine(font_size='24sp',
+                             size_hint=(0.3, 0.1),
+                             pos_hint={'x': 0.02, 'top': 0.98},
+                             halign="left")
+        self.label.add_text("Score: ")
+        self.label.add_number("score", self.score)
         self.add_widget(self.label)
 
         # Botón de pausa
@@ -69,17 +104,35 @@ class GameScreen(Widget):
         self.pause_button.bind(on_press=lambda x: self.toggle_pause())
         self.add_widget(self.pause_button)
 
-        # Eventos programados
-        self.spawn_event = Clock.schedule_interval(self.spawn_enemy, 3)
-        self.update_event = Clock.schedule_interval(self.update, 1 / 60)
-        self.score_event = Clock.schedule_interval(self.add_score, 1)
+        # Sistemas del frame, por fase
+        self.dispatcher.add(PHASE_AI, self.spawn_enemy, interval=3)
+        self.dispatcher.add(PHASE_AI, self.add_score, interval=1)
+        self.dispatcher.add(PHASE_PHYSICS, self.player.update)
+        self.dispatcher.add(PHASE_PHYSICS, self.update)
+        self.dispatcher.add(PHASE_COLLISION, self.check_player_hits)
+        self.dispatcher.add(PHASE_RENDER_SYNC, self.sync_views)
+        self.dispatcher.start()
 
         # Overlays (inicialmente None)
         self.pause_menu = None
         self.gameover_menu = None
 
         # Vincular tecla ESC para pausar
-        Window.bind(on_keyboard=self.on_keyboard)
+        self.lifecycle.bind(Window, on_keyboard=self.on_keyboard)
+
+    def on_enter(self):
+        # Tiempos por fase en pantalla (solo con PROFILE_FRAMES)
+        attach_overlay(self, self.lifecycle)
+
+    def on_leave(self):
+        """Al salir de la pantalla: detener el bucle y soltar el teclado"""
+        self.dispatcher.stop()
+        self.dispatcher.clear()
+        self.lifecycle.release()
+        self.background.release()
+        profiler.dump_session("level1")
+        # La animación "respirando" del botón de pausa se repite para siempre
+        Animation.cancel_all(self.pause_button)
 
     def on_keyboard(self, window, key, scancode, codepoint, modifier):
         """Maneja eventos de teclado"""
@@ -98,9 +151,7 @@ class GameScreen(Widget):
 
         if self.is_paused:
             # Pausar el juego
-            self.spawn_event.cancel()
-            self.update_event.cancel()
-            self.score_event.cancel()
+            self.dispatcher.stop()
             
             # Mostrar menú de pausa
             self.pause_menu = PauseMenu(self)
@@ -110,9 +161,7 @@ class GameScreen(Widget):
             self.pause_button.text = "▶"
         else:
             # Reanudar el juego
-            self.spawn_event = Clock.schedule_interval(self.spawn_enemy, 2)
-            self.update_event = Clock.schedule_interval(self.update, 1 / 60)
-            self.score_event = Clock.schedule_interval(self.add_score, 1)
+            self.dispatcher.start()
             
             # Ocultar menú de pausa
             if self.pause_menu:
@@ -127,9 +176,7 @@ class GameScreen(Widget):
         self.game_over = True
         
         # Detener todos los eventos
-        self.spawn_event.cancel()
-        self.update_event.cancel()
-        self.score_event.cancel()
+        self.dispatcher.stop()
         
         # Mostrar menú de game over
         self.gameover_menu = GameOverMenu(self, self.score)
@@ -154,27 +201,29 @@ class GameScreen(Widget):
         if self.is_paused or self.game_over:
             return
 
-        homing_count = sum(1 for e in self.enemies if e.is_homing)
+        homing_count = self.enemies.count(FLAG_HOMING)
 
     
         if homing_count < 5 and random.random() < 0.2:
             self.spawn_single_enemy(is_homing=True)
-            print("🎯 Spawned HOMING enemy")
+            log.debug("🎯 Spawned HOMING enemy")
         elif self.flocking_enabled and random.random() < self.flocking_probability:
             # Spawn GRUPO FLOCKING (60% de probabilidad)
             group_size = random.randint(3, self.flocking_group_size)
             self.spawn_flocking_group(group_size)
-            print(f"🐦🐦🐦 Spawned FLOCKING GROUP of {group_size} enemies")
+            log.debug("🐦🐦🐦 Spawned FLOCKING GROUP of %d enemies", group_size)
         else:
             self.spawn_single_enemy(is_homing=False, use_flocking=False)
-            print("⬇️ Spawned NORMAL enemy")
+            log.debug("⬇️ Spawned NORMAL enemy")
         
     def spawn_single_enemy(self, is_homing=False, use_flocking=False):
         """Crea un solo enemigo"""
-        enemy = Enemy(
-            self.player, 
+        enemy = self.enemy_pool.acquire(
+            player=self.player,
             is_homing=is_homing,
-            use_flocking=use_flocking
+            use_flocking=use_flocking,
+            store=self.enemies,
+            dispatcher=self.dispatcher
         )
         
         def shoot_for_this_enemy():
@@ -185,12 +234,12 @@ class GameScreen(Widget):
         # Evitar solapamiento
         max_attempts = 10
         attempts = 0
-        while attempts < max_attempts and any(self.check_enemy_overlap(enemy, other) for other in self.enemies):
-            enemy.center_x = random.randint(50, self.width - 50)
+        while attempts < max_attempts and any(
+                other is not enemy and self.check_enemy_overlap(enemy, other) for other in self.enemies):
+            enemy.place(random.randint(50, self.width - 50), enemy.center_y)
             attempts += 1
 
-        self.enemies.append(enemy)
-        self.add_widget(enemy)
+        self.show_entity(enemy)
 
     def spawn_flocking_group(self, group_size):
         """Crea un grupo de enemigos con flocking cercanos entre sí"""
@@ -206,16 +255,16 @@ class GameScreen(Widget):
             offset_x = radius * math.cos(angle)
             offset_y = radius * math.sin(angle)
             
-            enemy = Enemy(
-                self.player, 
+            enemy = self.enemy_pool.acquire(
+                player=self.player,
                 is_homing=False,
-                use_flocking=True
+                use_flocking=True,
+                store=self.enemies,
+                dispatcher=self.dispatcher
             )
             
             # Posicionar en el grupo
-            enemy.center_x = center_x + offset_x
-            enemy.center_y = center_y + offset_y
-            enemy.update_sprite()
+            enemy.place(center_x + offset_x, center_y + offset_y)
             
             # Dar velocidades iniciales similares (hacia abajo con ligera variación)
             enemy.velocity_x = random.uniform(-1.5, 1.5)
@@ -227,106 +276,169 @@ class GameScreen(Widget):
             
             enemy.shoot_projectile = shoot_for_this_enemy
             
-            self.enemies.append(enemy)
-            self.add_widget(enemy)
+            self.flock_grid.move(enemy, enemy.center_x, enemy.center_y)
+            self.show_entity(enemy)
             
-            print(f"   ✨ Flocking member {i+1} at ({enemy.center_x:.0f}, {enemy.center_y:.0f})")
+            log.debug("   ✨ Flocking member %d at (%.0f, %.0f)", i + 1, enemy.center_x, enemy.center_y)
 
     def create_projectile(self, enemy):
         if enemy not in self.enemies:
             return
             
-        projectile = Projectile(
+        projectile = self.projectile_pool.acquire(
             start_x=enemy.center_x,
             start_y=enemy.center_y,
             target_x=self.player.center_x,
-            target_y=self.player.center_y
+            target_y=self.player.center_y,
+            store=self.projectiles
         )
-        self.projectiles.append(projectile)
-        self.add_widget(projectile)
+        self.show_entity(projectile)
+
+    def show_entity(self, view):
+        """Agrega la vista al árbol de widgets (en modo batch la dibuja el SpriteBatch)"""
+        if self.render_mode != RENDER_MODE_BATCH:
+            self.add_widget(view)
 
     def update(self, dt):
         """Actualiza todos los elementos del juego"""
         if self.is_paused or self.game_over:
             return
 
+        t = profiler.begin()
+
         # Mover el fondo
-        left_limit = -(self.scaled_bg_width - Window.width)
-        new_x = self.bg.pos[0] - self.scroll_speed * dt
-        
-        if new_x > left_limit:
-            self.bg.pos = (new_x, 0)
+        self.background.update(dt)
+        t = profiler.lap("update.scroll", t)
 
         # NUEVO: Obtener lista de enemigos con flocking para cálculos
         flocking_enemies = [e for e in self.enemies if e.use_flocking]
-        # LOG: Mostrar cantidad de enemigos con flocking cada 60 frames
-        if hasattr(self, 'frame_count'):
-            self.frame_count += 1
-        else:
-            self.frame_count = 0
-        
-        if self.frame_count % 60 == 0:
+        # LOG: cantidad de enemigos por tipo, como mucho una vez por segundo
+        # (el conteo solo se hace si el nivel DEBUG está activo)
+        if log.enabled_for(DEBUG):
             total = len(self.enemies)
             flocking = len(flocking_enemies)
-            homing = sum(1 for e in self.enemies if e.is_homing)
-            normal = total - flocking - homing
-            print(f"📊 Enemigos: Total={total} | Flocking={flocking} | Homing={homing} | Normal={normal}")
+            homing = self.enemies.count(FLAG_HOMING)
+            log.debug("📊 Enemigos", every=1.0, total=total, flocking=flocking,
+                      homing=homing, normal=total - flocking - homing)
         
         
         
         
-        # Actualizar jugador
-        self.player.update(dt)
-        # Actualizar enemigos
-        for enemy in self.enemies[:]:
+        # Fuerzas de toda la bandada en una sola llamada (bandadas grandes)
+        batch_forces = None
+        if self.flocking_use_batch and len(flocking_enemies) >= self.flocking_batch_min:
+            forces = apply_flocking_batch(
+                [(e.center_x, e.center_y) for e in flocking_enemies],
+                [(e.velocity_x, e.velocity_y) for e in flocking_enemies],
+                separation_weight=3.0,
+                alignment_weight=1.2,
+                cohesion_weight=0.8
+            )
+            batch_forces = {id(e): tuple(f) for e, f in zip(flocking_enemies, forces.tolist())}
+        flocking_time = profiler.since(t)
+        t = profiler.begin()
+        scalar_flocking = 0.0
+
+        # Actualizar enemigos (de atrás hacia adelante: el swap-remove no salta a nadie)
+        for slot in self.enemies.reversed_slots():
+            enemy = self.enemies.views[slot]
             # NUEVO: Calcular fuerza de flocking si aplica
             flocking_force = None
-            if enemy.use_flocking:
+            if enemy.use_flocking and batch_forces is not None:
+                flocking_force = batch_forces[id(enemy)]
+            elif enemy.use_flocking:
+                f0 = profiler.begin()
                 flocking_force = apply_flocking(
                     enemy, 
-                    flocking_enemies,
+                    self.flock_grid,
                     separation_weight=3.0,  # Más peso a separación
                     alignment_weight=1.2,   # Peso medio a alineación
                     cohesion_weight=0.8     # Peso medio a cohesión
                 )
-                # LOG: Mostrar fuerza de flocking cada 60 frames
-                if self.frame_count % 60 == 0 and flocking_force:
-                    fx, fy = flocking_force
-                    print(f"   🔷 Flocking force: ({fx:.2f}, {fy:.2f})")
+                scalar_flocking += profiler.since(f0)
+                # LOG: fuerza de flocking, como mucho una vez por segundo
+                if flocking_force:
+                    log.debug("   🔷 Flocking force: (%.2f, %.2f)", *flocking_force, every=1.0)
             alive = enemy.update(dt, flocking_force=flocking_force)
 
             if not alive:
-                self.remove_widget(enemy)
-                self.enemies.remove(enemy)
+                self.flock_grid.discard(enemy)
+                self.enemies.destroy_slot(slot)
+                self.enemy_pool.release(enemy)
                 continue
 
+            if enemy.use_flocking:
+                self.flock_grid.move(enemy, enemy.center_x, enemy.center_y)
+        # El flocking por enemigo se cuenta en "flocking", no en "enemies"
+        t = profiler.lap("update.enemies", t, exclude=scalar_flocking)
+        profiler.add("update.flocking", flocking_time + scalar_flocking)
+
+        # Actualizar proyectiles directamente sobre los arrays del store
+        store = self.projectiles
+        xs, ys, vxs, vys = store.x, store.y, store.vx, store.vy
+        for slot in store.reversed_slots():
+            x = xs[slot] + vxs[slot]
+            y = ys[slot] + vys[slot]
+            xs[slot], ys[slot] = x, y
+
+            if out_of_screen(x, y):
+                projectile = store.views[slot]
+                store.destroy_slot(slot)
+                self.projectile_pool.release(projectile)
+        profiler.lap("update.projectiles", t)
+
+    def check_player_hits(self, dt):
+        """Fase de colisión: enemigos y proyectiles contra el jugador"""
+        if self.is_paused or self.game_over:
+            return
+
+        for enemy in self.enemies:
             if self.check_collision(self.player, enemy):
-                print("¡Perdiste! Colisión con enemigo")
+                log.info("¡Perdiste! Colisión con enemigo", score=self.score)
                 self.show_game_over()
                 return
 
-        # Actualizar proyectiles
-        for projectile in self.projectiles[:]:
-            alive = projectile.update(dt)
-            
-            if not alive:
-                self.remove_widget(projectile)
-                self.projectiles.remove(projectile)
-                continue
-            
-            if self.check_projectile_collision(self.player, projectile):
-                print("¡Perdiste! Colisión con proyectil")
+        # Círculo del jugador (70% del sprite) contra cada proyectil, sin sqrt
+        store = self.projectiles
+        xs, ys = store.x, store.y
+        px, py = self.player.center_x, self.player.center_y
+        pr = self.player.sprite.width / 2 * 0.7
+        for slot, projectile in enumerate(store.views):
+            dx, dy = px - xs[slot], py - ys[slot]
+            r = pr + projectile.radius
+            if dx * dx + dy * dy < r * r:
+                log.info("¡Perdiste! Colisión con proyectil", score=self.score)
                 self.show_game_over()
                 return
 
-        self.label.text = self.score_text
+    def sync_views(self, dt):
+        """Fase de sincronización: vistas de proyectiles y HUD, una vez por frame"""
+        if self.render_mode == RENDER_MODE_BATCH:
+            self.draw_batch()
+        else:
+            self.projectiles.sync_views()
+        self.label.set("score", self.score)
+
+    def draw_batch(self):
+        """Vuelca enemigos y proyectiles (arrays del store) al SpriteBatch"""
+        batch = self.sprite_batch
+        batch.begin()
+        for store in (self.enemies, self.projectiles):
+            xs, ys = store.x, store.y
+            for slot, view in enumerate(store.views):
+                sprite = view.sprite
+                texture = sprite.texture
+                if texture is None:
+                    continue
+                w, h = fit_size(texture, sprite.width, sprite.height)
+                batch.draw(texture, xs[slot], ys[slot], w, h)
+        batch.end()
 
     def add_score(self, dt):
         """Incrementa la puntuación cada segundo"""
         if self.is_paused or self.game_over:
             return
         self.score += 1
-        self.score_text = f"Score: {self.score}"
 
     def check_collision(self, player, enemy):
         """Detecta colisión entre jugador y enemigo"""
@@ -339,17 +451,6 @@ class GameScreen(Widget):
         distancia = math.sqrt((px - ex)**2 + (py - ey)**2)
         return distancia < (pr + er)
 
-    def check_projectile_collision(self, player, projectile):
-        """Detecta colisión entre jugador y proyectil"""
-        px, py = player.center_x, player.center_y
-        proj_x, proj_y = projectile.center_x, projectile.center_y
-
-        pr = player.sprite.width / 2 * 0.7
-        proj_r = projectile.sprite.width / 2
-
-        distancia = math.sqrt((px - proj_x)**2 + (py - proj_y)**2)
-        return distancia < (pr + proj_r)
-
     def check_enemy_overlap(self, e1, e2):
         """Detecta solapamiento entre dos enemigos al spawnear"""
         ex1, ey1 = e1.center_x, e1.center_y
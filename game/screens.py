@@ -0,0 +1,136 @@
+# game/screens.py
+import importlib
+from typing import Dict, Optional, Sequence, Tuple
+
+from kivy.clock import Clock
+
+from game import lifecycle
+from game.log import get_logger
+
+log = get_logger("screens")
+
+# Pantallas: nombre -> (módulo, clase, cacheada). El módulo se importa la
+# primera vez que se abre la pantalla, no al arrancar: el Nivel 3 arrastra
+# OpenCV y NumPy y la mayoría de las partidas nunca lo abren.
+# Las pantallas cacheadas (menús) se construyen una vez y se reutilizan;
+# las de juego se crean nuevas en cada partida.
+SCREENS: Dict[str, Tuple[str, str, bool]] = {
+    "menu": ("game.menu", "MainMenu", True),
+    "levels": ("game.menu", "LevelScreen", True),
+    "instructions": ("game.menu", "InstructionsScreen", True),
+    "level1": ("game.screen", "GameScreen", False),
+    "level2": ("game.trajectory_screen", "TrajectoryGameScreen", False),
+    "level3": ("game.level3_ar", "ARGameScreen", False),
+}
+
+_classes: Dict[str, type] = {}
+
+
+def register_screen(name: str, module: str, class_name: str, cached: bool = False):
+    SCREENS[name] = (module, class_name, cached)
+    _classes.pop(name, None)
+
+
+def is_loaded(name: str) -> bool:
+    return name in _classes
+
+
+def screen_class(name: str) -> type:
+    """Clase de la pantalla 'name' (importa su módulo si hace falta)."""
+    cls = _classes.get(name)
+    if cls is None:
+        module, class_name, _ = SCREENS[name]
+        cls = _classes[name] = getattr(importlib.import_module(module), class_name)
+    return cls
+
+
+def create_screen(name: str, **kwargs):
+    return screen_class(name)(**kwargs)
+
+
+def preload_screens(names: Sequence[str]):
+    """
+    Importa las pantallas indicadas de a una por frame, cuando el menú ya
+    se dibujó (así el primer frame no espera y el primer clic tampoco).
+    """
+    pending = [n for n in names if not is_loaded(n)]
+
+    def step(dt):
+        if not pending:
+            return False
+        name = pending.pop(0)
+        try:
+            screen_class(name)
+        except ImportError as e:
+            log.warning("⚠️  Pantalla %s no disponible: %s", name, e)
+        return bool(pending)
+
+    if pending:
+        Clock.schedule_interval(step, 0)
+
+
+def _call_hook(screen, hook: str):
+    method = getattr(screen, hook, None)
+    if method is not None:
+        method()
+
+
+class ScreenHost:
+    """
+    Muestra una pantalla a la vez dentro de 'root' y maneja su ciclo de vida:
+    - on_enter() se llama al mostrarla y on_leave() al quitarla (si las
+      define). Una pantalla cacheada se pausa en on_leave (relojes,
+      animaciones) y se reanuda en on_enter. Una de juego suelta todo en
+      on_leave, porque no vuelve a mostrarse.
+    - Las pantallas cacheadas (ver SCREENS) se construyen una sola vez: ir
+      y volver entre menús no crea widgets nuevos.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.current = None
+        self.current_name: Optional[str] = None
+        self._cache: Dict[str, object] = {}
+
+    def show(self, name: str, **kwargs):
+        """Muestra la pantalla 'name' (la cacheada o una nueva con kwargs)."""
+        screen = self._cache.get(name)
+        if screen is None:
+            if not SCREENS[name][2]:
+                # La pantalla anterior suelta sus recursos (p. ej. la cámara)
+                # antes de que la nueva los pida
+                self._leave_current()
+            screen = create_screen(name, **kwargs)
+            if SCREENS[name][2]:
+                self._cache[name] = screen
+        self.switch_to(screen, name)
+        return screen
+
+    def switch_to(self, screen, name: Optional[str] = None):
+        """Muestra un widget ya construido en lugar de la pantalla actual."""
+        if screen is self.current:
+            return
+        self._leave_current()
+        self.root.clear_widgets()
+        self.current = screen
+        self.current_name = name
+        self.root.add_widget(screen)
+        _call_hook(screen, "on_enter")
+        if lifecycle.DEBUG_LIFECYCLE:
+            lifecycle.report_live(name or type(screen).__name__)
+
+    def _leave_current(self):
+        old = self.current
+        self.current = None
+        self.current_name = None
+        if old is not None:
+            _call_hook(old, "on_leave")
+
+    def cached(self, name: str):
+        return self._cache.get(name)
+
+    def clear(self):
+        """Sale de la pantalla actual y olvida las cacheadas (al cerrar la app)."""
+        self._leave_current()
+        self.root.clear_widgets()
+        self._cache.clear()
@@ -1,17 +1,19 @@
 # game/slingshot_player.py
 from kivy.uix.widget import Widget
 from kivy.uix.image import Image
+from game.animation import frame_texture
+from game.assets import asset_source
 
 class SlingshotPlayer(Widget):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
         # Guardamos las texturas
-        self.idle_sprite = "images/vicu1.png"
-        self.drag_sprite = "images/vicu2.png"
+        self.idle_sprite = "vicu1"
+        self.drag_sprite = "vicu2"
         
         # Creamos la imagen inicial
-        self.sprite = Image(source=self.idle_sprite,
+        self.sprite = Image(source=asset_source(self.idle_sprite),
                             size_hint=(None, None),
                             size=(160, 160))
         self.add_widget(self.sprite)
@@ -25,7 +27,8 @@ class SlingshotPlayer(Widget):
         
     def set_dragging(self, is_dragging):
         """Cambia el sprite del jugador basado en el estado de arrastre."""
+        # Cambio de región de textura (atlas 'vicu' si está generado)
         if is_dragging:
-            self.sprite.source = self.drag_sprite
+            self.sprite.texture = frame_texture(self.drag_sprite)
         else:
-            self.sprite.source = self.idle_sprite
\ No newline at end of file
+            self.sprite.texture = frame_texture(self.idle_sprite)
\ No newline at end of file
@@ -0,0 +1,136 @@
+# game/spatial.py
+from typing import Dict, Iterator, List, Sequence, Tuple
+from math import floor
+
+from .geometry import rects_intersect, Rect
+
+Cell = Tuple[int, int]
+
+
+class WallGrid:
+    """
+    Índice espacial estático (rejilla uniforme) para las paredes del nivel.
+    Se construye una sola vez a partir de los 'wall_rects' del nivel y
+    permite consultar solo las paredes de las celdas cercanas a un AABB,
+    en lugar de recorrer todas las paredes en cada consulta.
+    """
+
+    def __init__(self, rects: Sequence[Rect], cell_size: float = 64.0):
+        if cell_size <= 0:
+            raise ValueError("cell_size debe ser positivo")
+        self.cell_size = float(cell_size)
+        self.rects: List[Rect] = [tuple(r) for r in rects]
+        self._cells: Dict[Cell, List[int]] = {}
+        for i, r in enumerate(self.rects):
+            for cell in self._cells_for(r):
+                self._cells.setdefault(cell, []).append(i)
+
+    # Compatibilidad con código que espera una lista de rectángulos
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def __iter__(self) -> Iterator[Rect]:
+        return iter(self.rects)
+
+    def _cells_for(self, r: Rect) -> Iterator[Cell]:
+        x, y, w, h = r
+        cs = self.cell_size
+        x0, x1 = int(floor(x / cs)), int(floor((x + w) / cs))
+        y0, y1 = int(floor(y / cs)), int(floor((y + h) / cs))
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield (cx, cy)
+
+    def query(self, r: Rect) -> List[Rect]:
+        """Paredes candidatas cuyas celdas tocan el rectángulo 'r'."""
+        cells = self._cells
+        found: List[int] = []
+        seen = set()
+        for cell in self._cells_for(r):
+            bucket = cells.get(cell)
+            if not bucket:
+                continue
+            for i in bucket:
+                if i not in seen:
+                    seen.add(i)
+                    found.append(i)
+        return [self.rects[i] for i in found]
+
+    def intersects(self, r: Rect) -> bool:
+        """True si 'r' se solapa con alguna pared."""
+        return any(rects_intersect(r, wr) for wr in self.query(r))
+
+
+class NeighborGrid:
+    """
+    Índice dinámico (cell list) para consultas de vecinos por radio.
+    Cada objeto se guarda en la celda de su posición; al moverse solo
+    cambia de celda si cruza un borde, y se puede quitar en O(1). Las
+    celdas se indexan por hash, así que admite coordenadas fuera de
+    pantalla (p. ej. bandadas que aparecen por encima de la ventana).
+    Con cell_size >= radio de consulta basta revisar las 3x3 celdas vecinas.
+    """
+
+    def __init__(self, cell_size: float = 200.0):
+        if cell_size <= 0:
+            raise ValueError("cell_size debe ser positivo")
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Cell, Dict[int, object]] = {}
+        self._where: Dict[int, Cell] = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, obj) -> bool:
+        return id(obj) in self._where
+
+    def __iter__(self) -> Iterator[object]:
+        for bucket in list(self._cells.values()):
+            yield from list(bucket.values())
+
+    def _cell(self, x: float, y: float) -> Cell:
+        cs = self.cell_size
+        return (int(floor(x / cs)), int(floor(y / cs)))
+
+    def move(self, obj, x: float, y: float):
+        """Inserta o actualiza la posición de 'obj'."""
+        key = id(obj)
+        cell = self._cell(x, y)
+        old = self._where.get(key)
+        if old == cell:
+            return
+        if old is not None:
+            self._drop(key, old)
+        self._cells.setdefault(cell, {})[key] = obj
+        self._where[key] = cell
+
+    def discard(self, obj):
+        """Quita 'obj' si está en el índice."""
+        key = id(obj)
+        old = self._where.pop(key, None)
+        if old is not None:
+            self._drop(key, old)
+
+    def _drop(self, key: int, cell: Cell):
+        bucket = self._cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self._cells[cell]
+
+    def clear(self):
+        self._cells.clear()
+        self._where.clear()
+
+    def query(self, x: float, y: float, radius: float) -> List[object]:
+        """Candidatos en las celdas que cubren el círculo (x, y, radius)."""
+        cs = self.cell_size
+        x0, x1 = int(floor((x - radius) / cs)), int(floor((x + radius) / cs))
+        y0, y1 = int(floor((y - radius) / cs)), int(floor((y + radius) / cs))
+        cells = self._cells
+        found: List[object] = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket.values())
+        return found
@@ -0,0 +1,102 @@
+# game/sprite_batch.py
+from typing import Dict, List, Tuple
+
+from kivy.graphics import InstructionGroup, Mesh
+
+from game.assets import assets
+
+# Modos de dibujo de entidades en las pantallas de juego
+RENDER_MODE_WIDGETS = "widgets"  # un Widget + Image por entidad (por defecto)
+RENDER_MODE_BATCH = "batch"      # un Mesh por textura de atlas (SpriteBatch)
+RENDER_MODES = (RENDER_MODE_WIDGETS, RENDER_MODE_BATCH)
+
+
+def fit_size(texture, w: float, h: float) -> Tuple[float, float]:
+    """Tamaño dibujado por un Image con keep_ratio dentro de una caja w x h."""
+    tw, th = texture.size
+    if not tw or not th:
+        return w, h
+    scale = min(w / tw, h / th)
+    return tw * scale, th * scale
+
+
+class _Page:
+    __slots__ = ("mesh", "vertices", "quads")
+
+    def __init__(self, mesh: Mesh):
+        self.mesh = mesh
+        self.vertices: List[float] = []
+        self.quads = 0
+
+
+class SpriteBatch:
+    """
+    Dibuja muchos sprites con un Mesh por textura (página de atlas):
+    los quads de todos los sprites que comparten textura se envían en
+    un solo draw call. Uso por frame:
+        batch.begin(); batch.draw(tex, cx, cy, w, h) ...; batch.end()
+    Las páginas se identifican por la textura de GL (texture.id, que las
+    regiones comparten con su página), así que todos los frames de una
+    familia (p. ej. enemigo1..4) comparten Mesh.
+    """
+
+    def __init__(self, canvas):
+        self.group = InstructionGroup()
+        canvas.add(self.group)
+        self._pages: Dict[int, _Page] = {}
+        self._indices: List[int] = []
+
+    def _page(self, texture) -> _Page:
+        page = self._pages.get(texture.id)
+        if page is None:
+            # El Mesh se enlaza a la página entera; cada quad usa las UV de su región
+            mesh = Mesh(vertices=[], indices=[], mode="triangles",
+                        texture=assets.page_texture(texture))
+            self.group.add(mesh)
+            page = self._pages[texture.id] = _Page(mesh)
+        return page
+
+    def begin(self):
+        for page in self._pages.values():
+            page.vertices = []
+            page.quads = 0
+
+    def draw(self, texture, cx: float, cy: float, w: float, h: float):
+        """Añade un quad centrado en (cx, cy) con la región 'texture'."""
+        page = self._page(texture)
+        x0, y0 = cx - w / 2, cy - h / 2
+        x1, y1 = x0 + w, y0 + h
+        # UV de la región dentro de la página (uvsize negativo si está invertida)
+        u0, v0 = texture.uvpos
+        uw, uh = texture.uvsize
+        u1, v1 = u0 + uw, v0 + uh
+        page.vertices.extend((
+            x0, y0, u0, v0,
+            x1, y0, u1, v0,
+            x1, y1, u1, v1,
+            x0, y1, u0, v1,
+        ))
+        page.quads += 1
+
+    def end(self):
+        """Sube los vértices del frame: un draw call por página con sprites."""
+        for page in self._pages.values():
+            indices = self._quad_indices(page.quads)
+            page.mesh.vertices = page.vertices
+            page.mesh.indices = indices
+
+    def _quad_indices(self, quads: int) -> List[int]:
+        # Índices compartidos: 2 triángulos por quad, se amplían solo al crecer
+        have = len(self._indices) // 6
+        for q in range(have, quads):
+            i = q * 4
+            self._indices.extend((i, i + 1, i + 2, i + 2, i + 3, i))
+        return self._indices[:quads * 6]
+
+    @property
+    def draw_calls(self) -> int:
+        return sum(1 for page in self._pages.values() if page.quads)
+
+    def clear(self):
+        self.begin()
+        self.end()
@@ -1,68 +1,165 @@
 # game/trajectory.py
+from typing import List, Optional, Sequence, Tuple
+
 from kivy.uix.widget import Widget
-from kivy.graphics import Color, Ellipse
-from kivy.core.window import Window
+from kivy.graphics import Color, Point
+from kivy.graphics.texture import Texture
+from kivy.properties import NumericProperty
+from kivy.clock import Clock
+
+from game.utils import numpy_available
+from game.collision import ArcHit, Walls, ballistic_sweep
 
 # ¡Debe ser el mismo valor que en physics_projectile.py!
 GRAVITY_FORCE = -150.0
 
+_dot_texture = None
+
+
+def _round_dot_texture(size: int = 16) -> Texture:
+    """Textura de un círculo blanco (los Point de Kivy son cuadrados)."""
+    global _dot_texture
+    if _dot_texture is None:
+        r = size / 2
+        buf = bytearray()
+        for y in range(size):
+            for x in range(size):
+                inside = (x + 0.5 - r) ** 2 + (y + 0.5 - r) ** 2 <= r * r
+                buf += b"\xff\xff\xff" + (b"\xff" if inside else b"\x00")
+        _dot_texture = Texture.create(size=(size, size), colorfmt="rgba")
+        _dot_texture.blit_buffer(bytes(buf), colorfmt="rgba", bufferfmt="ubyte")
+    return _dot_texture
+
+
+def time_table(count: int, spacing: float, gravity: float = GRAVITY_FORCE):
+    """
+    Tiempos t_i = spacing * i (i = 1..count) y el término 0.5*g*t_i^2.
+    Solo dependen de la configuración: se calculan una vez, no en cada toque.
+    """
+    if numpy_available():
+        import numpy as np
+        t = spacing * np.arange(1, count + 1, dtype=float)
+        return t, 0.5 * gravity * t * t
+    t = [spacing * i for i in range(1, count + 1)]
+    return t, [0.5 * gravity * ti * ti for ti in t]
+
+
+def trajectory_points(start_pos: Sequence[float], velocity: Sequence[float],
+                      table) -> List[float]:
+    """
+    Puntos de p = p0 + v0*t + 0.5*g*t^2 como lista plana [x0, y0, x1, y1, ...]
+    (el formato que espera Point.points).
+    """
+    t, drop = table
+    x0, y0 = float(start_pos[0]), float(start_pos[1])
+    vx, vy = float(velocity[0]), float(velocity[1])
+    if not isinstance(t, list):
+        import numpy as np
+        pts = np.empty((len(t), 2))
+        pts[:, 0] = x0 + vx * t
+        pts[:, 1] = y0 + vy * t + drop
+        return pts.ravel().tolist()
+    points: List[float] = []
+    for ti, di in zip(t, drop):
+        points.append(x0 + vx * ti)
+        points.append(y0 + vy * ti + di)
+    return points
+
+
 class Trajectory(Widget):
+    """
+    Vista previa del tiro: todos los puntos se dibujan con una sola
+    instrucción Point. Los toques solo guardan el último estado; los
+    puntos se recalculan como mucho una vez por frame. 'dots_number',
+    'dot_spacing' y 'dot_size' se pueden cambiar en caliente.
+    Con set_walls() la trayectoria se corta en la primera pared
+    (ver 'impact').
+    """
+
+    # Configuración de los puntos (como en Unity)
+    dots_number = NumericProperty(30)
+    dot_spacing = NumericProperty(0.2)  # Tiempo (en segundos) entre cada punto
+    dot_size = NumericProperty(8)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        
-        # Configuración de los puntos (como en Unity)
-        self.dots_number = 30
-        self.dot_spacing = 0.2  # Tiempo (en segundos) entre cada punto
-        self.dot_size = (8, 8)
-        
-        self.dots_list = []
+
+        self._table = time_table(int(self.dots_number), self.dot_spacing)
+        self._pending: Optional[Tuple[Sequence[float], Sequence[float]]] = None
+        self._last = None
+        # Paredes del nivel (lista o WallGrid) y semi-tamaño del proyectil
+        self.walls: Optional[Walls] = None
+        self.probe_half_size: Tuple[float, float] = (0.0, 0.0)
+        # Primer impacto de la última trayectoria calculada (o None)
+        self.impact: Optional[ArcHit] = None
+        # Un solo recálculo por frame aunque lleguen varios on_touch_move
+        self._flush_trigger = Clock.create_trigger(self._flush)
+
         self.prepare_dots()
+        self.bind(dots_number=self._on_config, dot_spacing=self._on_config,
+                  dot_size=self._on_dot_size)
         self.hide() # Ocultar al inicio
 
     def prepare_dots(self):
-        """Crea los puntos y los añade al canvas."""
-        for i in range(self.dots_number):
-            # Usamos el canvas de este widget para dibujar
-            with self.canvas:
-                # Damos un color (blanco semitransparente)
-                Color(1, 1, 1, 0.8)
-                # Creamos el punto (Ellipse)
-                dot = Ellipse(pos=(0, 0), size=self.dot_size)
-            
-            self.dots_list.append(dot)
+        """Crea la instrucción única de puntos en el canvas."""
+        with self.canvas:
+            # Damos un color (blanco semitransparente)
+            Color(1, 1, 1, 0.8)
+            self.dots = Point(points=[], pointsize=self.dot_size / 2,
+                              texture=_round_dot_texture())
+
+    def _on_config(self, *args):
+        self._table = time_table(int(self.dots_number), self.dot_spacing)
+        if self._last is not None:
+            self._pending = self._last
+            self._flush_trigger()
+
+    def _on_dot_size(self, *args):
+        self.dots.pointsize = self.dot_size / 2
+
+    def set_walls(self, walls: Optional[Walls], half_size: Tuple[float, float] = (0.0, 0.0)):
+        """Paredes contra las que se corta la trayectoria (None = sin colisión)."""
+        self.walls = walls
+        self.probe_half_size = half_size
+
+    def predict(self, start_pos, force_applied) -> Tuple[List[float], Optional[ArcHit]]:
+        """
+        Puntos de la trayectoria hasta el primer impacto con una pared
+        (el último punto es el impacto) y el impacto en sí (posición y tiempo).
+        """
+        points = trajectory_points(start_pos, force_applied, self._table)
+        if not self.walls:
+            return points, None
+        t_max = int(self.dots_number) * self.dot_spacing
+        hit = ballistic_sweep(float(start_pos[0]), float(start_pos[1]),
+                              float(force_applied[0]), float(force_applied[1]),
+                              GRAVITY_FORCE, t_max, self.walls, self.probe_half_size,
+                              steps=max(1, int(self.dots_number) // 4))
+        if hit is None:
+            return points, None
+        visible = min(int(self.dots_number), int(hit.time / self.dot_spacing))
+        return points[:2 * visible] + list(hit.point), hit
 
     def update_dots(self, start_pos, force_applied):
         """
-        Calcula y actualiza la posición de todos los puntos
-        basado en la fórmula de tiro parabólico.
+        Registra la posición inicial y la velocidad del tiro; los puntos
+        (tiro parabólico) se recalculan en el próximo frame.
         """
-        
-        # Este 'timeStamp' es el 't' en la fórmula
-        time_stamp = self.dot_spacing 
-        
-        # Iteramos sobre cada punto y calculamos su posición futura
-        for dot in self.dots_list:
-            
-            # --- FÓRMULA DE TIRO PARABÓLICO (de Unity) ---
-            # p = p0 + v0*t + 0.5*g*t^2
-            
-            # Posición X = pos_inicial_x + velocidad_x * tiempo
-            pos_x = start_pos[0] + force_applied[0] * time_stamp
-            
-            # Posición Y = pos_inicial_y + velocidad_y * tiempo + 0.5 * gravedad * tiempo^2
-            pos_y = start_pos[1] + force_applied[1] * time_stamp + \
-                    (0.5 * GRAVITY_FORCE * (time_stamp ** 2))
-            
-            # Actualizamos la posición del punto en el canvas
-            dot.pos = (pos_x - self.dot_size[0] / 2, pos_y - self.dot_size[1] / 2)
-            
-            # Incrementamos el tiempo para el siguiente punto
-            time_stamp += self.dot_spacing
+        self._pending = (tuple(start_pos), tuple(force_applied))
+        self._flush_trigger()
+
+    def _flush(self, *args):
+        if self._pending is None:
+            return
+        start_pos, force_applied = self._pending
+        self._pending = None
+        self._last = (start_pos, force_applied)
+        self.dots.points, self.impact = self.predict(start_pos, force_applied)
 
     def show(self):
         """Muestra la trayectoria."""
         self.canvas.opacity = 1.0
-        
+
     def hide(self):
         """Oculta la trayectoria."""
-        self.canvas.opacity = 0.0
\ No newline at end of file
+        self.canvas.opacity = 0.0
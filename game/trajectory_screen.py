@@ -1,12 +1,11 @@
 # game/trajectory_screen.py
 
 from typing import List, Optional, Tuple
-from math import hypot, sqrt
+from math import hypot
 
 from kivy.uix.widget import Widget
 from kivy.core.window import Window
 from kivy.graphics import Rectangle , Color, RoundedRectangle
-from kivy.clock import Clock
 from kivy.uix.label import Label            # <-- NUEVO
 from kivy.uix.button import Button 
 # Tus clases
@@ -14,10 +13,25 @@ from game.slingshot_player import SlingshotPlayer
 from game.trajectory import Trajectory
 from game.physics_projectile import PhysicsProjectile
 from game.level1 import Level1Spec
+from game.spatial import WallGrid
+from game.broadphase import SweepAndPrune, circles_overlap, circle_bounds
 from game.enemy_patrol import PatrolEnemy
-
+from game.entities import EntityStore
+from game.pool import ObjectPool
+from game.lifecycle import Lifecycle
+from game.profiler import profiler, attach_overlay
+from game.log import get_logger
+from game.hud import HudLine
+from game.assets import assets, asset_source
+from game.sprite_batch import SpriteBatch, RENDER_MODE_WIDGETS, RENDER_MODE_BATCH, fit_size
+from game.frame import (FrameDispatcher, PHASE_AI, PHASE_PHYSICS, PHASE_COLLISION,
+                        PHASE_RENDER_SYNC)
+
+# Borde rojo sobre el área del HUD (los mensajes del HUD van a log.debug)
 DEBUG_HUD = True
 
+log = get_logger("level2")
+
 DIFFICULTY_PRESETS = {
     "easy":   {"attempts": 12, "time_limit": 90, "enemy_speed_scale": 0.9},
     "normal": {"attempts": 10, "time_limit": 75, "enemy_speed_scale": 1.0},
@@ -36,10 +50,17 @@ class TrajectoryGameScreen(Widget):
     destruir enemigos que patrullan usando los waypoints del nivel.
     """
 
-    def __init__(self, difficulty: str = "normal", **kwargs):
+    def __init__(self, difficulty: str = "normal", render_mode: str = RENDER_MODE_WIDGETS,
+                 **kwargs):
         super().__init__(**kwargs)
         self.difficulty = difficulty if difficulty in DIFFICULTY_PRESETS else "normal"
         self.config = DIFFICULTY_PRESETS[self.difficulty]
+        # Dibujo de enemigos/proyectiles: un widget por entidad o un Mesh por atlas
+        self.render_mode = render_mode
+        # Bucle central del nivel (las entidades registran aquí sus sistemas)
+        self.dispatcher = FrameDispatcher(fps=60)
+        # Binds y eventos de la pantalla: se sueltan juntos en on_leave
+        self.lifecycle = Lifecycle()
         # -------------------------------------------------
         # 1) Fondo
         # -------------------------------------------------
@@ -50,16 +71,19 @@ class TrajectoryGameScreen(Widget):
         with self.canvas.before:
             self.bg_color = Color(1, 1, 1, 1) # Para poder cambiar opacidad
             self.bg = Rectangle(
-                source="images/fondo2.png",
                 size=(Window.width, Window.height),
                 pos=(0, 0),
             )
+        # Textura del fondo desde el gestor de assets (decodificada en segundo plano)
+        assets.bind_texture(self.bg, "fondo2", size=Window.size)
 
         # -------------------------------------------------
         # 2) Cargar nivel (paredes + waypoints)
         # -------------------------------------------------
         self.level_spec: Level1Spec = Level1Spec()
         self.wall_widgets, self.wall_rects, self.waypoints = self.level_spec.realize(self)
+        # Índice espacial estático de paredes (se construye una sola vez)
+        self.wall_index = WallGrid(self.wall_rects)
 
         # -------------------------------------------------
         # 3) Jugador tipo resortera
@@ -72,8 +96,15 @@ class TrajectoryGameScreen(Widget):
         # 4) Trayectoria (los puntitos)
         # -------------------------------------------------
         self.trajectory = Trajectory()
+        # La vista previa se corta en la primera pared (proyectil de 38x38)
+        self.trajectory.set_walls(self.wall_index, half_size=(19.0, 19.0))
         self.add_widget(self.trajectory)
 
+        # Capa de sprites en lote (solo en modo batch)
+        self.sprite_layer = Widget()
+        self.add_widget(self.sprite_layer)
+        self.sprite_batch = SpriteBatch(self.sprite_layer.canvas)
+
         # -------------------------------------------------
         # 5) Estado de arrastre y lanzamiento
         # -------------------------------------------------
@@ -87,7 +118,11 @@ class TrajectoryGameScreen(Widget):
         # 6) Listas activas
         # -------------------------------------------------
         self.projectiles: List[PhysicsProjectile] = []
-        self.enemies: List[PatrolEnemy] = []
+        # Enemigos: estado en arrays (EntityStore), los widgets son vistas
+        self.enemies = EntityStore()
+        self.broadphase = SweepAndPrune()
+        # Enemigos golpeados que aún muestran la animación de muerte
+        self.dying_enemies: List[PatrolEnemy] = []
 
         # -------------------------------------------------
         # 6.1) Intentos/tiempo HUD
@@ -96,6 +131,16 @@ class TrajectoryGameScreen(Widget):
         self.time_left: float = float(self.config["time_limit"])
         self.finished: bool = False
 
+        # Pools: a lo sumo un proyectil por intento y 8 patrullas por nivel
+        self.projectile_pool = ObjectPool(
+            lambda: PhysicsProjectile(source=asset_source("huevo"),
+                                      size_hint=(None, None), size=(38, 38)),
+            high_water=self.attempts_left,
+        )
+        self.enemy_pool = ObjectPool(PatrolEnemy, high_water=8)
+        self.projectile_pool.prewarm(self.attempts_left)
+        self.enemy_pool.prewarm(8)
+
         # Panel de fondo del HUD
         self.hud_panel = Widget()
         self.add_widget(self.hud_panel)
@@ -109,36 +154,52 @@ class TrajectoryGameScreen(Widget):
                 Color(1, 0, 0, 0.35)
                 self._hud_dbg = Rectangle(pos=(0, 0), size=(1, 1))
 
-        self.hud = Label(
-            text=self._hud_text(),
-            font_size="22sp",
-            color=(1, 1, 1, 1),
-            size_hint=(None, None),
-            halign="center",
-            valign="middle",
-            markup=True,
-        )
+        # Texto fijo renderizado una vez; los números solo se redibujan si cambian
+        self.hud = HudLine(font_size="22sp", size_hint=(None, None), halign="center")
+        self.hud.add_text("Intentos: ", bold=True)
+        self.hud.add_number("attempts", self.attempts_left)
+        self.hud.add_text("  ")
+        self.hud.add_text("Tiempo: ", bold=True)
+        self.hud.add_number("time", self._seconds_left())
+        self.hud.add_text("s")
         self.add_widget(self.hud)
         
         self._layout_hud()
         self.bind(size=lambda *_: self._layout_hud())
-        Window.bind(size=lambda *_: self._layout_hud())
-        Clock.schedule_once(lambda dt: self._layout_hud(), 0)
-        if DEBUG_HUD:
-            print("[HUD] creado")
+        self.lifecycle.bind(Window, size=self._on_window_size)
+        self.lifecycle.schedule_once(lambda dt: self._layout_hud(), 0)
+        log.debug("[HUD] creado")
         # -------------------------------------------------
         # 7) Crear enemigos que patrullan los waypoints
         # -------------------------------------------------
         self.spawn_patrol_enemies(speed_scale=float(self.config["enemy_speed_scale"]))
 
         # -------------------------------------------------
-        # 8) Bucle de juego
+        # 8) Bucle de juego (sistemas por fase)
         # -------------------------------------------------
-        Clock.schedule_interval(self.update, 1 / 60)
-        Window.bind(size=lambda *_: self._on_window_resize())
+        self.dispatcher.add(PHASE_AI, self._tick_time)
+        self.dispatcher.add(PHASE_PHYSICS, self.update_projectiles)
+        self.dispatcher.add(PHASE_COLLISION, self.resolve_collisions)
+        self.dispatcher.add(PHASE_RENDER_SYNC, self._sync_hud)
+        self.dispatcher.start()
         self._raise_hud_to_top()
+
+    def on_enter(self):
+        # Tiempos por fase en pantalla (solo con PROFILE_FRAMES)
+        attach_overlay(self, self.lifecycle)
+
+    def on_leave(self):
+        """Al salir de la pantalla: detener el bucle y soltar la ventana"""
+        self.dispatcher.stop()
+        self.dispatcher.clear()
+        self.lifecycle.release()
+        profiler.dump_session("level2")
     
     # HUD helpers -------------------------------------------------------------
+    def _on_window_size(self, *args):
+        self._layout_hud()
+        self._on_window_resize()
+
     def _on_window_resize(self):
         # Ajustar fondo y HUD cuando cambie la ventana
         if hasattr(self, "bg"):
@@ -161,7 +222,6 @@ class TrajectoryGameScreen(Widget):
 
         # texto
         self.hud.size = (panel_w, panel_h)
-        self.hud.text_size = (panel_w, panel_h)
         self.hud.pos = (px, py)
 
         if DEBUG_HUD and hasattr(self, "_hud_dbg"):
@@ -176,12 +236,11 @@ class TrajectoryGameScreen(Widget):
             self.remove_widget(self.hud)
         self.add_widget(self.hud_panel)
         self.add_widget(self.hud)
-    if DEBUG_HUD:
-            print("[HUD] raised to top")
-    # NUEVO: texto HUD
-    def _hud_text(self) -> str:
-        t = int(max(0, self.time_left))
-        return f"[b]Intentos:[/b] {self.attempts_left} [b]Tiempo:[/b] {t}s"
+        log.debug("[HUD] raised to top", every=1.0)
+
+    # Segundos enteros que muestra el HUD
+    def _seconds_left(self) -> int:
+        return int(max(0, self.time_left))
     
     # =====================================================
     # CREACIÓN DE ENEMIGOS MEJORADA
@@ -204,17 +263,17 @@ class TrajectoryGameScreen(Widget):
         # Usa los primeros 2 waypoints
         if num_waypoints >= 2:
             path1 = [self.waypoints[0], self.waypoints[1]]
-            enemy1 = PatrolEnemy(path1, speed=3.0 * speed_scale)
-            self.enemies.append(enemy1)
-            self.add_widget(enemy1)
+            enemy1 = self.enemy_pool.acquire(waypoints=path1, speed=3.0 * speed_scale,
+                                             store=self.enemies, dispatcher=self.dispatcher)
+            self.show_entity(enemy1)
 
         # PATRULLA 2: Recorrido vertical lento (más predecible)
         # Usa waypoints intermedios
         if num_waypoints >= 3:
             path2 = [self.waypoints[1], self.waypoints[2]]
-            enemy2 = PatrolEnemy(path2, speed=1.8 * speed_scale)
-            self.enemies.append(enemy2)
-            self.add_widget(enemy2)
+            enemy2 = self.enemy_pool.acquire(waypoints=path2, speed=1.8 * speed_scale,
+                                             store=self.enemies, dispatcher=self.dispatcher)
+            self.show_entity(enemy2)
 
         # PATRULLA 3: Triángulo (patrulla táctica)
         # Crea un patrón triangular si hay suficientes waypoints
@@ -224,9 +283,9 @@ class TrajectoryGameScreen(Widget):
                 self.waypoints[2],
                 self.waypoints[3],
             ]
-            enemy3 = PatrolEnemy(path3, speed=2.5 * speed_scale)
-            self.enemies.append(enemy3)
-            self.add_widget(enemy3)
+            enemy3 = self.enemy_pool.acquire(waypoints=path3, speed=2.5 * speed_scale,
+                                             store=self.enemies, dispatcher=self.dispatcher)
+            self.show_entity(enemy3)
 
         # PATRULLA 4: Recorrido completo (difícil de predecir)
         # Usa todos los waypoints disponibles
@@ -238,9 +297,9 @@ class TrajectoryGameScreen(Widget):
                 self.waypoints[3],
                 self.waypoints[1],
             ]
-            enemy4 = PatrolEnemy(path4, speed=2.2 * speed_scale)
-            self.enemies.append(enemy4)
-            self.add_widget(enemy4)
+            enemy4 = self.enemy_pool.acquire(waypoints=path4, speed=2.2 * speed_scale,
+                                             store=self.enemies, dispatcher=self.dispatcher)
+            self.show_entity(enemy4)
 
         # PATRULLA 5: Guardia de área (cuadrado/rectángulo)
         # Patrulla cubriendo un área específica
@@ -251,26 +310,26 @@ class TrajectoryGameScreen(Widget):
                 self.waypoints[4],
                 self.waypoints[2],
             ]
-            enemy5 = PatrolEnemy(path5, speed=2.0 * speed_scale)
-            self.enemies.append(enemy5)
-            self.add_widget(enemy5)
+            enemy5 = self.enemy_pool.acquire(waypoints=path5, speed=2.0 * speed_scale,
+                                             store=self.enemies, dispatcher=self.dispatcher)
+            self.show_entity(enemy5)
 
         # PATRULLA 6: Centinela rápido (patrulla corta y ágil)
         # Enemigo difícil de golpear
         if num_waypoints >= 4:
             path6 = [self.waypoints[2], self.waypoints[3]]
-            enemy6 = PatrolEnemy(path6, speed=3.5 * speed_scale)
-            self.enemies.append(enemy6)
-            self.add_widget(enemy6)
+            enemy6 = self.enemy_pool.acquire(waypoints=path6, speed=3.5 * speed_scale,
+                                             store=self.enemies, dispatcher=self.dispatcher)
+            self.show_entity(enemy6)
 
         # PATRULLA 7: Ronda larga (supervisor)
         # Enemigo que recorre todo el perímetro
         if num_waypoints >= 5:
             # Crear una ruta que conecte los waypoints exteriores
             path7 = self.waypoints[:] if num_waypoints <= 6 else self.waypoints[:6]
-            enemy7 = PatrolEnemy(path7, speed=1.5 * speed_scale)
-            self.enemies.append(enemy7)
-            self.add_widget(enemy7)
+            enemy7 = self.enemy_pool.acquire(waypoints=path7, speed=1.5 * speed_scale,
+                                             store=self.enemies, dispatcher=self.dispatcher)
+            self.show_entity(enemy7)
 
         # PATRULLA 8: Zigzag (patrón impredecible)
         # Alterna entre waypoints para crear movimiento errático
@@ -281,9 +340,9 @@ class TrajectoryGameScreen(Widget):
                 self.waypoints[1],
                 self.waypoints[3],
             ]
-            enemy8 = PatrolEnemy(path8, speed=2.8 * speed_scale)
-            self.enemies.append(enemy8)
-            self.add_widget(enemy8)
+            enemy8 = self.enemy_pool.acquire(waypoints=path8, speed=2.8 * speed_scale,
+                                             store=self.enemies, dispatcher=self.dispatcher)
+            self.show_entity(enemy8)
 
     # =====================================================
     # EVENTOS DE TOUCH
@@ -336,7 +395,7 @@ class TrajectoryGameScreen(Widget):
         if self.attempts_left > 0 and not self.finished:
             self.spawn_projectile(self.current_force)
             self.attempts_left -= 1
-            self.hud.text = self._hud_text()
+            self.hud.set("attempts", self.attempts_left)
         self.current_force = (0.0, 0.0)
         self.drag_start = None
         return True
@@ -345,25 +404,21 @@ class TrajectoryGameScreen(Widget):
     # LÓGICA DE DISPARO
     # =====================================================
     def spawn_projectile(self, velocity: Tuple[float, float]):
-        proj = PhysicsProjectile(source="images/huevo.png")
-        proj.size_hint = (None, None)
-        proj.size = (38, 38)
-        proj.center = self.player.center
-        proj.gravity = -150.0
-        proj.velocity_x = float(velocity[0])
-        proj.velocity_y = float(velocity[1])
-        self.add_widget(proj)
+        proj = self.projectile_pool.acquire(
+            center=self.player.center, velocity=velocity, gravity=-150.0)
+        self.show_entity(proj)
         self.projectiles.append(proj)
-        proj.life = 0.0
         self._raise_hud_to_top()
-        if DEBUG_HUD:
-            print(f"[HUD] projectile spawned; attempts_left={self.attempts_left}")
+        log.debug("[HUD] projectile spawned", attempts_left=self.attempts_left)
 
     # =====================================================
     # UPDATE GENERAL
     # =====================================================
     def update(self, dt: float):
+        """Avanza un frame completo del nivel (todas las fases)."""
+        self.dispatcher.tick(dt)
 
+    def _tick_time(self, dt: float):
         if self.finished:
             return
 
@@ -372,47 +427,79 @@ class TrajectoryGameScreen(Widget):
         if self.time_left < 0:
             self.time_left = 0
 
-        self.hud.text = self._hud_text()
+    def _sync_hud(self, dt: float):
+        if self.render_mode == RENDER_MODE_BATCH:
+            self.draw_batch()
+        # Sin costo si no cambió el segundo ni los intentos
+        self.hud.set("attempts", self.attempts_left)
+        self.hud.set("time", self._seconds_left())
+
+    def show_entity(self, view: Widget):
+        """Agrega la vista al árbol de widgets (en modo batch la dibuja el SpriteBatch)."""
+        if self.render_mode != RENDER_MODE_BATCH:
+            self.add_widget(view)
+
+    def draw_batch(self):
+        """Vuelca enemigos (arrays del store) y proyectiles al SpriteBatch."""
+        batch = self.sprite_batch
+        batch.begin()
+        xs, ys = self.enemies.x, self.enemies.y
+        for slot, enemy in enumerate(self.enemies.views):
+            sprite = enemy.sprite
+            if sprite.texture is not None:
+                w, h = fit_size(sprite.texture, sprite.width, sprite.height)
+                batch.draw(sprite.texture, xs[slot], ys[slot], w, h)
+        for proj in self.projectiles:
+            if proj.texture is not None:
+                w, h = fit_size(proj.texture, proj.width, proj.height)
+                cx, cy = proj.center
+                batch.draw(proj.texture, cx, cy, w, h)
+        batch.end()
+
+    def update_projectiles(self, dt: float):
+        if self.finished:
+            return
 
         # Actualizar proyectiles
         for proj in self.projectiles[:]:
-            proj.update_with_walls(dt, self.wall_rects, on_impact=self.on_projectile_impact)
+            proj.update_with_walls(dt, self.wall_index, on_impact=self.on_projectile_impact)
             self._cull_projectile(proj, dt)
             if not proj.alive:
-                if proj.parent:
-                    self.remove_widget(proj)
                 self.projectiles.remove(proj)
-                continue
+                self.projectile_pool.release(proj)
 
-            # Colisiones con enemigos
-            for enemy in self.enemies[:]:
-                if getattr(enemy, "is_dead", False):
-                    continue
-                if self.check_collision(proj, enemy):
-                    # eliminar enemigo y proyectil
-                    if hasattr(enemy, "destroy"):
-                        enemy.destroy()
-                    else:
-                        self.remove_widget(enemy)
-                    if enemy in self.enemies:
-                        self.enemies.remove(enemy)
-
-                    proj.alive = False
-                    if proj.parent:
-                        self.remove_widget(proj)
-                    if proj in self.projectiles:
-                        self.projectiles.remove(proj)
-                    break
-
-        # limpiar enemigos muertos (tras animación)
-        for enemy in self.enemies[:]:
-            if getattr(enemy, "is_dead", False):
-                try:
-                    if enemy.sprite.opacity <= 0.02:
-                        self.remove_widget(enemy)
-                        self.enemies.remove(enemy)
-                except Exception:
-                    pass
+    def resolve_collisions(self, dt: float):
+        if self.finished:
+            return
+
+        # Colisiones con enemigos: broadphase (sweep-and-prune) + círculos
+        live_enemies = [e for e in self.enemies if not e.is_dead]
+        hits = []
+        for proj, enemy in self.broadphase.candidate_pairs(
+                self.projectiles, live_enemies, self._collision_bounds):
+            if not proj.alive or enemy.is_dead:
+                continue
+            if self.check_collision(proj, enemy):
+                # eliminar enemigo y proyectil
+                enemy.destroy()
+                proj.alive = False
+                hits.append((proj, enemy))
+
+        for proj, enemy in hits:
+            enemy.unregister_systems()
+            self.enemies.remove(enemy)
+            self.dying_enemies.append(enemy)
+            # La animación de muerte (opacidad/tamaño) la dibuja el widget
+            if enemy.parent is None:
+                self.add_widget(enemy)
+            self.projectiles.remove(proj)
+            self.projectile_pool.release(proj)
+
+        # devolver al pool los enemigos muertos (tras animación)
+        for enemy in self.dying_enemies[:]:
+            if enemy.sprite.opacity <= 0.02:
+                self.dying_enemies.remove(enemy)
+                self.enemy_pool.release(enemy)
         # Condiciones de fin:
         all_enemies_down = (len(self.enemies) == 0)
         no_more_attempts = (self.attempts_left <= 0)
@@ -433,8 +520,6 @@ class TrajectoryGameScreen(Widget):
     # --- NUEVO: helper para “matar” proyectiles atascados ---
     def _cull_projectile(self, proj: PhysicsProjectile, dt: float):
         # TTL: elimina el proyectil después de 6s (o 3s si ya no quedan intentos)
-        if not hasattr(proj, "life"):
-            proj.life = 0.0
         proj.life += dt
         ttl = 6.0 if self.attempts_left > 0 else 3.0
         # Fuera de pantalla
@@ -447,16 +532,20 @@ class TrajectoryGameScreen(Widget):
     # =====================================================
     # COLISIÓN ENTRE PROYECTIL Y ENEMIGO
     # =====================================================
+    def _collision_radius(self, obj: Widget) -> float:
+        if isinstance(obj, PhysicsProjectile):
+            return obj.width / 2
+        return obj.sprite.width / 2 * 0.8
+
+    def _collision_bounds(self, obj: Widget):
+        cx, cy = obj.center
+        return circle_bounds(cx, cy, self._collision_radius(obj))
+
     def check_collision(self, proj: PhysicsProjectile, enemy: Widget) -> bool:
-        try:
-            px, py = proj.center
-            ex, ey = enemy.center
-            pr = proj.width / 2
-            er = getattr(enemy.sprite, "width", 80) / 2 * 0.8
-            dist = sqrt((px - ex) ** 2 + (py - ey) ** 2)
-            return dist < (pr + er)
-        except Exception:
-            return False
+        px, py = proj.center
+        ex, ey = enemy.center
+        return circles_overlap(px, py, self._collision_radius(proj),
+                               ex, ey, self._collision_radius(enemy))
 
     def on_projectile_impact(self, x: float, y: float):
         # futuro: explosión o efecto visual
@@ -479,10 +568,7 @@ class TrajectoryGameScreen(Widget):
         self.finished = True
 
         # Detener lógica inmediatamente
-        try:
-            Clock.unschedule(self.update)
-        except Exception:
-            pass
+        self.dispatcher.stop()
 
         self._raise_hud_to_top()
 
@@ -1,4 +1,5 @@
 import math
+from game.spatial import NeighborGrid
 
 def distance(x1, y1, x2, y2):
     return math.sqrt((x1 - x2)**2 + (y1 - y2)**2)
@@ -17,13 +18,23 @@ def limit_vector(vx, vy, max_length):
         return (vx / length) * max_length, (vy / length) * max_length
     return vx, vy
 
+def neighbor_candidates(enemy, enemies, radius):
+    """
+    Posibles vecinos de 'enemy' dentro de 'radius'.
+    'enemies' puede ser una lista o un NeighborGrid; con el índice solo se
+    revisan las celdas cercanas (el filtro exacto por distancia lo hace cada regla).
+    """
+    if isinstance(enemies, NeighborGrid):
+        return enemies.query(enemy.center_x, enemy.center_y, radius)
+    return enemies
+
 def calculate_separation(enemy, enemies, separation_radius=100):
     """Regla 1: Separación - Evita chocar con vecinos cercanos"""
     steer_x = 0
     steer_y = 0
     count = 0
     
-    for other in enemies:
+    for other in neighbor_candidates(enemy, enemies, separation_radius):
         if other != enemy and other.use_flocking:
             dist = distance(enemy.center_x, enemy.center_y, other.center_x, other.center_y)
             if 0 < dist < separation_radius:
@@ -49,7 +60,7 @@ def calculate_alignment(enemy, enemies, alignment_radius=150):
     avg_vy = 0
     count = 0
     
-    for other in enemies:
+    for other in neighbor_candidates(enemy, enemies, alignment_radius):
         if other != enemy and other.use_flocking:
             dist = distance(enemy.center_x, enemy.center_y, other.center_x, other.center_y)
             if 0 < dist < alignment_radius:
@@ -73,7 +84,7 @@ def calculate_cohesion(enemy, enemies, cohesion_radius=200):
     center_y = 0
     count = 0
     
-    for other in enemies:
+    for other in neighbor_candidates(enemy, enemies, cohesion_radius):
         if other != enemy and other.use_flocking:
             dist = distance(enemy.center_x, enemy.center_y, other.center_x, other.center_y)
             if 0 < dist < cohesion_radius:
@@ -92,23 +103,154 @@ def calculate_cohesion(enemy, enemies, cohesion_radius=200):
     
     return 0, 0
 
+def flocking_forces(enemy, enemies, separation_radius=100, alignment_radius=150, cohesion_radius=200):
+    """
+    Calcula las tres reglas en un solo recorrido de vecinos.
+    Usa distancias al cuadrado y descarta primero por el radio mayor.
+    'enemies' puede ser una lista o un NeighborGrid.
+    Devuelve ((sep_x, sep_y), (align_x, align_y), (coh_x, coh_y)).
+    """
+    ex, ey = enemy.center_x, enemy.center_y
+    sep_r2 = separation_radius * separation_radius
+    ali_r2 = alignment_radius * alignment_radius
+    coh_r2 = cohesion_radius * cohesion_radius
+    max_radius = max(separation_radius, alignment_radius, cohesion_radius)
+    cutoff = max_radius * max_radius
+
+    sep_x = sep_y = 0.0
+    sep_n = 0
+    avg_vx = avg_vy = 0.0
+    ali_n = 0
+    cen_x = cen_y = 0.0
+    coh_n = 0
+
+    for other in neighbor_candidates(enemy, enemies, max_radius):
+        if other is enemy or not other.use_flocking:
+            continue
+        ox, oy = other.center_x, other.center_y
+        diff_x = ex - ox
+        diff_y = ey - oy
+        d2 = diff_x * diff_x + diff_y * diff_y
+        if d2 <= 0 or d2 >= cutoff:
+            continue
+        if d2 < sep_r2:
+            # Peso inversamente proporcional al cuadrado de la distancia
+            sep_x += diff_x / d2
+            sep_y += diff_y / d2
+            sep_n += 1
+        if d2 < ali_r2:
+            avg_vx += other.velocity_x
+            avg_vy += other.velocity_y
+            ali_n += 1
+        if d2 < coh_r2:
+            cen_x += ox
+            cen_y += oy
+            coh_n += 1
+
+    separation = (sep_x / sep_n, sep_y / sep_n) if sep_n else (0, 0)
+
+    if ali_n:
+        alignment = (avg_vx / ali_n - enemy.velocity_x, avg_vy / ali_n - enemy.velocity_y)
+    else:
+        alignment = (0, 0)
+
+    if coh_n:
+        cohesion = normalize_vector(cen_x / coh_n - ex, cen_y / coh_n - ey)
+    else:
+        cohesion = (0, 0)
+
+    return separation, alignment, cohesion
+
 def apply_flocking(enemy, enemies, separation_weight=3.0, alignment_weight=1.2, cohesion_weight=0.8):
     """Aplica las tres reglas de flocking con pesos personalizables"""
-    # Calcular las tres fuerzas
-    sep_x, sep_y = calculate_separation(enemy, enemies)
-    align_x, align_y = calculate_alignment(enemy, enemies)
-    coh_x, coh_y = calculate_cohesion(enemy, enemies)
+    # Calcular las tres fuerzas (un solo recorrido de vecinos)
+    (sep_x, sep_y), (align_x, align_y), (coh_x, coh_y) = flocking_forces(enemy, enemies)
     
-    # Aplicar pesos
-    sep_x *= separation_weight
-    sep_y *= separation_weight
-    align_x *= alignment_weight
-    align_y *= alignment_weight
-    coh_x *= cohesion_weight
-    coh_y *= cohesion_weight
-    
-    # Sumar todas las fuerzas
-    total_x = sep_x + align_x + coh_x
-    total_y = sep_y + align_y + coh_y
+    # Aplicar pesos y sumar todas las fuerzas
+    total_x = sep_x * separation_weight + align_x * alignment_weight + coh_x * cohesion_weight
+    total_y = sep_y * separation_weight + align_y * alignment_weight + coh_y * cohesion_weight
     
     return total_x, total_y
+
+# =========================================================
+# VERSIÓN VECTORIZADA (NumPy) PARA BANDADAS GRANDES
+# Trabaja con arrays de toda la bandada: posiciones (N,2) y
+# velocidades (N,2). NumPy se importa solo al usarla.
+# =========================================================
+
+def _np():
+    import numpy
+    return numpy
+
+def numpy_available():
+    """True si NumPy se puede importar (no forma parte del build Android)"""
+    try:
+        _np()
+    except ImportError:
+        return False
+    return True
+
+def limit_vectors(vectors, max_length):
+    """Versión vectorizada de limit_vector para un array (N,2)"""
+    np = _np()
+    v = np.asarray(vectors, dtype=float).reshape(-1, 2)
+    length = np.hypot(v[:, 0], v[:, 1])
+    scale = np.ones_like(length)
+    over = length > max_length
+    scale[over] = max_length / length[over]
+    return v * scale[:, None]
+
+def apply_flocking_batch(positions, velocities, separation_weight=3.0, alignment_weight=1.2,
+                         cohesion_weight=0.8, separation_radius=100, alignment_radius=150,
+                         cohesion_radius=200):
+    """
+    Fuerzas de flocking de toda la bandada en una sola llamada.
+    Equivale a llamar apply_flocking para cada boid (todos con use_flocking).
+    Devuelve un array (N,2).
+    """
+    np = _np()
+    pos = np.asarray(positions, dtype=float).reshape(-1, 2)
+    vel = np.asarray(velocities, dtype=float).reshape(-1, 2)
+    if len(pos) == 0:
+        return np.zeros((0, 2))
+
+    # diff[i, j] = pos[i] - pos[j]
+    diff = pos[:, None, :] - pos[None, :, :]
+    d2 = np.einsum('ijk,ijk->ij', diff, diff)
+    valid = d2 > 0
+
+    # Regla 1: Separación
+    sep_mask = valid & (d2 < separation_radius * separation_radius)
+    inv_d2 = np.divide(1.0, d2, out=np.zeros_like(d2), where=sep_mask)
+    sep = np.einsum('ijk,ij->ik', diff, inv_d2)
+    sep_n = sep_mask.sum(axis=1)
+    sep /= np.maximum(sep_n, 1)[:, None]
+
+    # Regla 2: Alineación
+    ali_mask = valid & (d2 < alignment_radius * alignment_radius)
+    ali_n = ali_mask.sum(axis=1)
+    ali = ali_mask @ vel / np.maximum(ali_n, 1)[:, None] - vel
+    ali[ali_n == 0] = 0.0
+
+    # Regla 3: Cohesión (vector normalizado hacia el centro de masa)
+    coh_mask = valid & (d2 < cohesion_radius * cohesion_radius)
+    coh_n = coh_mask.sum(axis=1)
+    coh = coh_mask @ pos / np.maximum(coh_n, 1)[:, None] - pos
+    coh[coh_n == 0] = 0.0
+    length = np.hypot(coh[:, 0], coh[:, 1])
+    nz = length > 0
+    coh[nz] /= length[nz][:, None]
+
+    return sep * separation_weight + ali * alignment_weight + coh * cohesion_weight
+
+def flock_step_batch(positions, velocities, forces, max_force=0.3, max_speed=6):
+    """
+    Integra un frame de la bandada como Enemy.update: limita la fuerza
+    a max_force, la suma a la velocidad, limita la velocidad a max_speed
+    y avanza la posición. Devuelve (posiciones, velocidades) nuevas.
+    """
+    np = _np()
+    pos = np.asarray(positions, dtype=float).reshape(-1, 2)
+    vel = np.asarray(velocities, dtype=float).reshape(-1, 2)
+    vel = limit_vectors(vel + limit_vectors(forces, max_force), max_speed)
+    return pos + vel, vel
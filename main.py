@@ -8,12 +8,17 @@ from kivy.app import App
 from kivy.uix.widget import Widget
 from kivy.core.audio import SoundLoader
 from kivy.utils import platform  # <--- IMPORTANTE: Necesario para detectar Android
+from kivy.core.window import Window
 
-# Importaciones de tus pantallas y lógica de juego
-from game.screen import GameScreen
-from game.menu import MainMenu, LevelScreen, InstructionsScreen
-from game.trajectory_screen import TrajectoryGameScreen
-from game.level3_ar import ARGameScreen
+# Importaciones de tus pantallas y lógica de juego.
+# Las pantallas se importan al abrirlas (game/screens.py): el Nivel 3 carga
+# OpenCV y NumPy, que no hacen falta para dibujar el menú.
+from game.screens import ScreenHost, preload_screens, screen_class
+from game.assets import assets, pack
+from game.profiler import profiler
+from game.log import get_logger
+
+log = get_logger("app")
 
 class RootWidget(Widget):
     """Widget raíz que contiene todas las pantallas"""
@@ -23,9 +28,17 @@ class MyGameApp(App):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.root_widget = None
+        self.screens = None
         
-        # Carga de música (con manejo de errores por si no existe el archivo)
-        self.music = SoundLoader.load('images/musica.mp3')
+        # Un solo mmap para todos los assets si existe images/assets.pack
+        pack.open()
+
+        # Carga de música (con manejo de errores por si no existe el archivo).
+        # SoundLoader solo abre rutas: desde el paquete se extrae una vez.
+        music = 'images/musica.mp3'
+        if music in pack:
+            music = pack.extract(music, self.user_data_dir)
+        self.music = SoundLoader.load(music)
         if self.music:
             self.music.loop = True 
             self.music.volume = 0.5 
@@ -38,49 +51,58 @@ class MyGameApp(App):
             
             def callback(permission, results):
                 if all([res for res in results]):
-                    print("Permisos de cámara concedidos.")
+                    log.info("Permisos de cámara concedidos.")
                 else:
-                    print("Permisos de cámara denegados.")
+                    log.warning("Permisos de cámara denegados.")
             
             # Solicitamos permiso explícito al usuario al arrancar la app
             request_permissions([Permission.CAMERA], callback)
         # ------------------------------------------
 
         self.root_widget = RootWidget()
+        # Pantalla actual, caché de menús y hooks on_enter/on_leave
+        self.screens = ScreenHost(self.root_widget)
+        # Con PROFILE_FRAMES, cada nivel deja su reporte de tiempos al salir
+        if profiler.enabled:
+            profiler.dump_dir = self.user_data_dir
+
+        # Decodificar los fondos en segundo plano desde el arranque: al cambiar
+        # de pantalla ya están en la caché y no se bloquea el hilo principal
+        assets.preload(["fondo1", "fondo2"], size=Window.size)
+        assets.preload(["fondo1"], size=(Window.height * 2304 / 1024, Window.height))
         
         if self.music:
             self.music.play()
     
         self.show_main_menu()
+        # Niveles 1 y 2 se importan de a uno por frame, ya con el menú dibujado
+        preload_screens(["level1", "level2"])
         return self.root_widget
     
+    def on_stop(self):
+        # Suelta la pantalla actual (p. ej. la cámara del Nivel 3)
+        if self.screens:
+            self.screens.clear()
+
     def show_main_menu(self):
-        """Muestra el menú principal"""
-        self.root_widget.clear_widgets()
-        menu = MainMenu(app_instance=self)
-        self.root_widget.add_widget(menu)
+        """Muestra el menú principal (se construye una sola vez)"""
+        self.screens.show("menu", app_instance=self)
     
     def show_level_screen(self):
         """Muestra la pantalla de selección de niveles"""
-        self.root_widget.clear_widgets()
-        level_screen = LevelScreen(app_instance=self)
-        self.root_widget.add_widget(level_screen)
+        self.screens.show("levels", app_instance=self)
     
     def show_instructions_screen(self):
         """Muestra la pantalla de instrucciones"""
-        self.root_widget.clear_widgets()
-        instructions = InstructionsScreen(app_instance=self)
-        self.root_widget.add_widget(instructions)
+        self.screens.show("instructions", app_instance=self)
     
     def _set_screen(self, widget: Widget):
         """Helper para cambiar el widget actual en pantalla"""
-        self.root_widget.clear_widgets()
-        self.root_widget.add_widget(widget)
+        self.screens.switch_to(widget)
 
     # Nivel 1 (modo nave)
     def start_level1(self):
-        game = GameScreen()
-        self._set_screen(game)
+        self.screens.show("level1")
 
     def start_game(self):
         """Inicia el juego (Redirecciona a Nivel 1 por defecto)"""
@@ -88,8 +110,10 @@ class MyGameApp(App):
         
     # Nivel 2 (trayectoria) con selección de dificultad
     def start_level2(self, difficulty: str = "normal"):
-        if TrajectoryGameScreen is None:
-            print("Nivel 2 no disponible: trajectory_screen.py no importable.")
+        try:
+            TrajectoryGameScreen = screen_class("level2")
+        except ImportError as e:
+            log.error("Nivel 2 no disponible: trajectory_screen.py no importable (%s).", e)
             return
             
         # Intentar pasar dificultad al constructor
@@ -101,16 +125,16 @@ class MyGameApp(App):
             if hasattr(game, "set_difficulty"):
                 game.set_difficulty(difficulty)
                 
-        self._set_screen(game)
+        self.screens.switch_to(game, "level2")
         
     # Nivel 3 (Modo AR)
     def start_level3(self):
         """Inicia el Nivel 3 (Modo AR con Cámara)"""
         try:
-            game = ARGameScreen()
-            self._set_screen(game)
+            # Aquí se importan OpenCV y NumPy (solo la primera vez)
+            self.screens.show("level3")
         except Exception as e:
-            print(f"Error iniciando Nivel 3: {e}")
+            log.error("Error iniciando Nivel 3: %s", e)
             # Si falla la cámara, regresamos al Nivel 2 difícil como respaldo
             self.start_level2("hard")
 
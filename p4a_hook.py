@@ -0,0 +1,18 @@
+"""
+Hook de python-for-android (buildozer.spec: p4a.hook).
+
+buildozer.spec excluye las imágenes sueltas porque el APK solo lleva
+images/assets.pack. Si el paquete no se generó, el APK saldría sin
+imágenes: en ese caso se corta el build antes de armarlo.
+"""
+import os
+import sys
+
+DIRECTORIO_RAIZ = os.path.dirname(os.path.abspath(__file__))
+RUTA_PAQUETE = os.path.join(DIRECTORIO_RAIZ, 'images', 'assets.pack')
+
+
+def before_apk_build(toolchain):
+    if not os.path.isfile(RUTA_PAQUETE):
+        sys.exit("✖ Falta images/assets.pack: correr 'python build_assets.py' "
+                 "antes de 'buildozer android debug'.")